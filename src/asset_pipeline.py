@@ -0,0 +1,199 @@
+# DragonQuest/src/asset_pipeline.py
+"""Offline asset build.
+
+Renders the source art in assets/ at the exact sizes the game draws it,
+colour-keyed and with premultiplied alpha, into assets/built/ alongside a
+manifest of content hashes. Unchanged inputs are skipped, so re-running is
+cheap. ResourceManager loads the built files as-is instead of scaling at runtime.
+
+    python src/asset_pipeline.py [--force]
+
+Specs come from data/assets.json plus one sprite per enemy (enemies.json,
+sized by "scale" and with "tint" baked in) and per NPC (npcs.json).
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import numpy as np
+import pygame
+from settings import TILESIZE, SPRITE_SCALE_FACTOR, SPRITE_RENDER_SIZE
+
+BUILD_DIR = "built"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Named draw sizes used by the specs
+SIZE_CLASSES = {
+    "tile": TILESIZE,
+    "sprite": TILESIZE * SPRITE_SCALE_FACTOR,
+    "icon": SPRITE_RENDER_SIZE,
+    "pickup": int(TILESIZE * 0.8),
+}
+
+AUTO_KEY_TOLERANCE = 12
+
+GAME_FOLDER = os.path.dirname(os.path.abspath(__file__))
+ASSETS_FOLDER = os.path.join(GAME_FOLDER, "assets")
+DATA_FOLDER = os.path.join(GAME_FOLDER, "data")
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+def resolve_size(size, scale=1):
+    if isinstance(size, str):
+        size = SIZE_CLASSES[size]
+    if isinstance(size, (int, float)):
+        size = [size, size]
+    return [int(size[0] * scale), int(size[1] * scale)]
+
+def collect_specs(data_folder=DATA_FOLDER):
+    """asset id -> {"source", "size": [w, h], "colorkey", "tint"}"""
+    specs = {}
+    for asset_id, entry in _read_json(os.path.join(data_folder, "assets.json")).items():
+        specs[asset_id] = {
+            "source": entry["source"],
+            "size": resolve_size(entry["size"], entry.get("scale", 1)),
+            "colorkey": entry.get("colorkey"),
+            "tint": entry.get("tint"),
+        }
+    for enemy_type, data in _read_json(os.path.join(data_folder, "enemies.json")).items():
+        if data.get("image"):
+            specs["enemy/" + enemy_type] = {
+                "source": data["image"],
+                "size": resolve_size("sprite", data.get("scale", 1)),
+                "colorkey": "auto",
+                "tint": data.get("tint"),
+            }
+    for npc_id, data in _read_json(os.path.join(data_folder, "npcs.json")).items():
+        if data.get("image"):
+            specs["npc/" + npc_id] = {"source": data["image"], "size": resolve_size("sprite"), "colorkey": "auto", "tint": None}
+    return specs
+
+def output_name(asset_id):
+    return asset_id.replace("/", "_").replace(" ", "_") + ".png"
+
+def apply_colorkey(image, colorkey, tolerance):
+    """Clear alpha wherever every channel is within tolerance of colorkey"""
+    rgb = pygame.surfarray.pixels3d(image)
+    alpha = pygame.surfarray.pixels_alpha(image)
+    distance = np.abs(rgb.astype(np.int16) - np.array(colorkey[:3], dtype=np.int16)).max(axis=2)
+    alpha[distance <= tolerance] = 0
+    del rgb, alpha # Unlock the surface
+
+def downscale(image, size):
+    """Area-average resample. Nearest-scales to a whole multiple of size, then
+    averages the blocks (smoothscale drifts opaque alpha down to 253)."""
+    width, height = size
+    k = max(1, math.ceil(max(image.get_width() / width, image.get_height() / height)))
+    big = pygame.transform.scale(image, (width * k, height * k))
+    rgba = np.dstack((pygame.surfarray.array3d(big), pygame.surfarray.array_alpha(big))).astype(np.float32)
+    rgba = np.rint(rgba.reshape(width, k, height, k, 4).mean(axis=(1, 3))).astype(np.uint8)
+    out = pygame.Surface((width, height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(out)
+    pixels[...] = rgba[..., :3]
+    alpha = pygame.surfarray.pixels_alpha(out)
+    alpha[...] = rgba[..., 3]
+    del pixels, alpha # Unlock the surface
+    return out
+
+def render(spec, source):
+    """Source surface -> draw-ready surface: keyed, premultiplied, scaled, tinted"""
+    image = pygame.Surface(source.get_size(), pygame.SRCALPHA)
+    image.blit(source, (0, 0))
+    colorkey = spec.get("colorkey")
+    tolerance = spec.get("tolerance", 0)
+    if colorkey == "auto":
+        # Art without an alpha channel (JPEGs) is keyed on its corner colour,
+        # loosely enough to swallow compression noise
+        has_alpha = source.get_flags() & pygame.SRCALPHA or source.get_bitsize() == 32
+        colorkey = None if has_alpha else image.get_at((0, 0))[:3]
+        tolerance = spec.get("tolerance", AUTO_KEY_TOLERANCE)
+    if colorkey is not None:
+        apply_colorkey(image, colorkey, tolerance)
+    # Premultiply before filtering so keyed-out colour doesn't bleed into the edges
+    image = image.premul_alpha()
+    image = downscale(image, spec["size"])
+    if spec.get("tint"):
+        tint = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        tint.fill(tuple(spec["tint"][:3]) + (255,))
+        image.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return image
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def build_key(spec, source_hash):
+    """Changes whenever the source bytes, the spec or this pipeline's code changes"""
+    recipe = json.dumps(spec, sort_keys=True) + source_hash + file_hash(__file__)
+    return hashlib.sha1(recipe.encode()).hexdigest()
+
+def load_manifest(assets_folder=ASSETS_FOLDER):
+    manifest = _read_json(os.path.join(assets_folder, BUILD_DIR, MANIFEST_NAME))
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("assets", {})
+
+def build(specs, assets_folder=ASSETS_FOLDER, force=False, log=print):
+    """Build every spec whose inputs changed; returns (built, skipped, missing) id lists"""
+    out_folder = os.path.join(assets_folder, BUILD_DIR)
+    os.makedirs(out_folder, exist_ok=True)
+    previous = {} if force else load_manifest(assets_folder)
+    entries = {}
+    built, skipped, missing = [], [], []
+
+    for asset_id, spec in sorted(specs.items()):
+        source_path = os.path.join(assets_folder, spec["source"])
+        if not os.path.exists(source_path):
+            missing.append(asset_id)
+            continue
+        key = build_key(spec, file_hash(source_path))
+        file_name = output_name(asset_id)
+        out_path = os.path.join(out_folder, file_name)
+        old = previous.get(asset_id)
+        if old and old["key"] == key and os.path.exists(out_path):
+            entries[asset_id] = old
+            skipped.append(asset_id)
+            continue
+
+        image = render(spec, pygame.image.load(source_path))
+        pygame.image.save(image, out_path)
+        entries[asset_id] = {
+            "file": file_name,
+            "source": spec["source"],
+            "size": list(image.get_size()),
+            "premultiplied": True,
+            "key": key,
+            "hash": file_hash(out_path),
+        }
+        built.append(asset_id)
+        log(f"Built {asset_id} -> {file_name} {image.get_size()}")
+
+    # Drop outputs whose spec went away
+    kept_files = {entry["file"] for entry in entries.values()}
+    for entry in previous.values():
+        stale = os.path.join(out_folder, entry["file"])
+        if entry["file"] not in kept_files and os.path.exists(stale):
+            os.remove(stale)
+
+    with open(os.path.join(out_folder, MANIFEST_NAME), "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "assets": entries}, f, indent=2, sort_keys=True)
+    for asset_id in missing:
+        log(f"Missing source for {asset_id}: {specs[asset_id]['source']}")
+    return built, skipped, missing
+
+def main():
+    parser = argparse.ArgumentParser(description="Build draw-ready sprites into assets/built")
+    parser.add_argument("--force", action="store_true", help="rebuild everything")
+    args = parser.parse_args()
+    pygame.init()
+    built, skipped, missing = build(collect_specs(), force=args.force)
+    print(f"{len(built)} built, {len(skipped)} unchanged, {len(missing)} missing sources")
+
+if __name__ == "__main__":
+    main()
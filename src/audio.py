@@ -1,6 +1,11 @@
 import pygame
 import os
 import random
+import generate_sfx
+from settings import SFX_CHANNEL_GROUPS, MUSIC_CROSSFADE_MS
+
+# Posted by pygame when a music track ends or finishes fading out
+MUSIC_END_EVENT = pygame.USEREVENT + 1
 
 class MusicPlayer:
     def __init__(self, game):
@@ -28,20 +33,28 @@ class MusicPlayer:
         self.current_song = None
         self.current_state = "exploration" # exploration, battle
         self.volume = 0.5
+        self.fading = False # Fading out towards the next mode's track
         
         # pygame.mixer.music.set_volume(self.volume)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
         
     def set_mode(self, mode):
         if mode not in self.playlists:
             return
             
-        if self.current_state == mode and pygame.mixer.music.get_busy():
+        if self.current_state == mode and (self.fading or pygame.mixer.music.get_busy()):
             return # Already playing correct mood
             
         self.current_state = mode
         self.current_playlist = self.playlists[mode][:]
         random.shuffle(self.current_playlist)
-        self.play_next()
+        if pygame.mixer.music.get_busy():
+            # The end event starts the new mode's track once this one has faded
+            self.fading = True
+            pygame.mixer.music.fadeout(MUSIC_CROSSFADE_MS)
+        else:
+            self.play_next()
 
     def play_battle_music(self):
         self.set_mode("battle")
@@ -70,40 +83,126 @@ class MusicPlayer:
         
         try:
             pygame.mixer.music.load(full_path)
-            pygame.mixer.music.play()
+            pygame.mixer.music.play(fade_ms=MUSIC_CROSSFADE_MS)
             # print(f"Now playing ({self.current_state}): {next_song}")
         except pygame.error as e:
             print(f"Error playing {next_song}: {e}")
 
-    def update(self):
-        # Check if music is playing
-        if not pygame.mixer.music.get_busy():
+    def handle_event(self, event):
+        if event.type == MUSIC_END_EVENT:
+            self.fading = False
             self.play_next()
             
     def set_volume(self, volume):
         self.volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.volume)
 
+# name -> (variant count, pitch spread) for sounds that get repetitive
+SFX_VARIANTS = {
+    "attack": (4, 0.10),
+    "hit": (4, 0.12),
+    "step": (4, 0.15),
+    "text_blip": (3, 0.05),
+}
+
+# name -> (channel group, max simultaneous voices, priority)
+SFX_RULES = {
+    "attack": ("combat", 2, 2),
+    "hit": ("combat", 3, 2),
+    "magic": ("combat", 2, 3),
+    "drink": ("combat", 1, 3),
+    "menu": ("ui", 1, 1),
+    "text_blip": ("dialogue", 1, 0),
+    "step": ("world", 2, 0),
+    "door": ("world", 1, 2),
+    "locked": ("world", 1, 2),
+}
+DEFAULT_SFX_RULE = ("world", 1, 1)
+
+class ChannelGroup:
+    """A block of reserved mixer channels shared by one sound category"""
+    def __init__(self, channels):
+        self.channels = channels
+        self.voices = [None] * len(channels) # (name, priority, order) of what each channel last played
+
+    def pick(self, name, cap, priority):
+        """Channel index to play on, or None when every voice outranks this sound"""
+        playing = [index for index, channel in enumerate(self.channels)
+                   if channel.get_busy() and self.voices[index] is not None]
+        same = [index for index in playing if self.voices[index][0] == name]
+        if len(same) >= cap:
+            return min(same, key=lambda index: self.voices[index][2]) # Restart the oldest copy
+        if len(playing) < len(self.channels):
+            return next(index for index in range(len(self.channels)) if index not in playing)
+        # Full: steal the lowest priority voice, oldest first
+        index = min(playing, key=lambda index: self.voices[index][1:])
+        return index if self.voices[index][1] <= priority else None
+
+    def play(self, name, sound, cap, priority, order):
+        index = self.pick(name, cap, priority)
+        if index is None:
+            return None
+        self.channels[index].play(sound)
+        self.voices[index] = (name, priority, order)
+        return self.channels[index]
+
 class SoundManager:
     def __init__(self, game):
         self.game = game
         self.sfx_folder = os.path.join(os.path.dirname(__file__), 'assets', 'sfx')
-        self.sounds = {}
+        self.sounds = {} # name -> list of variants
+        self.groups = {} # category -> ChannelGroup
+        self.plays = 0 # Play order, used to find the oldest voice
+        self.setup_channels()
         self.load_sounds()
-        
+
+    def setup_channels(self):
+        if not pygame.mixer.get_init():
+            return
+        reserved = sum(SFX_CHANNEL_GROUPS.values())
+        # Reserved channels are skipped by Sound.play(), leaving the rest for anything unmanaged
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 2))
+        pygame.mixer.set_reserved(reserved)
+        first = 0
+        for category, count in SFX_CHANNEL_GROUPS.items():
+            self.groups[category] = ChannelGroup([pygame.mixer.Channel(index) for index in range(first, first + count)])
+            first += count
+
     def load_sounds(self):
-        sfx_files = ["attack.wav", "magic.wav", "text_blip.wav", "menu.wav"]
-        for filename in sfx_files:
-            path = os.path.join(self.sfx_folder, filename)
-            if os.path.exists(path):
-                try:
-                    name = os.path.splitext(filename)[0]
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                    self.sounds[name].set_volume(0.4)
-                except pygame.error as e:
-                    print(f"Error loading SFX {filename}: {e}")
-                    
+        # Synthesized in memory in the mixer's format; WAVs on disk are the fallback
+        for name in generate_sfx.RECIPES:
+            count, spread = SFX_VARIANTS.get(name, (1, 0.0))
+            try:
+                variants = generate_sfx.synthesize(name, count, spread)
+            except pygame.error as e:
+                print(f"Error synthesizing SFX {name}: {e}")
+                variants = []
+            if not variants:
+                variants = self.load_wav(name)
+            for sound in variants:
+                sound.set_volume(0.4)
+            if variants:
+                self.sounds[name] = variants
+
+    def load_wav(self, name):
+        path = os.path.join(self.sfx_folder, name + ".wav")
+        if not os.path.exists(path):
+            return []
+        try:
+            return [pygame.mixer.Sound(path)]
+        except pygame.error as e:
+            print(f"Error loading SFX {name}.wav: {e}")
+            return []
+
     def play(self, name):
-        if name in self.sounds:
-            self.sounds[name].play()
+        variants = self.sounds.get(name)
+        if not variants:
+            return None
+        sound = random.choice(variants)
+        category, cap, priority = SFX_RULES.get(name, DEFAULT_SFX_RULE)
+        group = self.groups.get(category)
+        if group is None:
+            return sound.play()
+        self.plays += 1
+        return group.play(name, sound, cap, priority, self.plays)
 
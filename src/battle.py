@@ -7,7 +7,12 @@ from components.combat import CombatComponent
 from dice import DicePool
 from spell import SpellDatabase
 from combat_item import ItemDatabase
-from combat_effects import FlashEffect, DamageNumber, ScreenShake
+from combat_effects import FlashEffect, DamageNumber, ScreenShake, EffectPool
+import combat_log
+import event_bus
+from combat_log import CombatLog
+from enemy_behaviour import BehaviourTable
+from status_effects import get_status_definition
 from typing import List, Dict, Optional, Any, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,9 +21,14 @@ if TYPE_CHECKING:
 
 
 class BattleState:
+    """A step of the battle flow. Each Battle builds its states once and reuses
+    them, so per-visit setup goes in enter() rather than __init__."""
     def __init__(self, battle: 'Battle'):
         self.battle = battle
 
+    def enter(self, **kwargs):
+        pass
+
     def handle_input(self, event: pygame.event.Event):
         pass
 
@@ -28,19 +38,19 @@ class BattleState:
     def draw(self, surface: pygame.Surface):
         self.battle.game.battle_ui.draw(self.battle)
 
-    def draw(self, surface: pygame.Surface):
-        self.battle.game.battle_ui.draw(self.battle)
-
 class TacticalPauseState(BattleState):
     def __init__(self, battle):
         super().__init__(battle)
-        if not hasattr(battle, 'dice_pool'):
-            battle.dice_pool = DicePool(3)
-        
-        battle.dice_pool.roll_all()
-        self.selected_die = 0
         self.zones = ['attack', 'defense', 'agility', None] # None is 'Bench'
+
+    def enter(self, **kwargs):
+        if not hasattr(self.battle, 'dice_pool'):
+            self.battle.dice_pool = DicePool(3)
         
+        self.battle.dice_pool.roll_all()
+        self.selected_die = 0
+        self.battle.turn += 1
+
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             pool = self.battle.dice_pool
@@ -83,6 +93,8 @@ class TacticalPauseState(BattleState):
     def confirm_allocation(self):
         # Apply Bonuses
         self.battle.apply_dice_bonuses()
+        pool = self.battle.dice_pool
+        self.battle.record(combat_log.DICE, self.battle.player, roll=sum(pool.get_total_bonus(zone) for zone in ('attack', 'defense', 'agility')))
         self.battle.change_state("main_menu")
 
 class MainMenuState(BattleState):
@@ -91,6 +103,9 @@ class MainMenuState(BattleState):
         self.options = ["Attack", "Magic", "Items", "Run"]
         self.selected_option = 0
 
+    def enter(self, **kwargs):
+        self.selected_option = 0
+
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
@@ -116,11 +131,10 @@ class MainMenuState(BattleState):
             self.battle.change_state("run")
 
 class TargetSelectionState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, spell=None, item=None, **kwargs):
         self.selected_target = 0
-        self.spell = kwargs.get('spell')
-        self.item = kwargs.get('item')
+        self.spell = spell
+        self.item = item
 
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -131,14 +145,9 @@ class TargetSelectionState(BattleState):
                 self.selected_target = (self.selected_target + 1) % len(self.battle.enemies)
                 if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("menu")
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                if 'spell' in self.__dict__: # Check if spell was passed in kwargs (stored in self) - wait, kwargs are not auto-stored.
-                     # Need to store kwargs in init
-                     pass
-                
-                # Re-implement TargetSelection to handle spells/items
-                if hasattr(self, 'spell'):
+                if self.spell:
                     self.battle.change_state("player_magic_attack", target_index=self.selected_target, spell=self.spell)
-                elif hasattr(self, 'item'):
+                elif self.item:
                     self.battle.change_state("player_item_attack", target_index=self.selected_target, item=self.item)
                 else:
                     self.battle.change_state("player_attack", target_index=self.selected_target)
@@ -146,8 +155,12 @@ class TargetSelectionState(BattleState):
                 self.battle.change_state("main_menu")
 
 class PlayerAttackState(BattleState):
-    def __init__(self, battle, target_index):
+    def __init__(self, battle, target_index=None):
         super().__init__(battle)
+        if target_index is not None:
+            self.enter(target_index)
+
+    def enter(self, target_index=0, **kwargs):
         self.target_index = target_index
         self.player_attack()
 
@@ -172,14 +185,16 @@ class PlayerAttackState(BattleState):
         else:
             self.battle.message = ""
         
-        damage = int(base_damage + random.randint(-1, 1))
+        roll = random.randint(-1, 1)
+        damage = int(base_damage + roll)
         target_enemy.get_component(CombatComponent).take_damage(damage)
+        self.battle.record(combat_log.ATTACK, self.battle.player, target_enemy, roll=roll, damage=damage, crit=is_crit)
         
         # Visual Effects
-        self.battle.add_effect(FlashEffect(color=(255, 255, 255), duration=0.1))
+        self.battle.spawn_effect(FlashEffect, color=(255, 255, 255), duration=0.1)
         ex = self.battle.game.battle_ui.x + 280 + self.target_index * 140 + 50
         ey = self.battle.game.battle_ui.y + 110
-        self.battle.add_effect(DamageNumber(damage, ex, ey, color=(255, 200, 50)))
+        self.battle.spawn_effect(DamageNumber, damage, ex, ey, color=(255, 200, 50))
         
         self.battle.message += f"You attack {target_enemy.name} for {damage} damage!"
         if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("attack")
@@ -191,6 +206,7 @@ class PlayerAttackState(BattleState):
             ability = target_enemy.special_abilities['heal_on_hit']
             if random.random() < ability['chance']:
                 target_enemy.get_component(CombatComponent).heal(ability['amount'])
+                self.battle.record(combat_log.HEAL, target_enemy, target_enemy, damage=ability['amount'], label="heal_on_hit")
                 heal_message = f"\n{target_enemy.name} radiates a faint glow and heals for {ability['amount']} HP!"
                 self.battle.message += heal_message
                 if hasattr(self.battle.game, 'message_log'):
@@ -203,35 +219,24 @@ class PlayerAttackState(BattleState):
                     new_enemy_type = ability['enemy_type']
                     new_enemy = self.battle.game.create_enemy(new_enemy_type)
                     self.battle.enemies.append(new_enemy)
+                    self.battle.record(combat_log.SUMMON, target_enemy, new_enemy)
                     self.battle.message += f"\n{target_enemy.name} calls for help!"
                     if hasattr(self.battle.game, 'message_log'):
                         self.battle.game.message_log.log_combat(f"{target_enemy.name} called for help!")
 
         if target_enemy.get_component(CombatComponent).hp <= 0:
             defeated_enemy = self.battle.enemies.pop(self.target_index)
+            self.battle.record(combat_log.DEFEATED, self.battle.player, defeated_enemy)
             self.battle.rewards["xp"] += defeated_enemy.get_component(CombatComponent).xp_reward
             self.battle.rewards["gold"] += defeated_enemy.get_component(CombatComponent).gold_reward
-            
-            # Handle Loot
-            if hasattr(defeated_enemy, 'loot') and defeated_enemy.loot:
-                if "items" not in self.battle.rewards:
-                    self.battle.rewards["items"] = []
-                self.battle.rewards["items"].extend(defeated_enemy.loot)
-                self.battle.message += f"\nDropped {', '.join(defeated_enemy.loot)}!"
-                
-                # Add to player inventory
-                from inventory import create_item
-                for item_name in defeated_enemy.loot:
-                    new_item = create_item(item_name)
-                    if new_item:
-                        self.battle.player.inventory.add_item(new_item)
-
-            if hasattr(self.battle.game, 'quest_manager'):
-                self.battle.game.quest_manager.update_kill_quest(defeated_enemy.enemy_type)
+
+            if hasattr(self.battle.game, 'event_bus'):
+                self.battle.game.event_bus.emit(event_bus.KILL, defeated_enemy.enemy_type)
             self.battle.message = f"{defeated_enemy.name} defeated!"
             if hasattr(self.battle.game, 'message_log'):
                 self.battle.game.message_log.log_combat(f"{defeated_enemy.name} defeated!")
-            defeated_enemy.kill()
+            self.battle.collect_loot(defeated_enemy)
+            self.battle.despawn(defeated_enemy)
 
             if not self.battle.enemies:
                 self.battle.change_state("victory")
@@ -241,12 +246,14 @@ class PlayerAttackState(BattleState):
             self.battle.change_state("ally_turn")
 
 class MagicMenuState(BattleState):
-    def __init__(self, battle, **kwargs):
+    def __init__(self, battle):
         super().__init__(battle)
-        self.spells = battle.player.known_spells # List of spell IDs
-        self.selected_magic = 0
         self.spell_db = battle.spell_db
 
+    def enter(self, **kwargs):
+        self.spells = self.battle.player.known_spells # List of spell IDs
+        self.selected_magic = 0
+
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
@@ -277,6 +284,7 @@ class MagicMenuState(BattleState):
             if spell.type == "healing":
                 heal_amount = spell.power + self.battle.player.level * 2
                 self.battle.player.combat.hp = min(self.battle.player.combat.max_hp, self.battle.player.combat.hp + heal_amount)
+                self.battle.record(combat_log.HEAL, self.battle.player, self.battle.player, damage=heal_amount, label=spell.spell_id)
                 self.battle.message = f"Cast {spell.name}! Recovered {heal_amount} HP!"
                 if hasattr(self.battle.game, 'message_log'):
                     self.battle.game.message_log.log_combat(f"Healed for {heal_amount} HP")
@@ -298,8 +306,12 @@ class MagicMenuState(BattleState):
             self.battle.message = "Not enough MP!"
 
 class PlayerMagicAttackState(BattleState):
-    def __init__(self, battle, target_index, spell):
+    def __init__(self, battle, target_index=None, spell=None):
         super().__init__(battle)
+        if target_index is not None:
+            self.enter(target_index, spell)
+
+    def enter(self, target_index=0, spell=None, **kwargs):
         self.target_index = target_index
         self.spell = spell
         self.cast_spell()
@@ -312,20 +324,23 @@ class PlayerMagicAttackState(BattleState):
             # Simple element check (can be expanded)
             damage = int(damage * (1.0 + random.uniform(-0.1, 0.1)))
             target_enemy.get_component(CombatComponent).take_damage(damage)
+            self.battle.record(combat_log.MAGIC, self.battle.player, target_enemy, damage=damage, label=self.spell.spell_id)
             
             # Effects
-            self.battle.add_effect(FlashEffect(color=(100, 100, 255), duration=0.2)) # Blue flash for magic
+            self.battle.spawn_effect(FlashEffect, color=(100, 100, 255), duration=0.2) # Blue flash for magic
             ex = self.battle.game.battle_ui.x + 280 + self.target_index * 140 + 50
             ey = self.battle.game.battle_ui.y + 110
-            self.battle.add_effect(DamageNumber(damage, ex, ey, color=(100, 150, 255)))
+            self.battle.spawn_effect(DamageNumber, damage, ex, ey, color=(100, 150, 255))
             
             self.battle.message = f"Cast {self.spell.name} on {target_enemy.name} for {damage} damage!"
             
         elif self.spell.type == "status":
              if random.random() < self.spell.chance:
                  target_enemy.get_component(CombatComponent).apply_status_effect(self.spell.effect, self.spell.duration)
+                 self.battle.record(combat_log.STATUS, self.battle.player, target_enemy, status=self.spell.effect, label=self.spell.spell_id)
                  self.battle.message = f"Cast {self.spell.name}! {target_enemy.name} is {self.spell.effect}!"
              else:
+                 self.battle.record(combat_log.MISS, self.battle.player, target_enemy, label=self.spell.spell_id)
                  self.battle.message = f"Cast {self.spell.name}! But it failed!"
 
         elif self.spell.type == "multi_hit":
@@ -340,16 +355,18 @@ class PlayerMagicAttackState(BattleState):
                 # Defense check? Maybe reduce defense effectiveness for rapid hits or keep standard
                 defense = target_enemy.get_component(CombatComponent).get_attribute("defense")
                 dmg = max(1, int(base_dmg - defense / 2))
-                dmg = int(dmg + random.randint(-1, 1))
+                roll = random.randint(-1, 1)
+                dmg = int(dmg + roll)
                 
                 target_enemy.get_component(CombatComponent).take_damage(dmg)
+                self.battle.record(combat_log.MAGIC, self.battle.player, target_enemy, roll=roll, damage=dmg, label=self.spell.spell_id)
                 total_damage += dmg
                 
                 # Effects per hit
-                self.battle.add_effect(FlashEffect(color=(255, 255, 200), duration=0.1))
+                self.battle.spawn_effect(FlashEffect, color=(255, 255, 200), duration=0.1)
                 ex = self.battle.game.battle_ui.x + 280 + self.target_index * 140 + 50 + random.randint(-20, 20)
                 ey = self.battle.game.battle_ui.y + 110 + random.randint(-20, 20)
-                self.battle.add_effect(DamageNumber(dmg, ex, ey, color=(255, 255, 200)))
+                self.battle.spawn_effect(DamageNumber, dmg, ex, ey, color=(255, 255, 200))
                 
             self.battle.message += f"\nHit {hits} times for {total_damage} total damage!"
 
@@ -357,12 +374,14 @@ class PlayerMagicAttackState(BattleState):
         
         if target_enemy.get_component(CombatComponent).hp <= 0:
             defeated_enemy = self.battle.enemies.pop(self.target_index)
+            self.battle.record(combat_log.DEFEATED, self.battle.player, defeated_enemy)
             self.battle.rewards["xp"] += defeated_enemy.get_component(CombatComponent).xp_reward
             self.battle.rewards["gold"] += defeated_enemy.get_component(CombatComponent).gold_reward
-            if hasattr(self.battle.game, 'quest_manager'):
-                self.battle.game.quest_manager.update_kill_quest(defeated_enemy.enemy_type)
+            if hasattr(self.battle.game, 'event_bus'):
+                self.battle.game.event_bus.emit(event_bus.KILL, defeated_enemy.enemy_type)
             self.battle.message += f"\n{defeated_enemy.name} defeated!"
-            defeated_enemy.kill()
+            self.battle.collect_loot(defeated_enemy)
+            self.battle.despawn(defeated_enemy)
 
             if not self.battle.enemies:
                 self.battle.change_state("victory")
@@ -372,29 +391,18 @@ class PlayerMagicAttackState(BattleState):
             self.battle.change_state("ally_turn")
 
 class ItemMenuState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
-        # Group items by name
-        self.grouped_items = {}
-        for item in battle.player.inventory.items:
-            # Only list usable items (potions, ether, bombs, etc.)
-            # Exclude weapons/armor/misc if not usable in battle
-            # For now, let's include anything with 'type' in healing/restore_mp/damage
-            if item.type in ["healing", "restore_mp", "damage"]:
-                if item.name not in self.grouped_items:
-                    self.grouped_items[item.name] = []
-                self.grouped_items[item.name].append(item)
-        
-        self.item_names = list(self.grouped_items.keys())
+    def enter(self, **kwargs):
+        # Only usable items (potions, ether, bombs, etc.), read straight from the inventory's type index
+        self.stacks = self.battle.player.inventory.stacks_of_type("healing", "restore_mp", "damage")
         self.selected_item = 0
 
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
-                self.selected_item = (self.selected_item - 1) % (len(self.item_names) + 1)
+                self.selected_item = (self.selected_item - 1) % (len(self.stacks) + 1)
                 if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("menu")
             elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                self.selected_item = (self.selected_item + 1) % (len(self.item_names) + 1)
+                self.selected_item = (self.selected_item + 1) % (len(self.stacks) + 1)
                 if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("menu")
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 self.execute_item()
@@ -402,30 +410,27 @@ class ItemMenuState(BattleState):
                 self.battle.change_state("main_menu")
 
     def execute_item(self):
-        if self.selected_item == len(self.item_names): # Back option
+        if self.selected_item == len(self.stacks): # Back option
             self.battle.change_state("main_menu")
             return
 
-        item_name = self.item_names[self.selected_item]
-        items = self.grouped_items[item_name]
-        
-        if not items:
-            return 
-            
-        item = items.pop() # Take one item
-        self.battle.player.inventory.remove_item(item)
-        
-        if not items:
-            self.item_names.remove(item_name)
-            del self.grouped_items[item_name]
+        stack = self.stacks[self.selected_item]
+        item = stack.item
+        if not self.battle.player.inventory.remove_item(item): # Take one item
+            return
+
+        if not stack.count:
+            self.stacks.remove(stack)
             self.selected_item = 0
 
         if item.type == "healing":
             self.battle.player.combat.heal(item.power)
+            self.battle.record(combat_log.HEAL, self.battle.player, self.battle.player, damage=item.power, label=item.item_id)
             self.battle.message = f"Used {item.name}! Recovered {item.power} HP!"
             self.battle.change_state("ally_turn")
         elif item.type == "restore_mp":
             self.battle.player.combat.restore_mp(item.power)
+            self.battle.record(combat_log.ITEM, self.battle.player, self.battle.player, label=item.item_id)
             self.battle.message = f"Used {item.name}! Recovered {item.power} MP!"
             self.battle.change_state("ally_turn")
         elif item.type == "damage":
@@ -435,8 +440,12 @@ class ItemMenuState(BattleState):
                 self.battle.change_state("player_item_attack", target_index=0, item=item)
 
 class PlayerItemAttackState(BattleState):
-    def __init__(self, battle, target_index, item):
+    def __init__(self, battle, target_index=None, item=None):
         super().__init__(battle)
+        if target_index is not None:
+            self.enter(target_index, item)
+
+    def enter(self, target_index=0, item=None, **kwargs):
         self.target_index = target_index
         self.item = item
         self.use_item()
@@ -445,16 +454,19 @@ class PlayerItemAttackState(BattleState):
         target_enemy = self.battle.enemies[self.target_index]
         damage = self.item.power
         target_enemy.get_component(CombatComponent).take_damage(damage)
+        self.battle.record(combat_log.ITEM, self.battle.player, target_enemy, damage=damage, label=self.item.item_id)
         self.battle.message = f"Used {self.item.name} on {target_enemy.name} for {damage} damage!"
         
         if target_enemy.get_component(CombatComponent).hp <= 0:
             defeated_enemy = self.battle.enemies.pop(self.target_index)
+            self.battle.record(combat_log.DEFEATED, self.battle.player, defeated_enemy)
             self.battle.rewards["xp"] += defeated_enemy.get_component(CombatComponent).xp_reward
             self.battle.rewards["gold"] += defeated_enemy.get_component(CombatComponent).gold_reward
-            if hasattr(self.battle.game, 'quest_manager'):
-                self.battle.game.quest_manager.update_kill_quest(defeated_enemy.enemy_type)
+            if hasattr(self.battle.game, 'event_bus'):
+                self.battle.game.event_bus.emit(event_bus.KILL, defeated_enemy.enemy_type)
             self.battle.message += f"\n{defeated_enemy.name} defeated!"
-            defeated_enemy.kill()
+            self.battle.collect_loot(defeated_enemy)
+            self.battle.despawn(defeated_enemy)
 
             if not self.battle.enemies:
                 self.battle.change_state("victory")
@@ -464,13 +476,14 @@ class PlayerItemAttackState(BattleState):
             self.battle.change_state("ally_turn")
 
 class RunState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, **kwargs):
         self.run()
 
     def run(self):
         escape_chance = 0.5 + (self.battle.player.combat.get_attribute("agility") * 0.03)
-        if random.random() < escape_chance:
+        escaped = random.random() < escape_chance
+        self.battle.record(combat_log.RUN, self.battle.player, crit=escaped)
+        if escaped:
             self.battle.message = "Escaped successfully!"
             self.battle.active = False
             self.battle.game.in_battle = False
@@ -481,8 +494,7 @@ class RunState(BattleState):
             self.battle.change_state("ally_turn")
 
 class AllyTurnState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, **kwargs):
         self.ally_attack()
 
     def ally_attack(self):
@@ -491,12 +503,14 @@ class AllyTurnState(BattleState):
             self.battle.change_state("enemy_turn")
             return
 
-        for ally in self.battle.allies:
+        # Roll the whole party's actions and brawl damage up front
+        rolls = self.battle.rng.random(len(self.battle.allies))
+        brawl_damage = self.battle.rng.integers(5, 16, len(self.battle.allies))
+        for ally, roll, damage in zip(self.battle.allies, rolls.tolist(), brawl_damage.tolist()):
             if not self.battle.enemies:
                 break
                 
             # Drunk Logic
-            roll = random.random()
             
             if roll < 0.2: # 20% Stumble/Do nothing
                 actions = [
@@ -511,25 +525,29 @@ class AllyTurnState(BattleState):
             elif roll < 0.3: # 10% Heal Player (Toss Beer)
                 heal_amount = 15
                 self.battle.player.combat.heal(heal_amount)
+                self.battle.record(combat_log.HEAL, ally, self.battle.player, damage=heal_amount)
                 full_message += f"{ally.name} tosses a cold one to the Hero! Healed {heal_amount} HP!\n"
                 if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("drink") # Placeholder
                 
             elif roll < 0.4: # 10% Attack Nothing
+                self.battle.record(combat_log.MISS, ally)
                 full_message += f"{ally.name} swings wildly at thin air!\n"
                 
             else: # 60% Attack Random Enemy
                 target = random.choice(self.battle.enemies)
-                damage = random.randint(5, 15)
-                target.get_component(CombatComponent).take_damage(damage)
+                target_combat = target.get_component(CombatComponent)
+                target_combat.take_damage(damage)
+                self.battle.record(combat_log.ATTACK, ally, target, roll=damage, damage=damage)
                 full_message += f"{ally.name} drunkenly brawls with {target.name} for {damage} damage!\n"
                 
-                if target.get_component(CombatComponent).hp <= 0:
+                if target_combat.hp <= 0:
                     defeated_enemy = target
                     self.battle.enemies.remove(defeated_enemy)
-                    self.battle.rewards["xp"] += defeated_enemy.get_component(CombatComponent).xp_reward
-                    self.battle.rewards["gold"] += defeated_enemy.get_component(CombatComponent).gold_reward
+                    self.battle.record(combat_log.DEFEATED, ally, defeated_enemy)
+                    self.battle.rewards["xp"] += target_combat.xp_reward
+                    self.battle.rewards["gold"] += target_combat.gold_reward
                     full_message += f"{defeated_enemy.name} was knocked out!\n"
-                    defeated_enemy.kill()
+                    self.battle.despawn(defeated_enemy)
 
         if not self.battle.enemies:
             self.battle.change_state("victory")
@@ -559,7 +577,7 @@ class AllyTurnState(BattleState):
             pass
 
         # To allow reading the funny text, let's not change state immediately if there is text.
-        # But the structure calls ally_attack in __init__.
+        # But the structure calls ally_attack in enter().
         # So we need to handle input to proceed.
         
     def handle_input(self, event):
@@ -568,156 +586,107 @@ class AllyTurnState(BattleState):
                  self.battle.change_state("enemy_turn")
 
 class EnemyTurnState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, **kwargs):
         self.enemy_attack()
 
-    def handle_special_enemy_logic(self, enemy, full_message):
-        # Daryl Ledeay Logic
-        if enemy.enemy_type == "daryl_ledeay":
-            # 5% Self Damage (Trip) - Reduced from 10%
-            if random.random() < 0.05:
-                self_dmg = int(enemy.get_component(CombatComponent).max_hp * 0.10)
-                enemy.get_component(CombatComponent).take_damage(self_dmg)
-                full_message += f"\n{enemy.name} trips over a garden gnome! Takes {self_dmg} damage!\nDaryl: 'Dang it! That wasn't supposed to happen!'"
-                return full_message, True # Skip attack
-
-            # 10% Critical Hit (Lucky Swing) - Reduced from 15%
-            is_crit = random.random() < 0.10
-            damage_mult = 2.5 if is_crit else 1.0
-            if is_crit:
-                full_message += f"\n{enemy.name}: 'Woooo! See that, George? Musta been the new lucky socks!'"
-            return full_message, False, damage_mult
-
-        # Chicken George Logic
-        elif enemy.enemy_type == "chicken_george":
-            # 20% Pity Heal
-            if random.random() < 0.20:
-                heal_amount = int(self.battle.player.combat.max_hp * 0.15)
-                self.battle.player.combat.heal(heal_amount)
-                full_message += f"\n{enemy.name} tosses a Mystery Energy Drink at you! Recovered {heal_amount} HP!\nGeorge: 'Aw, shucks. Looks like we gotta try harder.'"
-                return full_message, True # Skip attack
-
-            # 10% Bud Light Boost (Buff Daryl)
-            if random.random() < 0.10:
-                daryl = next((e for e in self.battle.enemies if e.enemy_type == "daryl_ledeay"), None)
-                if daryl:
-                    daryl.get_component(CombatComponent).stats['defense'] += 50
-                    full_message += f"\n{enemy.name} shares a cold one with Daryl! Daryl's Defense rose sharply!"
-                    return full_message, True # Skip attack
-
-        return full_message, False, 1.0
-
     def enemy_attack(self):
         full_message = ""
-        for enemy in self.battle.enemies:
-            skip_attack = False
-            damage_mult = 1.0
-            
-            # Special Logic Hook
-            if enemy.enemy_type in ["daryl_ledeay", "chicken_george"]:
-                res = self.handle_special_enemy_logic(enemy, full_message)
-                if len(res) == 2:
-                    full_message, skip_attack = res
-                else:
-                    full_message, skip_attack, damage_mult = res
-            
-            if skip_attack:
+        behaviour_table = self.battle.behaviours
+        rng = self.battle.rng
+        player = self.battle.player
+        
+        # Apply Dice Bonus to Player Defense
+        bonus_def = self.battle.current_bonuses.get('defense', 0)
+        player_def = (player.combat.get_attribute("defense") + bonus_def) * 2
+        
+        enemies = list(self.battle.enemies)
+        count = len(enemies)
+        combats = [enemy.get_component(CombatComponent) for enemy in enemies]
+        behaviours = [behaviour_table.get(enemy.enemy_type) for enemy in enemies]
+        notes = [""] * count # Text shown before each enemy's attack
+        damage_mult = np.ones(count, dtype=np.float32)
+        attacking = np.zeros(count, dtype=bool)
+        
+        # Pass 1: statuses and special behaviour decide who attacks and how hard
+        for i, (enemy, combat, behaviour) in enumerate(zip(enemies, combats, behaviours)):
+            if not combat.can_act():
+                self.battle.record(combat_log.MISS, enemy, label="incapacitated")
+                notes[i] = f"{enemy.name} can't move!\n"
                 continue
-            
-            # Determine Attack Type
-            # Default to melee if not specified
-            attack_type = getattr(enemy, 'attack_type', 'melee') 
-            # In update, we should load this from data. 
-            # But for now, let's assume it's set or check special_abilities/data
-            # We can check specific enemy types here or rely on data loaded into the enemy object
-            
-            # Temporary: Mapping based on name/type if not loaded in Enemy class yet
-            if "archer" in enemy.enemy_type or "ranger" in enemy.enemy_type:
-                attack_type = "ranged"
-            elif "wizard" in enemy.enemy_type or "mage" in enemy.enemy_type:
-                attack_type = "magic"
-            
-            
-            # Apply Dice Bonus to Player Defense
-            bonus_def = self.battle.current_bonuses.get('defense', 0)
-            player_def = (self.battle.player.combat.get_attribute("defense") + bonus_def) * 2
-            
-            enemy_str = enemy.get_component(CombatComponent).get_attribute("strength") * 2
-            enemy_int = enemy.get_component(CombatComponent).get_attribute("intelligence") * 2
-            
-            damage = 0
-            
-            if attack_type == "melee":
-                damage = np.subtract(enemy_str * damage_mult, player_def // 2)
-                damage = np.maximum(1, damage)
-                damage = int(damage + random.randint(-1, 1))
-                full_message += f"{enemy.name} attacks for {damage} damage!\n"
-                
-            elif attack_type == "ranged":
-                # Ranged: Ignores some defense, but lower accuracy check?
-                # For simplicity: varied damage, maybe critical chance
-                if random.random() < 0.9: # 90% hit rate
-                    damage = np.subtract(enemy_str * 0.8 * damage_mult, player_def // 4) # Armor piercing
-                    damage = np.maximum(1, damage)
-                    damage = int(damage + random.randint(0, 2))
-                    full_message += f"{enemy.name} fires an arrow! Deals {damage} damage!\n"
-                    if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("hit") # Use hit sound
-                else:
-                    full_message += f"{enemy.name} fires an arrow but misses!\n"
-                    
-            elif attack_type == "magic":
-                # Magic: Uses INT, ignores Defense (maybe uses Magic Def?)
-                # Select a spell
-                spells = ["fireball", "ice_bolt"]
-                spell = random.choice(spells)
-                
-                spell_dmg = enemy_int * 1.5
-                damage = int(spell_dmg * damage_mult)
-                
-                full_message += f"{enemy.name} casts {spell}! Deals {damage} magic damage!\n"
-                if hasattr(self.battle.game, 'sound_manager'): self.battle.game.sound_manager.play("magic")
+            if behaviour.special:
+                notes[i], skip_attack, damage_mult[i] = behaviour.special(self, enemy, "")
+                if skip_attack:
+                    continue
+            attacking[i] = True
+        
+        # Pass 2: one vectorized roll per attack type
+        damages = np.zeros(count, dtype=int)
+        rolls = np.zeros(count, dtype=int)
+        attack_text = [""] * count
+        spells = [None] * count
+        groups: Dict[Any, List[int]] = {}
+        for i in np.flatnonzero(attacking):
+            groups.setdefault(behaviours[i].attack, []).append(i)
+        for attack, indices in groups.items():
+            group_damage, group_text, group_spells, group_rolls = attack(
+                self, [enemies[i] for i in indices], [combats[i] for i in indices],
+                [behaviours[i] for i in indices], damage_mult[indices], player_def, rng)
+            damages[indices] = group_damage
+            rolls[indices] = group_rolls
+            for i, text, spell in zip(indices, group_text, group_spells):
+                attack_text[i] = text
+                spells[i] = spell
+        
+        # Daryl's Lucky Cap Effect (Player)
+        if player.inventory.is_equipped("daryls_lucky_cap"):
+            absorbed = attacking & (rng.random(count) < 0.05)
+        else:
+            absorbed = np.zeros(count, dtype=bool)
+        
+        # Pass 3: apply results in turn order
+        for i, (enemy, behaviour) in enumerate(zip(enemies, behaviours)):
+            full_message += notes[i]
+            if not attacking[i]:
+                continue
+            full_message += attack_text[i]
+            damage = int(damages[i])
+            spell = spells[i]
 
-            # Daryl's Lucky Cap Effect (Player)
-            equipped_ids = [item.item_id for item in self.battle.player.inventory.equipment.values() if item]
-            if "daryls_lucky_cap" in equipped_ids:
-                 if random.random() < 0.05:
-                     self.battle.player.combat.heal(1)
-                     full_message += f"\nDaryl's Lucky Cap absorbs the blow! Healed 1 HP!"
-                     damage = 0
+            if absorbed[i]:
+                player.combat.heal(1)
+                full_message += f"\nDaryl's Lucky Cap absorbs the blow! Healed 1 HP!"
+                damage = 0
 
             if damage > 0:
-                self.battle.player.combat.take_damage(damage)
+                player.combat.take_damage(damage)
+                self.battle.record(combat_log.MAGIC if spell else combat_log.ATTACK, enemy, player,
+                                   roll=int(rolls[i]), damage=damage, crit=damage_mult[i] > 1, label=spell or behaviour.attack_type)
                 
                 # Visual Effects
-                self.battle.add_effect(FlashEffect(color=(255, 50, 50), duration=0.2)) # Red flash
+                self.battle.spawn_effect(FlashEffect, color=(255, 50, 50), duration=0.2) # Red flash
                 px = self.battle.game.battle_ui.x + 30
                 py = self.battle.game.battle_ui.y + 110
-                self.battle.add_effect(DamageNumber(damage, px, py, color=(255, 50, 50)))
+                self.battle.spawn_effect(DamageNumber, damage, px, py, color=(255, 50, 50))
                 
                 if hasattr(self.battle.game, 'message_log'):
-                    self.battle.game.message_log.log_combat(f"{enemy.name} ({attack_type}) dealt {damage} damage")
+                    self.battle.game.message_log.log_combat(f"{enemy.name} ({behaviour.attack_type}) dealt {damage} damage")
+            else:
+                self.battle.record(combat_log.MISS, enemy, player, label=behaviour.attack_type)
             
-            if 'daze_on_attack' in enemy.special_abilities:
-                ability = enemy.special_abilities['daze_on_attack']
-                if random.random() < ability['chance']:
-                    self.battle.player.combat.apply_status_effect("dazed", ability['duration'])
-                    daze_message = f"You are dazed by {enemy.name}'s attack!"
-                    full_message += daze_message + "\n"
-                    if hasattr(self.battle.game, 'message_log'):
-                        self.battle.game.message_log.log_combat(f"Player is dazed for {ability['duration']} turns.")
+            for hook, ability in behaviour.hooks:
+                full_message = hook(self, enemy, ability, full_message)
             
-            if self.battle.player.combat.hp <= 0:
+            if player.combat.hp <= 0:
                 self.battle.change_state("defeat")
                 return
 
-        self.battle.message = full_message.strip()
+        full_message += self.battle.end_round()
         self.battle.message = full_message.strip()
         self.battle.change_state("tactical_pause")
 
 class VictoryState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, **kwargs):
+        self.battle.record(combat_log.VICTORY, self.battle.player)
         self.battle.message = f"All enemies defeated!\nGained {self.battle.rewards['xp']} XP and {self.battle.rewards['gold']} Gold!\nPress Enter to continue."
         
         # Check for Bud Light Boogie Duo Defeat
@@ -746,8 +715,8 @@ class VictoryState(BattleState):
                 self.battle.game.message_log.log_system(f"Level Up! reached level {self.battle.player.level}")
 
 class DefeatState(BattleState):
-    def __init__(self, battle, **kwargs):
-        super().__init__(battle)
+    def enter(self, **kwargs):
+        self.battle.record(combat_log.DEFEAT, self.battle.player)
         self.battle.message = "You were defeated! Press Enter to restart."
 
     def handle_input(self, event):
@@ -757,12 +726,56 @@ class DefeatState(BattleState):
                 self.battle.game.change_scene("title")
 
 class Battle:
+    # State name -> class. Each Battle instantiates these once and reuses them.
+    STATE_CLASSES: Dict[str, type] = {
+        "tactical_pause": TacticalPauseState,
+        "main_menu": MainMenuState,
+        "target_selection": TargetSelectionState,
+        "player_attack": PlayerAttackState,
+        "magic_menu": MagicMenuState,
+        "player_magic_attack": PlayerMagicAttackState,
+        "item_menu": ItemMenuState,
+        "player_item_attack": PlayerItemAttackState,
+        "run": RunState,
+        "ally_turn": AllyTurnState,
+        "enemy_turn": EnemyTurnState,
+        "victory": VictoryState,
+        "defeat": DefeatState,
+    }
+
     def __init__(self, game: 'Game', player: 'Entity', enemies: List['Entity'], allies: Optional[List['Entity']] = None):
         self.game = game
+        # Spell/item data is parsed once per game, not per encounter
+        self.spell_db = game.spell_db if hasattr(game, 'spell_db') else SpellDatabase()
+        self.item_db = game.item_db if hasattr(game, 'item_db') else ItemDatabase()
+        
+        self.active_effects: List[Any] = [] # List of active CombatEffects
+        self.effect_pool = EffectPool()
+        self.combat_log = game.combat_log if hasattr(game, 'combat_log') else CombatLog()
+        self.behaviours = game.enemy_behaviours if hasattr(game, 'enemy_behaviours') else BehaviourTable()
+        self.rng = np.random.default_rng() # Batched rolls for group turns
+        
+        # One Card Dungeon: Dice Pool
+        self.dice_pool = DicePool(3)
+        self.current_bonuses = {'attack': 0, 'defense': 0, 'agility': 0}
+        
+        self.states: Dict[str, BattleState] = {name: state_class(self) for name, state_class in self.STATE_CLASSES.items()}
+        self.current_state: Optional[BattleState] = None
+        self.start(player, enemies, allies)
+
+    def start(self, player: 'Entity', enemies: List['Entity'], allies: Optional[List['Entity']] = None):
+        """Begin a new encounter, reusing this battle's states, databases and effects"""
         self.player = player
         self.enemies = enemies
         self.allies = allies or []
         self.active = True
+        
+        # Structured event stream; combatants get battle-local slots as they join
+        self.battle_id = self.combat_log.begin_battle()
+        self.turn = 0
+        self.slots: Dict[Any, int] = {}
+        for combatant in [player] + list(enemies) + self.allies:
+            self.slot_of(combatant)
         self.message = f"A wild {', '.join([e.name for e in enemies])} appeared!"
         
         # Check for Bud Light Boogie Duo
@@ -774,31 +787,13 @@ class Battle:
             self.game.message_log.log_combat(self.message)
             
         self.rewards: Dict[str, Any] = {"xp": 0, "gold": 0}
+        self.despawned: List['Entity'] = []
+        for effect in self.active_effects:
+            self.effect_pool.release(effect)
+        self.active_effects.clear()
+        for zone in self.current_bonuses:
+            self.current_bonuses[zone] = 0
         
-        self.states: Dict[str, type] = {
-            "tactical_pause": TacticalPauseState,
-            "main_menu": MainMenuState,
-            "target_selection": TargetSelectionState,
-            "player_attack": PlayerAttackState,
-            "magic_menu": MagicMenuState,
-            "player_magic_attack": PlayerMagicAttackState,
-            "item_menu": ItemMenuState,
-            "player_item_attack": PlayerItemAttackState,
-            "run": RunState,
-            "ally_turn": AllyTurnState,
-            "enemy_turn": EnemyTurnState,
-            "victory": VictoryState,
-            "defeat": DefeatState,
-        }
-        self.active_effects: List[Any] = [] # List of active CombatEffects
-        self.spell_db = SpellDatabase()
-        self.item_db = ItemDatabase()
-        
-        # One Card Dungeon: Dice Pool
-        self.dice_pool = DicePool(3)
-        self.current_bonuses = {'attack': 0, 'defense': 0, 'agility': 0}
-        
-        self.current_state: Optional[BattleState] = None
         self.state = "tactical_pause" # Initialize state name
         self.change_state("tactical_pause")
 
@@ -812,13 +807,78 @@ class Battle:
         # We will need to update PlayerAttackState and EnemyTurnState (for player defense)
 
 
+    def end_round(self) -> str:
+        """Tick every combatant's statuses once per round; returns wear-off text"""
+        message = ""
+        for combatant in [self.player] + self.enemies:
+            for effect in combatant.get_component(CombatComponent).tick_status_effects():
+                message += f"{combatant.name} is no longer {get_status_definition(effect).name.lower()}.\n"
+        return message
+
+    def collect_loot(self, enemy):
+        """Give the hero whatever the enemy's loot table rolled when it spawned"""
+        loot = getattr(enemy, 'loot', None)
+        if not loot:
+            return
+        self.rewards.setdefault("items", []).extend(loot)
+        self.message += f"\nDropped {', '.join(loot)}!"
+
+        # Add to player inventory
+        from inventory import create_item
+        for item_name in loot:
+            new_item = create_item(item_name)
+            if new_item:
+                self.player.inventory.add_item(new_item)
+                if hasattr(self.game, 'event_bus'):
+                    self.game.event_bus.emit(event_bus.ITEM_ACQUIRED, new_item.item_id)
+
+    def despawn(self, enemy):
+        """Take a defeated enemy off the map; it returns to the pool when the battle ends"""
+        enemy.kill()
+        self.despawned.append(enemy)
+
+    def finish(self):
+        """Battle statuses don't follow the hero back to the map"""
+        self.player.combat.set_status_effects({})
+        if hasattr(self.game, 'enemy_pool'):
+            for enemy in self.despawned:
+                self.game.enemy_pool.release(enemy)
+        self.despawned.clear()
+
+    def slot_of(self, entity) -> int:
+        """Battle-local slot for a combatant, logging a join event the first time it is seen"""
+        slot = self.slots.get(entity)
+        if slot is None:
+            slot = self.slots[entity] = len(self.slots)
+            combat = entity.get_component(CombatComponent)
+            self.combat_log.append(combat_log.JOIN, slot, slot, turn=self.turn, hp=combat.hp if combat else 0, label=entity.name)
+        return slot
+
+    def record(self, action: int, actor, target=None, **fields):
+        """Append a structured combat event. hp is the target's HP after the action."""
+        target_slot = 0
+        hp = 0
+        if target is not None:
+            target_slot = self.slot_of(target)
+            combat = target.get_component(CombatComponent)
+            hp = combat.hp if combat else 0
+        self.combat_log.append(action, self.slot_of(actor), target_slot, turn=self.turn, hp=hp, **fields)
+
     def add_effect(self, effect):
         self.active_effects.append(effect)
 
+    def spawn_effect(self, effect_class, *args, **kwargs):
+        """Start an effect, recycling a finished one of the same class if available"""
+        effect = self.effect_pool.acquire(effect_class, *args, **kwargs)
+        self.active_effects.append(effect)
+        return effect
+
     def change_state(self, state_name: str, **kwargs):
         if state_name in self.states:
             self.state = state_name # Update state name
-            self.current_state = self.states[state_name](self, **kwargs)
+            self.current_state = self.states[state_name]
+            # Set before enter(): action states chain straight into the next state
+            self.current_state.enter(**kwargs)
         else:
             print(f"Error: Unknown battle state '{state_name}'")
 
@@ -831,10 +891,14 @@ class Battle:
             self.current_state.update(dt)
         
         # Update Effects
-        for effect in self.active_effects[:]:
+        effects = self.active_effects
+        for effect in effects:
             effect.update(dt)
-            if effect.finished:
-                self.active_effects.remove(effect)
+        if any(effect.finished for effect in effects):
+            for effect in effects:
+                if effect.finished:
+                    self.effect_pool.release(effect)
+            effects[:] = [effect for effect in effects if not effect.finished]
 
     def draw(self, surface: pygame.Surface):
         if self.current_state:
@@ -844,6 +908,3 @@ class Battle:
         for effect in self.active_effects:
              if hasattr(effect, 'draw'):
                  effect.draw(surface)
-
-
-
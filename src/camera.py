@@ -1,35 +1,106 @@
+import math
 import pygame
 from settings import *
+from combat_effects import ScreenShake
 
 class Camera:
-    def __init__(self, width, height):
-        self.camera = pygame.Rect(0, 0, width, height)
+    """Follows a target around a map of width x height pixels. Offsets are whole
+    pixels (the negated top-left of the view) and every Rect it hands out is
+    updated in place, so following and drawing allocate nothing per frame.
+    One Camera lives for the whole game; set_map re-bounds it on map changes."""
+    def __init__(self, width=WIDTH, height=HEIGHT):
         self.width = width
         self.height = height
-        
+        # Simulated offset at the last two steps, and the drawn one between them
+        self.x = self.y = 0
+        self.prev_x = self.prev_y = 0
+        self.offset_x = self.offset_y = 0
+        self.alpha = 1.0
+        # The point kept at the centre of the view, eased towards the target
+        self.focus_x = self.focus_y = 0.0
+        self.fresh = True
+        self.smoothing = CAMERA_SMOOTHING
+        self.deadzone = CAMERA_DEADZONE
+        self.shake_effect = ScreenShake(0, 0)
+        self.shake_effect.finished = True
+        self.view = pygame.Rect(0, 0, WIDTH, HEIGHT) # Drawn view in world pixels
+        self.tile_bounds = (0, 0, 0, 0) # start_x, end_x, start_y, end_y of tiles in view
+        self._rect = pygame.Rect(0, 0, 0, 0) # Returned by apply
+
+    def set_map(self, width, height):
+        """Re-bound the camera for a new map; the next update snaps to the target"""
+        self.width = width
+        self.height = height
+        self.fresh = True
+
+    def shake(self, intensity=5, duration=0.3):
+        """Jolt the drawn view for a moment; the simulated offset is untouched"""
+        self.shake_effect.reset(intensity, duration)
+
     def apply(self, entity):
-        """Apply camera offset to entity position"""
-        return entity.image_rect.move(self.camera.topleft)
-    
+        """Screen rect of an entity, interpolated between its last two steps.
+        The Rect is reused: it's only valid until the next apply call."""
+        rect = self._rect
+        image_rect = entity.image_rect
+        x = image_rect.x + self.offset_x
+        y = image_rect.y + self.offset_y
+        prev = getattr(entity, 'prev_center', None)
+        if prev is not None and self.alpha < 1:
+            cx, cy = entity.rect.center
+            dx = prev[0] - cx
+            dy = prev[1] - cy
+            if abs(dx) + abs(dy) < TILESIZE: # Teleports snap
+                lag = 1 - self.alpha
+                x += round(dx * lag)
+                y += round(dy * lag)
+        rect.update(x, y, image_rect.width, image_rect.height)
+        return rect
+
     def apply_rect(self, rect):
         """Apply camera offset to a rect"""
-        return rect.move(self.camera.topleft)
-    
-    def update(self, target):
-        """Update camera position to follow target"""
-        # Center on target
-        x = -target.rect.centerx + WIDTH // 2
-        y = -target.rect.centery + HEIGHT // 2
-        
+        return rect.move(self.offset_x, self.offset_y)
+
+    def is_visible(self, entity):
+        return self.view.colliderect(entity.image_rect)
+
+    def update(self, target, dt=FIXED_DT):
+        """Ease the view towards target once it leaves the deadzone"""
+        tx, ty = target.rect.center
+        if self.fresh:
+            self.focus_x, self.focus_y = tx, ty
+        else:
+            # Only the part of the target's offset outside the deadzone pulls the camera
+            half_w, half_h = self.deadzone[0] / 2, self.deadzone[1] / 2
+            goal_x = min(max(self.focus_x, tx - half_w), tx + half_w)
+            goal_y = min(max(self.focus_y, ty - half_h), ty + half_h)
+            ease = 1 - math.exp(-self.smoothing * dt) if self.smoothing > 0 else 1
+            self.focus_x += (goal_x - self.focus_x) * ease
+            self.focus_y += (goal_y - self.focus_y) * ease
+
         # Limit scrolling to map bounds
-        x = min(0, x)  # Left
-        y = min(0, y)  # Top
-        x = max(-(self.width - WIDTH), x)  # Right
-        y = max(-(self.height - HEIGHT), y)  # Bottom
-        
-        self.camera = pygame.Rect(x, y, self.width, self.height)
-        
-        # Debug logging (throttled to avoid spam, maybe every 60 frames or just once on change? 
-        # For now, let's print if it's far off or just once per second equivalent)
-        # Actually, let's just print it. The user can scroll up.
-        # print(f"DEBUG: Camera: {self.camera.topleft}, Target: {target.rect.center}")
+        x = WIDTH // 2 - round(self.focus_x)
+        y = HEIGHT // 2 - round(self.focus_y)
+        x = max(-(self.width - WIDTH), min(0, x))
+        y = max(-(self.height - HEIGHT), min(0, y))
+
+        if self.fresh or abs(x - self.x) + abs(y - self.y) >= TILESIZE:
+            self.prev_x, self.prev_y = x, y
+            self.fresh = False
+        else:
+            self.prev_x, self.prev_y = self.x, self.y
+        self.x, self.y = x, y
+        if not self.shake_effect.finished:
+            self.shake_effect.update(dt)
+        self.interpolate(1.0)
+
+    def interpolate(self, alpha):
+        """Place the drawn view between the last two simulated positions"""
+        self.alpha = alpha
+        shake = self.shake_effect
+        self.offset_x = round(self.prev_x + (self.x - self.prev_x) * alpha) + shake.offset_x
+        self.offset_y = round(self.prev_y + (self.y - self.prev_y) * alpha) + shake.offset_y
+        view = self.view
+        view.x = -self.offset_x
+        view.y = -self.offset_y
+        self.tile_bounds = (max(0, view.x // TILESIZE), min(self.width // TILESIZE, view.right // TILESIZE + 1),
+                            max(0, view.y // TILESIZE), min(self.height // TILESIZE, view.bottom // TILESIZE + 1))
@@ -4,6 +4,10 @@ import random
 
 class CombatEffect:
     def __init__(self, duration):
+        self.reset(duration)
+
+    def reset(self, duration):
+        """Re-arm the effect; pooled effects call this instead of __init__"""
         self.duration = duration
         self.timer = 0
         self.finished = False
@@ -17,25 +21,40 @@ class CombatEffect:
         pass
 
 class FlashEffect(CombatEffect):
+    _overlay = None # Shared full-screen surface, refilled per draw
+
     def __init__(self, color=(255, 255, 255), duration=0.1):
-        super().__init__(duration)
+        self.reset(color, duration)
+
+    def reset(self, color=(255, 255, 255), duration=0.1):
+        super().reset(duration)
         self.color = color
 
     def draw(self, surface):
-        s = pygame.Surface(surface.get_size())
-        s.set_alpha(128) # Semi-transparent
-        s.fill(self.color)
-        surface.blit(s, (0, 0))
+        overlay = FlashEffect._overlay
+        if overlay is None or overlay.get_size() != surface.get_size():
+            overlay = FlashEffect._overlay = pygame.Surface(surface.get_size())
+            overlay.set_alpha(128) # Semi-transparent
+        overlay.fill(self.color)
+        surface.blit(overlay, (0, 0))
 
 class DamageNumber(CombatEffect):
+    _font = None # Built on first use, pygame.font must be initialised
+
     def __init__(self, value, x, y, duration=0.8, color=(255, 255, 255)):
-        super().__init__(duration)
+        self.reset(value, x, y, duration, color)
+
+    def reset(self, value, x, y, duration=0.8, color=(255, 255, 255)):
+        super().reset(duration)
         self.value = str(value)
         self.x = x
         self.y = y
         self.vy = -50 # Moves up
         self.color = color
-        self.font = pygame.font.Font(None, 36)
+        if DamageNumber._font is None:
+            DamageNumber._font = pygame.font.Font(None, 36)
+        self.font = DamageNumber._font
+        self.text_surf = self.font.render(self.value, True, self.color)
 
     def update(self, dt):
         super().update(dt)
@@ -43,12 +62,14 @@ class DamageNumber(CombatEffect):
         self.vy += 100 * dt # Gravity attempt? Or just slow down
 
     def draw(self, surface):
-        text_surf = self.font.render(self.value, True, self.color)
-        surface.blit(text_surf, (self.x, self.y))
+        surface.blit(self.text_surf, (self.x, self.y))
 
 class ScreenShake(CombatEffect):
     def __init__(self, intensity=5, duration=0.3):
-        super().__init__(duration)
+        self.reset(intensity, duration)
+
+    def reset(self, intensity=5, duration=0.3):
+        super().reset(duration)
         self.intensity = intensity
         self.offset_x = 0
         self.offset_y = 0
@@ -65,3 +86,19 @@ class ScreenShake(CombatEffect):
     # Shake is special, it needs to be applied to the render transform or offset drawing
     # Ideally Battle.draw calls this before drawing?
     # Or we verify it modifies a 'camera' offset in Battle?
+
+class EffectPool:
+    """Free lists of finished effects, keyed by class"""
+    def __init__(self):
+        self.free = {}
+
+    def acquire(self, effect_class, *args, **kwargs):
+        free = self.free.get(effect_class)
+        if free:
+            effect = free.pop()
+            effect.reset(*args, **kwargs)
+            return effect
+        return effect_class(*args, **kwargs)
+
+    def release(self, effect):
+        self.free.setdefault(type(effect), []).append(effect)
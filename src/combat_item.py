@@ -11,19 +11,25 @@ class CombatItem:
         self.description = data.get("description", "")
 
 class ItemDatabase:
-    def __init__(self):
+    def __init__(self, data=None):
+        """data: already parsed items.json (e.g. from DataManager); read from disk if None"""
         self.items = {}
-        self.load_items()
+        if data is None:
+            self.load_items()
+        else:
+            self.build(data)
 
     def load_items(self):
         path = os.path.join(os.path.dirname(__file__), 'data', 'items.json')
         if os.path.exists(path):
             with open(path, 'r') as f:
-                data = json.load(f)
-                for item_id, item_data in data.items():
-                    self.items[item_id] = CombatItem(item_id, item_data)
+                self.build(json.load(f))
         else:
             print("Warning: items.json not found.")
 
+    def build(self, data):
+        for item_id, item_data in data.items():
+            self.items[item_id] = CombatItem(item_id, item_data)
+
     def get_item(self, item_id):
         return self.items.get(item_id)
@@ -0,0 +1,174 @@
+# DragonQuest/src/combat_log.py
+import struct
+import numpy as np
+from settings import COMBAT_LOG_CAPACITY
+
+# Action codes stored in CombatLog events
+JOIN = 0        # Combatant enters the battle (hp = starting HP, label = name)
+DICE = 1        # Dice allocated (roll = total bonus)
+ATTACK = 2
+MAGIC = 3
+ITEM = 4
+HEAL = 5
+STATUS = 6      # Status applied (status = effect name)
+MISS = 7
+SUMMON = 8
+DEFEATED = 9
+RUN = 10        # crit flag doubles as "escaped"
+VICTORY = 11
+DEFEAT = 12
+
+ACTION_NAMES = ["join", "dice", "attack", "magic", "item", "heal", "status", "miss",
+                "summon", "defeated", "run", "victory", "defeat"]
+
+# One fixed-size record per event. actor/target are battle-local slots
+# (0 is the hero, then combatants in the order they joined); label and
+# status index the log's string table, 0 meaning none.
+EVENT_DTYPE = np.dtype([
+    ("battle", "<u4"),
+    ("turn", "<u2"),
+    ("action", "u1"),
+    ("actor", "u1"),
+    ("target", "u1"),
+    ("crit", "u1"),
+    ("roll", "<i2"),
+    ("damage", "<i4"),
+    ("hp", "<i4"),      # Target HP after the event
+    ("status", "<u2"),
+    ("label", "<u2"),
+])
+
+LOG_MAGIC = b"DQCL"
+LOG_VERSION = 1
+LOG_HEADER_FORMAT = "<4sHHI" # magic, version, string count, event count
+
+class CombatLog:
+    """Append-only ring buffer of combat events. Oldest events are overwritten once full."""
+    def __init__(self, capacity=COMBAT_LOG_CAPACITY):
+        self.events = np.zeros(capacity, dtype=EVENT_DTYPE)
+        self.capacity = capacity
+        self.head = 0   # Next write position
+        self.count = 0
+        self.strings = [""]
+        self.string_ids = {"": 0}
+        self.battle_id = 0
+
+    def intern(self, text):
+        if not text:
+            return 0
+        string_id = self.string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(text)
+            self.string_ids[text] = string_id
+        return string_id
+
+    def begin_battle(self):
+        self.battle_id += 1
+        return self.battle_id
+
+    def append(self, action, actor=0, target=0, turn=0, roll=0, damage=0, hp=0, crit=False, status=None, label=None, battle=None):
+        event = self.events[self.head]
+        event["battle"] = self.battle_id if battle is None else battle
+        event["turn"] = turn
+        event["action"] = action
+        event["actor"] = actor
+        event["target"] = target
+        event["crit"] = crit
+        event["roll"] = roll
+        event["damage"] = damage
+        event["hp"] = hp
+        event["status"] = self.intern(status)
+        event["label"] = self.intern(label)
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def view(self):
+        """Events oldest first (a copy when the buffer has wrapped)"""
+        if self.count < self.capacity:
+            return self.events[:self.count]
+        return np.concatenate((self.events[self.head:], self.events[:self.head]))
+
+    def battle_events(self, battle_id):
+        events = self.view()
+        return events[events["battle"] == battle_id]
+
+    def replay(self, battle_id):
+        """Walk a recorded battle, yielding (event, {slot: hp}) after each event"""
+        hp = {}
+        for event in self.battle_events(battle_id):
+            if event["action"] in (JOIN, ATTACK, MAGIC, ITEM, HEAL, DEFEATED):
+                hp[int(event["target"])] = int(event["hp"])
+            yield event, dict(hp)
+
+    def names(self, battle_id):
+        """Slot -> combatant name for a recorded battle"""
+        events = self.battle_events(battle_id)
+        joins = events[events["action"] == JOIN]
+        return {int(e["target"]): self.strings[e["label"]] for e in joins}
+
+    def describe(self, event, names=None):
+        names = names or {}
+        actor = names.get(int(event["actor"]), f"#{event['actor']}")
+        target = names.get(int(event["target"]), f"#{event['target']}")
+        action = ACTION_NAMES[event["action"]]
+        text = f"[{event['turn']}] {actor} {action} {target}"
+        if event["label"]:
+            text += f" ({self.strings[event['label']]})"
+        if event["damage"]:
+            text += f" {event['damage']}"
+        if event["crit"]:
+            text += " !"
+        if event["status"]:
+            text += f" +{self.strings[event['status']]}"
+        return text
+
+    def summarize(self):
+        """Per-action counts, damage totals and crit rate over everything in the buffer"""
+        events = self.view()
+        actions = events["action"]
+        counts = np.bincount(actions, minlength=len(ACTION_NAMES))
+        damage = np.bincount(actions, weights=events["damage"], minlength=len(ACTION_NAMES))
+        hits = np.isin(actions, (ATTACK, MAGIC))
+        return {
+            "battles": len(np.unique(events["battle"])),
+            "counts": {name: int(counts[i]) for i, name in enumerate(ACTION_NAMES) if counts[i]},
+            "damage": {name: int(damage[i]) for i, name in enumerate(ACTION_NAMES) if damage[i]},
+            "crit_rate": float(events["crit"][hits].mean()) if hits.any() else 0.0,
+        }
+
+    def to_bytes(self):
+        events = self.view()
+        parts = [struct.pack(LOG_HEADER_FORMAT, LOG_MAGIC, LOG_VERSION, len(self.strings), len(events))]
+        for text in self.strings:
+            encoded = text.encode("utf-8")
+            parts.append(struct.pack("<H", len(encoded)) + encoded)
+        parts.append(events.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, blob, capacity=COMBAT_LOG_CAPACITY):
+        magic, version, string_count, event_count = struct.unpack_from(LOG_HEADER_FORMAT, blob, 0)
+        if magic != LOG_MAGIC:
+            raise ValueError("Not a combat log")
+        if version > LOG_VERSION:
+            raise ValueError(f"Combat log version {version} is newer than supported ({LOG_VERSION})")
+        offset = struct.calcsize(LOG_HEADER_FORMAT)
+        log = cls(max(capacity, event_count))
+        log.strings = []
+        for _ in range(string_count):
+            (length,) = struct.unpack_from("<H", blob, offset)
+            offset += 2
+            log.strings.append(blob[offset:offset + length].decode("utf-8"))
+            offset += length
+        log.string_ids = {text: i for i, text in enumerate(log.strings)}
+        events = np.frombuffer(blob, dtype=EVENT_DTYPE, count=event_count, offset=offset)
+        log.events[:event_count] = events
+        log.head = event_count % log.capacity
+        log.count = event_count
+        log.battle_id = int(events["battle"].max()) if event_count else 0
+        return log
+
+    def export(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
@@ -10,6 +10,10 @@ class AIComponent(Component):
         self.wander_timer = 0
         self.wander_interval = random.uniform(1.0, 3.0)
 
+    def reset(self):
+        self.wander_timer = 0
+        self.wander_interval = random.uniform(1.0, 3.0)
+
     def update(self, dt):
         if not self.movement_component:
             return
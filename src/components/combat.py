@@ -1,6 +1,12 @@
 # DragonQuest/src/components/combat.py
 import numpy as np
 from components.component import Component
+from status_effects import get_status_definition
+
+# Derived stat slots. The first four are stored in stats; intelligence and
+# vitality come only from jobs and equipment.
+STAT_INDEX = {"strength": 0, "defense": 1, "agility": 2, "luck": 3, "intelligence": 4, "vitality": 5}
+BASE_STAT_COUNT = 4
 
 class CombatComponent(Component):
     def __init__(self, owner, hp, mp, stats, xp_reward=0, gold_reward=0):
@@ -12,7 +18,26 @@ class CombatComponent(Component):
         self.stats = np.array(stats, dtype=np.int16)
         self.xp_reward = xp_reward
         self.gold_reward = gold_reward
+        self.status_effects = {} # status id -> battle turns left
+
+        # Stacked modifiers as (source, stat index, amount, multiplier): statuses,
+        # equipment ("equip:<slot>") and the current job ("job").
+        self.modifiers = []
+        self._flat = np.zeros(len(STAT_INDEX), dtype=np.float32)
+        self._scale = np.ones(len(STAT_INDEX), dtype=np.float32)
+        self._modifiers_dirty = False
+        # Final per-stat values read by get_attribute, rebuilt only when invalidated
+        self._derived = None
+
+    def reset(self, hp, mp, stats):
+        """Back to a fresh combatant, e.g. when a pooled enemy respawns"""
+        self.hp = self.max_hp = hp
+        self.mp = self.max_mp = mp
+        self.stats[:] = stats
         self.status_effects = {}
+        self.modifiers = []
+        self._modifiers_dirty = True
+        self._derived = None
 
     def take_damage(self, amount):
         self.hp -= amount
@@ -32,29 +57,92 @@ class CombatComponent(Component):
     def is_alive(self):
         return self.hp > 0
 
+    def invalidate_stats(self):
+        """Call after changing base stats directly (level-up, power-ups, loading)"""
+        self._derived = None
+
+    def add_modifier(self, source, stat, amount, multiplier=False):
+        """Stack a modifier. multiplier=True adds amount to the stat's scale (0.1 = +10%)."""
+        index = STAT_INDEX[stat] if isinstance(stat, str) else stat
+        self.modifiers.append((source, index, amount, multiplier))
+        self._modifiers_dirty = True
+        self._derived = None
+
+    def set_modifiers(self, source, stat_bonuses):
+        """Replace one source's modifiers with flat bonuses from a stat dict.
+        Keys that aren't derived stats (crit_chance, evasion...) are ignored."""
+        self.remove_modifiers(source)
+        for stat, amount in stat_bonuses.items():
+            if stat in STAT_INDEX and amount:
+                self.add_modifier(source, stat, amount)
+
+    def remove_modifiers(self, source):
+        kept = [modifier for modifier in self.modifiers if modifier[0] != source]
+        if len(kept) != len(self.modifiers):
+            self.modifiers = kept
+            self._modifiers_dirty = True
+            self._derived = None
+
+    def _rebuild_modifiers(self):
+        flat = np.zeros(len(STAT_INDEX), dtype=np.float32)
+        scale = np.ones(len(STAT_INDEX), dtype=np.float32)
+        for _, index, amount, multiplier in self.modifiers:
+            if multiplier:
+                scale[index] += amount
+            else:
+                flat[index] += amount
+        self._flat = flat
+        self._scale = scale
+        self._modifiers_dirty = False
+
+    def _rebuild_derived(self):
+        if self._modifiers_dirty:
+            self._rebuild_modifiers()
+        base = np.zeros(len(STAT_INDEX), dtype=np.float32)
+        base[:BASE_STAT_COUNT] = self.stats
+        totals = np.maximum(0, (base + self._flat) * self._scale)
+        self._derived = [int(value) for value in totals]
+
     def get_attribute(self, attr):
-        attr_map = {"strength": 0, "defense": 1, "agility": 2, "luck": 3}
-        if attr in attr_map:
-            base = self.stats[attr_map[attr]]
-        else:
-            base = getattr(self.owner, attr, 0)
-            
-        bonus = 0
-        # Equipment bonuses will be handled by the InventoryComponent
-        # For now, just return the base stat
-        return base
+        index = STAT_INDEX.get(attr)
+        if index is None:
+            return getattr(self.owner, attr, 0)
+        if self._derived is None:
+            self._rebuild_derived()
+        return self._derived[index]
 
     def apply_status_effect(self, effect_name, duration):
+        source = "status:" + effect_name
+        self.remove_modifiers(source) # Reapplying refreshes rather than stacks
+        for stat, amount, multiplier in get_status_definition(effect_name).modifiers:
+            self.add_modifier(source, stat, amount, multiplier)
         self.status_effects[effect_name] = duration
 
+    def remove_status_effect(self, effect_name):
+        self.status_effects.pop(effect_name, None)
+        self.remove_modifiers("status:" + effect_name)
+
+    def set_status_effects(self, status_effects):
+        """Replace all statuses, e.g. when loading a save"""
+        for effect_name in list(self.status_effects):
+            self.remove_status_effect(effect_name)
+        for effect_name, duration in status_effects.items():
+            self.apply_status_effect(effect_name, duration)
+
     def has_status_effect(self, effect_name):
         return self.status_effects.get(effect_name, 0) > 0
 
-    def update(self, dt):
-        # Update status effects
+    def can_act(self):
+        return not any(get_status_definition(name).skip_turn for name in self.status_effects)
+
+    def tick_status_effects(self):
+        """Advance statuses by one battle turn; returns the ids that wore off"""
+        expired = []
         for effect, duration in list(self.status_effects.items()):
             duration -= 1
             if duration <= 0:
-                del self.status_effects[effect]
+                self.remove_status_effect(effect)
+                expired.append(effect)
             else:
                 self.status_effects[effect] = duration
+        return expired
@@ -1,23 +1,95 @@
 # DragonQuest/src/components/inventory.py
 from components.component import Component
+from components.combat import CombatComponent
+
+class ItemStack:
+    """Identical items (same item_id and affix) kept as one item and a count"""
+    __slots__ = ("item", "count")
+
+    def __init__(self, item, count=0):
+        self.item = item
+        self.count = count
+
+def stack_key(item):
+    return (item.item_id, item.affix)
 
 class InventoryComponent(Component):
     def __init__(self, owner, items=None, equipment=None):
         super().__init__(owner)
+        self.stacks = {} # (item_id, affix) -> ItemStack, in the order first picked up
+        self.by_type = {} # item type -> {(item_id, affix): ItemStack}
+        self.counts = {} # item_id -> total held, over every affix
         self.items = items if items is not None else []
         self.equipment = equipment if equipment is not None else {"weapon": None, "armor": None, "accessory": None}
+        self.equipped_ids = set()
+        self.refresh_equipment()
+
+    @property
+    def items(self):
+        """Every held item as a flat list (a stack repeats its item)"""
+        return [stack.item for stack in self.stacks.values() for _ in range(stack.count)]
+
+    @items.setter
+    def items(self, items):
+        self.stacks = {}
+        self.by_type = {}
+        self.counts = {}
+        for item in items:
+            self.add_item(item)
+
+    def refresh_equipment(self):
+        """Push equipment stats (affixes included) into combat modifiers"""
+        self.equipped_ids = {item.item_id for item in self.equipment.values() if item}
+        combat = self.owner.get_component(CombatComponent)
+        if combat:
+            for slot, item in self.equipment.items():
+                combat.set_modifiers("equip:" + slot, item.stats if item else {})
+
+    def is_equipped(self, item_id):
+        return item_id in self.equipped_ids
 
-    def add_item(self, item):
-        self.items.append(item)
+    def add_item(self, item, count=1):
+        key = stack_key(item)
+        stack = self.stacks.get(key)
+        if stack is None:
+            stack = self.stacks[key] = ItemStack(item)
+            self.by_type.setdefault(item.type, {})[key] = stack
+        stack.count += count
+        self.counts[item.item_id] = self.counts.get(item.item_id, 0) + count
+        return stack
 
-    def remove_item(self, item):
-        self.items.remove(item)
+    def remove_item(self, item, count=1):
+        """Take count of item's kind out of the bag; False if there aren't that many"""
+        key = stack_key(item)
+        stack = self.stacks.get(key)
+        if stack is None or stack.count < count:
+            return False
+        stack.count -= count
+        self.counts[item.item_id] -= count
+        if not self.counts[item.item_id]:
+            del self.counts[item.item_id]
+        if not stack.count:
+            del self.stacks[key]
+            del self.by_type[item.type][key]
+        return True
+
+    def count(self, item_id):
+        return self.counts.get(item_id, 0)
+
+    def stack_count(self, item):
+        stack = self.stacks.get(stack_key(item))
+        return stack.count if stack else 0
+
+    def stacks_of_type(self, *item_types):
+        """Stacks of the given types, e.g. everything usable in battle"""
+        return [stack for item_type in item_types for stack in self.by_type.get(item_type, {}).values()]
 
     def equip(self, item):
         if item.slot in self.equipment:
             self.unequip(item.slot)
             self.equipment[item.slot] = item
-            self.items.remove(item)
+            self.remove_item(item)
+            self.refresh_equipment()
             return True
         return False
 
@@ -26,5 +98,37 @@ class InventoryComponent(Component):
             item = self.equipment[slot]
             self.equipment[slot] = None
             self.add_item(item)
+            self.refresh_equipment()
             return True
         return False
+
+    def to_dict(self):
+        """Serialize stacks as template ids plus affix and count"""
+        return {
+            "items": [_item_record(stack.item, stack.count) for stack in self.stacks.values()],
+            "equipment": {slot: _item_record(item) if item else None for slot, item in self.equipment.items()},
+        }
+
+    def from_dict(self, data):
+        self.items = []
+        for record in data.get("items", []):
+            item = _item_from_record(record)
+            if item:
+                self.add_item(item, record.get("count", 1))
+        self.equipment = {"weapon": None, "armor": None, "accessory": None}
+        for slot, record in data.get("equipment", {}).items():
+            self.equipment[slot] = _item_from_record(record) if record else None
+        self.refresh_equipment()
+
+def _item_record(item, count=1):
+    record = {"id": item.item_id, "affix": item.affix}
+    if count != 1:
+        record["count"] = count
+    return record
+
+def _item_from_record(record):
+    from inventory import create_item
+    item = create_item(record["id"])
+    if item and record.get("affix"):
+        item.add_affix(record["affix"])
+    return item
@@ -22,18 +22,18 @@ class SerializationComponent(Component):
             "mp": self.combat_component.mp,
             "max_mp": self.combat_component.max_mp,
             "stats": {
-                "strength": self.combat_component.stats[0],
-                "defense": self.combat_component.stats[1],
-                "agility": self.combat_component.stats[2],
-                "luck": self.combat_component.stats[3]
+                "strength": int(self.combat_component.stats[0]),
+                "defense": int(self.combat_component.stats[1]),
+                "agility": int(self.combat_component.stats[2]),
+                "luck": int(self.combat_component.stats[3])
             },
-            "skills": self.owner.skills,
+            "skills": list(self.owner.skills),
             "job": self.owner.job,
             "jp": self.owner.jp,
-            "mastered_jobs": self.owner.mastered_jobs,
-            "status_effects": self.combat_component.status_effects,
-            "inventory": self.inventory_component.items,
-            "equipment": self.inventory_component.equipment,
+            "mastered_jobs": list(self.owner.mastered_jobs),
+            "known_spells": list(self.owner.known_spells),
+            "status_effects": dict(self.combat_component.status_effects),
+            # Items are saved separately through InventoryComponent.to_dict
         }
 
     def from_dict(self, data):
@@ -52,10 +52,13 @@ class SerializationComponent(Component):
         self.combat_component.stats[1] = stats_data.get("defense", 3)
         self.combat_component.stats[2] = stats_data.get("agility", 4)
         self.combat_component.stats[3] = stats_data.get("luck", 3)
+        self.combat_component.invalidate_stats()
         self.owner.skills = data.get("skills", [])
-        self.owner.job = data.get("job", "warrior")
+        if hasattr(self.owner, 'set_job'):
+            self.owner.set_job(data.get("job", "warrior"))
+        else:
+            self.owner.job = data.get("job", "warrior")
         self.owner.jp = data.get("jp", 0)
         self.owner.mastered_jobs = data.get("mastered_jobs", [])
-        self.combat_component.status_effects = data.get("status_effects", {})
-        self.inventory_component.items = data.get("inventory", [])
-        self.inventory_component.equipment = data.get("equipment", {"weapon": None, "armor": None, "accessory": None})
+        self.owner.known_spells = data.get("known_spells", self.owner.known_spells)
+        self.combat_component.set_status_effects(data.get("status_effects", {}))
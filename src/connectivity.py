@@ -0,0 +1,102 @@
+# DragonQuest/src/connectivity.py
+import numpy as np
+
+def label_regions(collision):
+    """Label the 4-connected walkable regions of a collision layer: 0 for blocked
+    tiles, 1..count for regions. Each pass spreads the smallest tile index to the
+    neighbours, then pointer-jumps through it, so few whole-array passes are needed."""
+    free = np.asarray(collision) == 0
+    height, width = free.shape
+    n = height * width
+    labels = np.where(free, np.arange(n).reshape(height, width), n)
+    while True:
+        spread = labels.copy()
+        np.minimum(spread[:, 1:], labels[:, :-1], out=spread[:, 1:])
+        np.minimum(spread[:, :-1], labels[:, 1:], out=spread[:, :-1])
+        np.minimum(spread[1:], labels[:-1], out=spread[1:])
+        np.minimum(spread[:-1], labels[1:], out=spread[:-1])
+        spread[~free] = n
+        # A label is always the index of a tile in the same region, so follow it
+        lookup = np.append(spread.ravel(), n)
+        spread = lookup[lookup[spread]]
+        if np.array_equal(spread, labels):
+            break
+        labels = spread
+
+    roots, inverse = np.unique(labels, return_inverse=True)
+    regions = inverse.reshape(height, width).astype(np.int32) + 1
+    regions[~free] = 0
+    count = len(roots) - (1 if roots[-1] == n else 0)
+    return regions, count
+
+class RegionMap:
+    """Connected walkable regions of a collision layer, for reachability checks"""
+    def __init__(self, collision):
+        self.labels, self.count = label_regions(collision)
+        self.height, self.width = self.labels.shape
+        self.sizes = np.bincount(self.labels.ravel(), minlength=self.count + 1)
+        self.sizes[0] = 0 # Blocked tiles aren't a region
+
+    def region_at(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.labels[y, x])
+        return 0
+
+    def connected(self, a, b):
+        """Whether tiles a and b are both walkable and reachable from each other"""
+        region = self.region_at(*a)
+        return region != 0 and region == self.region_at(*b)
+
+    def largest(self):
+        return int(np.argmax(self.sizes)) if self.count else 0
+
+    def mask(self, region):
+        return self.labels == region
+
+    def nearest(self, x, y, region):
+        """The tile of region closest to (x, y), or (x, y) if the region is empty"""
+        ys, xs = np.nonzero(self.labels == region)
+        if not len(xs):
+            return x, y
+        i = int(np.argmin((xs - x) ** 2 + (ys - y) ** 2))
+        return int(xs[i]), int(ys[i])
+
+    def edge(self, region):
+        """Tiles of region with a neighbour outside it"""
+        inside = self.labels == region
+        padded = np.pad(inside, 1, constant_values=False)
+        interior = padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:]
+        return np.nonzero(inside & ~interior)
+
+def carve(ground, collision, a, b, floor_tile):
+    """Open an L-shaped corridor from tile a to tile b, leaving walkable ground alone"""
+    (ax, ay), (bx, by) = a, b
+    xs = np.arange(min(ax, bx), max(ax, bx) + 1)
+    ys = np.arange(min(ay, by), max(ay, by) + 1)
+    tiles = [(np.full(len(xs), ay), xs), (ys, np.full(len(ys), bx))]
+    for ty, tx in tiles:
+        blocked = collision[ty, tx] != 0
+        ground[ty[blocked], tx[blocked]] = floor_tile
+        collision[ty, tx] = 0
+
+def connect_regions(ground, collision, target, floor_tile, min_size=1, points=()):
+    """Carve corridors until every region of at least min_size tiles, and the
+    region of every tile in points, is reachable from target. Largest stray
+    region first, each joined at its closest edge tiles. Returns the RegionMap
+    of the final layout."""
+    points = list(points)
+    while True:
+        regions = RegionMap(collision)
+        home = regions.region_at(*target)
+        if home == 0:
+            return regions
+        strays = {r for r in range(1, regions.count + 1) if r != home and regions.sizes[r] >= min_size}
+        strays.update(r for r in map(lambda p: regions.region_at(*p), points) if r not in (0, home))
+        if not strays:
+            return regions
+        stray = max(strays, key=lambda r: regions.sizes[r])
+        sy, sx = regions.edge(stray)
+        hy, hx = regions.edge(home)
+        dist = np.abs(sx[:, None] - hx[None, :]) + np.abs(sy[:, None] - hy[None, :])
+        i, j = np.unravel_index(int(np.argmin(dist)), dist.shape)
+        carve(ground, collision, (int(sx[i]), int(sy[i])), (int(hx[j]), int(hy[j])), floor_tile)
@@ -3,10 +3,39 @@ import json
 import os
 from settings import *
 
+class DialogueRule:
+    """One dialogue entry and the flags it needs, as a FlagRegistry bitmask"""
+    __slots__ = ("mask", "entry")
+
+    def __init__(self, mask, entry):
+        self.mask = mask
+        self.entry = entry
+
+class CompiledDialogue:
+    """An NPC's dialogue as rules in priority order; "default" always comes last"""
+    def __init__(self, npc_data, flags):
+        self.flags = flags
+        ranked = []
+        for order, (key, entry) in enumerate(npc_data.items()):
+            # An entry needs the flag it's keyed by, or an explicit "requires" list
+            required = [] if key == "default" else entry.get("requires", [key])
+            mask = flags.mask(required)
+            # Higher "priority" first, then the more specific rule, then file order
+            ranked.append((-entry.get("priority", 0), -len(required), order, DialogueRule(mask, entry)))
+        ranked.sort(key=lambda rank: rank[:3])
+        self.rules = [rank[3] for rank in ranked]
+
+    def select(self):
+        for rule in self.rules:
+            if self.flags.test(rule.mask):
+                return rule.entry
+        return {"text": "..."}
+
 class DialogueManager:
     def __init__(self, game):
         self.game = game
         self.dialogue_data = {}
+        self.compiled = {} # npc_id -> CompiledDialogue
         self.load_dialogue()
         
     def load_dialogue(self):
@@ -14,41 +43,20 @@ class DialogueManager:
         if os.path.exists(path):
             with open(path, 'r') as f:
                 self.dialogue_data = json.load(f)
+        flags = self.game.quest_manager.flags
+        self.compiled = {npc_id: CompiledDialogue(npc_data, flags) for npc_id, npc_data in self.dialogue_data.items()}
                 
     def get_dialogue(self, npc_id):
-        if npc_id not in self.dialogue_data:
+        compiled = self.compiled.get(npc_id)
+        if compiled is None:
             return "..."
-            
-        npc_data = self.dialogue_data[npc_id]
-        
-        # Check flags to determine which dialogue to show
-        # This is a simple priority system: check specific flags first
-        
-        # Example: Check for quest completion or active state
-        # For now, we'll implement a basic check based on the JSON structure
-        # We expect keys like "with_pendant", "quest_active", etc.
-        # We need to map game flags to these keys
-        
-        flags = self.game.quest_manager.flags
-        
-        # Iterate through keys in npc_data to find a matching flag
-        # This assumes keys in JSON match flag names, except "default"
-        for key in npc_data:
-            if key == "default":
-                continue
-            if flags.get(key, False):
-                # Found a matching flag that is true
-                # Check if there's a "next" or if this is the one
-                # For simple logic, return this one
-                return self.process_dialogue_entry(npc_data[key])
-                
-        return self.process_dialogue_entry(npc_data.get("default", {"text": "..."}))
+        return self.process_dialogue_entry(compiled.select())
 
     def process_dialogue_entry(self, entry):
         # Set flag if specified
         if "flag_set" in entry:
             flag = entry["flag_set"]
-            self.game.quest_manager.flags[flag] = True
+            self.game.quest_manager.set_flag(flag)
             self.game.logger.log(f"Flag set: {flag}")
             
         # Ensure text is a list for multi-page support
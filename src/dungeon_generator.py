@@ -4,6 +4,7 @@ import random
 import numpy as np
 from settings import *
 import pygame
+from connectivity import connect_regions
 
 class Segment:
     def __init__(self, data):
@@ -223,8 +224,10 @@ class DungeonGenerator:
         self.FLOOR = 6
         self.DOOR = 7 # Placeholder ID
         
-    def generate_dungeon(self, width=50, height=50, num_rooms=10):
+    def generate_dungeon(self, width=50, height=50, num_rooms=10, seed=None):
         """Generate a room-based dungeon"""
+        seed = self.seed if seed is None else seed
+        rng = random.Random(seed)
         ground = np.full((height, width), self.WALL, dtype=np.int8)
         collision = np.ones((height, width), dtype=np.int8)
         decoration = np.zeros((height, width), dtype=np.int8)
@@ -232,10 +235,10 @@ class DungeonGenerator:
         rooms = []
         
         for _ in range(num_rooms):
-            w = random.randint(6, 12)
-            h = random.randint(6, 12)
-            x = random.randint(1, width - w - 1)
-            y = random.randint(1, height - h - 1)
+            w = rng.randint(6, 12)
+            h = rng.randint(6, 12)
+            x = rng.randint(1, width - w - 1)
+            y = rng.randint(1, height - h - 1)
             
             new_room = pygame.Rect(x, y, w, h)
             
@@ -254,7 +257,7 @@ class DungeonGenerator:
                     prev_center = rooms[-1].center
                     new_center = new_room.center
                     
-                    if random.randint(0, 1):
+                    if rng.randint(0, 1):
                         self._create_h_tunnel(prev_center[0], new_center[0], prev_center[1], ground, collision)
                         self._create_v_tunnel(prev_center[1], new_center[1], new_center[0], ground, collision)
                     else:
@@ -272,6 +275,8 @@ class DungeonGenerator:
         start_room = rooms[0]
         spawn_x = start_room.centerx
         spawn_y = start_room.centery
+        # Rooms are chained by tunnels, this only catches anything left sealed off
+        connect_regions(ground, collision, (spawn_x, spawn_y), self.FLOOR)
         
         # Boss Room (Last room)
         boss_room = rooms[-1]
@@ -280,15 +285,15 @@ class DungeonGenerator:
         # Other rooms
         for room in rooms[1:-1]:
             # Random chance for enemies
-            if random.random() < 0.7:
-                num_enemies = random.randint(1, 3)
+            if rng.random() < 0.7:
+                num_enemies = rng.randint(1, 3)
                 for _ in range(num_enemies):
-                    ex = random.randint(room.left + 1, room.right - 2)
-                    ey = random.randint(room.top + 1, room.bottom - 2)
+                    ex = rng.randint(room.left + 1, room.right - 2)
+                    ey = rng.randint(room.top + 1, room.bottom - 2)
                     entities.append({"type": "enemy", "name": "slime", "x": ex, "y": ey})
             
             # Random chance for puzzle/chest
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 # Add a door near the chest
                 entities.append({"type": "object", "class": "Door", "x": room.centerx + 2, "y": room.centery, "locked": True})
                 # Add a switch that will open the door (no linking yet)
@@ -298,6 +303,8 @@ class DungeonGenerator:
             "id": "dungeon_01",
             "width": width,
             "height": height,
+            "seed": seed,
+            "recipe": {"generator": "dungeon", "seed": seed, "width": width, "height": height, "num_rooms": num_rooms},
             "layers": {
                 "ground": ground,
                 "decoration": decoration,
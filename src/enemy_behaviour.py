@@ -0,0 +1,163 @@
+# DragonQuest/src/enemy_behaviour.py
+import random
+import numpy as np
+import combat_log
+from components.combat import CombatComponent
+
+# Stat indices of CombatComponent.stats
+STRENGTH, DEFENSE, AGILITY, LUCK = range(4)
+
+DEFAULT_ENEMY_SPELLS = ["fireball", "ice_bolt"]
+
+# attack_type -> handler(turn, enemies, combats, behaviours, damage_mult, player_def, rng)
+#   -> (damage array, messages, spells, roll array), one call for all enemies sharing the type
+ATTACK_HANDLERS = {}
+# handler id -> handler(turn, enemy, message) -> (message, skip_attack, damage_mult)
+SPECIAL_HANDLERS = {}
+# special_abilities key -> hook(turn, enemy, ability, message) -> message, run after the enemy attacks
+ABILITY_HOOKS = {}
+
+def attack_handler(attack_type):
+    def register(func):
+        ATTACK_HANDLERS[attack_type] = func
+        return func
+    return register
+
+def special_handler(handler_id):
+    def register(func):
+        SPECIAL_HANDLERS[handler_id] = func
+        return func
+    return register
+
+def ability_hook(ability_id):
+    def register(func):
+        ABILITY_HOOKS[ability_id] = func
+        return func
+    return register
+
+def infer_attack_type(enemy_type):
+    """Fallback for data without attack_type, decided once at compile time"""
+    if "archer" in enemy_type or "ranger" in enemy_type:
+        return "ranged"
+    if "wizard" in enemy_type or "mage" in enemy_type:
+        return "magic"
+    return "melee"
+
+class EnemyBehaviour:
+    """Compiled turn rules for one enemy type"""
+    __slots__ = ("enemy_type", "attack_type", "attack", "special", "hooks", "spells")
+
+    def __init__(self, enemy_type, data):
+        self.enemy_type = enemy_type
+        self.attack_type = data.get("attack_type") or infer_attack_type(enemy_type)
+        self.attack = ATTACK_HANDLERS.get(self.attack_type, ATTACK_HANDLERS["melee"])
+        self.special = SPECIAL_HANDLERS.get(data.get("behaviour", enemy_type))
+        abilities = data.get("special_abilities") or {}
+        self.hooks = [(ABILITY_HOOKS[key], ability) for key, ability in abilities.items() if key in ABILITY_HOOKS]
+        self.spells = data.get("spells", DEFAULT_ENEMY_SPELLS)
+
+class BehaviourTable:
+    """enemy_type -> EnemyBehaviour, compiled from enemies.json"""
+    def __init__(self, enemy_data=None):
+        self.enemy_data = enemy_data or {}
+        self.behaviours = {enemy_type: EnemyBehaviour(enemy_type, data) for enemy_type, data in self.enemy_data.items()}
+
+    def get(self, enemy_type):
+        behaviour = self.behaviours.get(enemy_type)
+        if behaviour is None:
+            # Types spawned without data (debug spawns) compile on first sight
+            behaviour = self.behaviours[enemy_type] = EnemyBehaviour(enemy_type, {})
+        return behaviour
+
+# --- Attack types ---
+# Each handler resolves every enemy of its type in one batch: stats are gathered
+# into arrays and hit/variance rolls are drawn together from the battle's rng.
+
+def gather_stat(combats, stat):
+    return np.fromiter((combat.get_attribute(stat) for combat in combats), dtype=np.float32, count=len(combats))
+
+@attack_handler("melee")
+def melee_attack(turn, enemies, combats, behaviours, damage_mult, player_def, rng):
+    enemy_str = gather_stat(combats, "strength") * 2
+    damage = np.maximum(1, enemy_str * damage_mult - player_def // 2)
+    rolls = rng.integers(-1, 2, len(enemies))
+    damage = (damage + rolls).astype(int)
+    messages = [f"{enemy.name} attacks for {dmg} damage!\n" for enemy, dmg in zip(enemies, damage)]
+    return damage, messages, [None] * len(enemies), rolls
+
+@attack_handler("ranged")
+def ranged_attack(turn, enemies, combats, behaviours, damage_mult, player_def, rng):
+    # Ranged: Ignores some defense, but lower accuracy check?
+    hits = rng.random(len(enemies)) < 0.9 # 90% hit rate
+    enemy_str = gather_stat(combats, "strength") * 2
+    damage = np.maximum(1, enemy_str * 0.8 * damage_mult - player_def // 4) # Armor piercing
+    rolls = np.where(hits, rng.integers(0, 3, len(enemies)), 0)
+    damage = np.where(hits, (damage + rolls).astype(int), 0)
+    messages = [f"{enemy.name} fires an arrow! Deals {dmg} damage!\n" if hit else f"{enemy.name} fires an arrow but misses!\n"
+                for enemy, dmg, hit in zip(enemies, damage, hits)]
+    if hits.any() and hasattr(turn.battle.game, 'sound_manager'): turn.battle.game.sound_manager.play("hit") # Use hit sound
+    return damage, messages, [None] * len(enemies), rolls
+
+@attack_handler("magic")
+def magic_attack(turn, enemies, combats, behaviours, damage_mult, player_def, rng):
+    # Magic: Uses INT, ignores Defense (maybe uses Magic Def?)
+    picks = rng.integers(0, 1 << 16, len(enemies))
+    rolls = np.fromiter((pick % len(behaviour.spells) for behaviour, pick in zip(behaviours, picks)), dtype=int, count=len(enemies))
+    spells = [behaviour.spells[roll] for behaviour, roll in zip(behaviours, rolls)] # The roll is the spell's index
+    enemy_int = gather_stat(combats, "intelligence") * 2
+    damage = (enemy_int * 1.5 * damage_mult).astype(int)
+    messages = [f"{enemy.name} casts {spell}! Deals {dmg} magic damage!\n" for enemy, spell, dmg in zip(enemies, spells, damage)]
+    if hasattr(turn.battle.game, 'sound_manager'): turn.battle.game.sound_manager.play("magic")
+    return damage, messages, spells, rolls
+
+# --- Ability hooks (special_abilities in enemies.json) ---
+
+@ability_hook("daze_on_attack")
+def daze_on_attack(turn, enemy, ability, message):
+    battle = turn.battle
+    if random.random() < ability['chance']:
+        battle.player.combat.apply_status_effect("dazed", ability['duration'])
+        battle.record(combat_log.STATUS, enemy, battle.player, status="dazed")
+        message += f"You are dazed by {enemy.name}'s attack!\n"
+        if hasattr(battle.game, 'message_log'):
+            battle.game.message_log.log_combat(f"Player is dazed for {ability['duration']} turns.")
+    return message
+
+# --- Special handlers, registered by enemy id (or "behaviour" in enemies.json) ---
+
+@special_handler("daryl_ledeay")
+def daryl_ledeay(turn, enemy, message):
+    # 5% Self Damage (Trip) - Reduced from 10%
+    if random.random() < 0.05:
+        combat = enemy.get_component(CombatComponent)
+        self_dmg = int(combat.max_hp * 0.10)
+        combat.take_damage(self_dmg)
+        turn.battle.record(combat_log.ATTACK, enemy, enemy, damage=self_dmg, label="trip")
+        message += f"\n{enemy.name} trips over a garden gnome! Takes {self_dmg} damage!\nDaryl: 'Dang it! That wasn't supposed to happen!'"
+        return message, True, 1.0 # Skip attack
+
+    # 10% Critical Hit (Lucky Swing) - Reduced from 15%
+    if random.random() < 0.10:
+        message += f"\n{enemy.name}: 'Woooo! See that, George? Musta been the new lucky socks!'"
+        return message, False, 2.5
+    return message, False, 1.0
+
+@special_handler("chicken_george")
+def chicken_george(turn, enemy, message):
+    battle = turn.battle
+    # 20% Pity Heal
+    if random.random() < 0.20:
+        heal_amount = int(battle.player.combat.max_hp * 0.15)
+        battle.player.combat.heal(heal_amount)
+        battle.record(combat_log.HEAL, enemy, battle.player, damage=heal_amount, label="energy_drink")
+        message += f"\n{enemy.name} tosses a Mystery Energy Drink at you! Recovered {heal_amount} HP!\nGeorge: 'Aw, shucks. Looks like we gotta try harder.'"
+        return message, True, 1.0 # Skip attack
+
+    # 10% Bud Light Boost (Buff Daryl)
+    if random.random() < 0.10:
+        daryl = next((e for e in battle.enemies if e.enemy_type == "daryl_ledeay"), None)
+        if daryl:
+            daryl.get_component(CombatComponent).add_modifier("bud_light", DEFENSE, 50)
+            message += f"\n{enemy.name} shares a cold one with Daryl! Daryl's Defense rose sharply!"
+            return message, True, 1.0 # Skip attack
+    return message, False, 1.0
@@ -0,0 +1,70 @@
+# DragonQuest/src/enemy_pool.py
+import pygame
+from settings import TILESIZE, SPRITE_SCALE_FACTOR
+
+class EnemyTemplate:
+    """Everything an enemy type needs that never changes: data fields and the
+    prebuilt image. Built once per type and shared by its instances."""
+    __slots__ = ("enemy_type", "name", "special_abilities", "attack_type", "max_hp", "stats",
+                 "xp_reward", "gold_reward", "scale", "image", "hitbox", "loot_table")
+
+    def __init__(self, game, enemy_type):
+        self.enemy_type = enemy_type
+        enemy_data = game.data_manager.get_data("enemies")
+        data = enemy_data.get(enemy_type) if enemy_data else None
+        sprite_id = "enemy/" + enemy_type
+        if data is None:
+            game.logger.warning(f"Enemy type '{enemy_type}' not found in data.")
+            data = {"name": "Unknown"}
+            sprite_id = "enemy/slime"
+
+        self.name = data.get("name", "Enemy")
+        self.special_abilities = data.get("special_abilities", [])
+        self.attack_type = data.get("attack_type", "melee")
+        self.max_hp = data.get("max_hp", 10)
+        self.stats = data.get("stats", [1, 1, 1, 1])
+        self.xp_reward = data.get("xp_reward", 0)
+        self.gold_reward = data.get("gold_reward", 0)
+        self.scale = data.get("scale", 1)
+        self.hitbox = data.get("hitbox")
+        self.loot_table = data.get("loot_table") # Rolled in loot_tables on every spawn
+
+        # Sized by "scale" and tinted by the asset pipeline
+        self.image = game.resource_manager.get_sprite(sprite_id)
+        if self.image is None:
+            size = int(TILESIZE * self.scale * SPRITE_SCALE_FACTOR)
+            self.image = game.resource_manager.placeholder((size, size))
+
+class EnemyPool:
+    """Free lists of despawned enemies keyed by enemy_type. Released enemies leave
+    their sprite groups and are reset from the cached template when reused."""
+    def __init__(self, game, enemy_class):
+        self.game = game
+        self.enemy_class = enemy_class
+        self.templates = {}
+        self.free = {}
+
+    def template(self, enemy_type):
+        template = self.templates.get(enemy_type)
+        if template is None:
+            template = self.templates[enemy_type] = EnemyTemplate(self.game, enemy_type)
+        return template
+
+    def acquire(self, enemy_type, x=0, y=0):
+        free = self.free.get(enemy_type)
+        if free:
+            enemy = free.pop()
+            enemy.reset(x, y)
+            enemy.add(self.game.all_sprites, self.game.enemies)
+            return enemy
+        return self.enemy_class(self.game, x, y, enemy_type, template=self.template(enemy_type))
+
+    def release(self, enemy):
+        enemy.kill()
+        if enemy.pooled:
+            return
+        enemy.pooled = True
+        self.free.setdefault(enemy.enemy_type, []).append(enemy)
+
+    def free_count(self):
+        return sum(len(free) for free in self.free.values())
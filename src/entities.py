@@ -10,7 +10,21 @@ from components.player_input import PlayerInputComponent
 from components.ai import AIComponent
 from components.inventory import InventoryComponent
 from components.serialization import SerializationComponent
+from enemy_pool import EnemyTemplate
 from inventory import ITEM_TEMPLATES, SKILLS, create_item, create_random_weapon
+from loot_tables import LOOT_TABLES
+
+def job_stat_bonus(job_data, job_id):
+    """A job's base_stats relative to the average job, so changing job trades
+    stats rather than stacking the job's full stat line on the hero"""
+    job = job_data.get(job_id)
+    if not job:
+        return {}
+    bonus = {}
+    for stat, value in job.get("base_stats", {}).items():
+        values = [data.get("base_stats", {}).get(stat, 0) for data in job_data.values()]
+        bonus[stat] = round(value - sum(values) / len(values))
+    return bonus
 
 class Character(pygame.sprite.Sprite):
     def __init__(self, game, x, y, groups):
@@ -39,6 +53,7 @@ class Character(pygame.sprite.Sprite):
         return None
 
     def update(self, dt):
+        self.prev_center = self.rect.center # For interpolated drawing
         for component in self.components:
             component.update(dt)
             
@@ -66,18 +81,15 @@ class Character(pygame.sprite.Sprite):
 class Player(Character):
     def __init__(self, game, x, y):
         super().__init__(game, x, y, game.all_sprites)
-        # Load and scale player image to TILESIZE (32x32)
-        self.image = game.resource_manager.load_image("Hero.png")
+        # Prebuilt at TILESIZE * SPRITE_SCALE_FACTOR by the asset pipeline
+        self.image = game.resource_manager.get_sprite("hero")
         if self.image:
             self.game.logger.debug("Player image loaded successfully.")
         else:
             self.game.logger.error("Failed to load Player image!")
+            self.image = game.resource_manager.placeholder((TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR))
 
-        # Scale image using SPRITE_SCALE_FACTOR and regular scale for sharp pixels
-        scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-        self.image = pygame.transform.scale(self.image, scaled_image_size)
-
-        # Setup animation using the scaled image
+        # Setup animation using the prebuilt image
         self.anim_controller.add_animation("idle", Animation([self.image]))
         self.anim_controller.add_animation("walk", Animation([self.image]))
         self.anim_controller.set_state("idle")
@@ -95,9 +107,10 @@ class Player(Character):
         self.inventory = self.add_component(InventoryComponent)
         self.serializer = self.add_component(SerializationComponent)
         # Job System
-        self.job = "warrior"
+        self.set_job("warrior")
         self.jp = 0
         self.mastered_jobs = []
+        self.skills = []
         self.xp = 0
         self.level = 1
         self.xp_to_next = 100
@@ -118,12 +131,17 @@ class Player(Character):
         
         growth = np.array([2, 2, 2, 1], dtype=np.int16)
         self.combat.stats += growth
+        self.combat.invalidate_stats()
         
         self.combat.max_hp += 10
         self.combat.max_mp += 5
         self.combat.hp = self.combat.max_hp
         self.combat.mp = self.combat.max_mp
 
+    def set_job(self, job_id):
+        self.job = job_id
+        self.combat.set_modifiers("job", job_stat_bonus(getattr(self.game, 'job_data', {}), job_id))
+
     def to_dict(self):
         return self.serializer.to_dict()
 
@@ -137,31 +155,20 @@ class NPC(Character):
         self.dialogue_id = dialogue_id
         self.quest_id = quest_id
         
-        # Load NPC image and scale to TILESIZE (32x32)
+        # NPC sprites are prebuilt at TILESIZE * SPRITE_SCALE_FACTOR as "npc/<id>"
+        sprite_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
         npc_data = self.game.data_manager.get_data("npcs") if hasattr(self.game, 'data_manager') else None
+        self.image = None
         if npc_data and dialogue_id in npc_data:
             data = npc_data[dialogue_id]
             self.name = data.get("name", self.name)
-            image_name = data.get("image")
-            if image_name:
-                self.image = game.resource_manager.load_image(image_name)
-                if self.image:
-                    scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-                    self.image = pygame.transform.scale(self.image, scaled_image_size)
+            if data.get("image"):
+                self.image = game.resource_manager.get_sprite("npc/" + dialogue_id)
             elif "color" in data:
-                scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-                self.image = pygame.Surface(scaled_image_size, pygame.SRCALPHA)
+                self.image = pygame.Surface(sprite_size, pygame.SRCALPHA)
                 self.image.fill(data["color"])
-            else:
-                self.image = game.resource_manager.load_image("Hero.png")
-                if self.image:
-                    scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-                    self.image = pygame.transform.scale(self.image, scaled_image_size)
-        else:
-            self.image = game.resource_manager.load_image("Hero.png")
-            if self.image:
-                scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-                self.image = pygame.transform.scale(self.image, scaled_image_size)
+        if self.image is None:
+            self.image = game.resource_manager.get_sprite("hero") or game.resource_manager.placeholder(sprite_size)
         
         self.rect = pygame.Rect(self.x, self.y, TILESIZE, TILESIZE) # Logical rect
         self.image_rect = self.image.get_rect(center=self.rect.center) # Drawing rect
@@ -181,78 +188,53 @@ class NPC(Character):
         return "..."
 
 class Enemy(Character):
-    def __init__(self, game, x, y, enemy_type="slime"):
+    def __init__(self, game, x, y, enemy_type="slime", template=None):
         super().__init__(game, x, y, (game.all_sprites, game.enemies))
         self.enemy_type = enemy_type
-        
-        enemy_data = self.game.data_manager.get_data("enemies")
-        if enemy_data and enemy_type in enemy_data:
-            data = enemy_data[enemy_type]
-            self.name = data.get("name", "Enemy")
-            self.special_abilities = data.get("special_abilities", [])
-            self.attack_type = data.get("attack_type", "melee")
-            
-            self.add_component(CombatComponent, 
-                               hp=data.get("max_hp", 10), 
-                               mp=0, 
-                               stats=data.get("stats", [1, 1, 1, 1]),
-                               xp_reward=data.get("xp_reward", 0),
-                               gold_reward=data.get("gold_reward", 0))
-            self.add_component(MovementComponent, speed=30)
-            self.add_component(AIComponent)
+        if template is None:
+            template = game.enemy_pool.template(enemy_type) if hasattr(game, 'enemy_pool') else EnemyTemplate(game, enemy_type)
+        self.template = template
+        self.name = template.name
+        self.special_abilities = template.special_abilities
+        self.attack_type = template.attack_type
+        self.scale = template.scale
+        self.pooled = False
 
-            image_name = data.get("image")
-            scale_factor = data.get("scale", 1)
-            
-            img = game.resource_manager.load_image(image_name)
-            
-            # Apply scaling relative to TILESIZE to prevent massive sprites
-            target_width = int(TILESIZE * scale_factor * SPRITE_SCALE_FACTOR)
-            target_height = int(TILESIZE * scale_factor * SPRITE_SCALE_FACTOR)
-            img = pygame.transform.scale(img, (target_width, target_height))
+        self.combat = self.add_component(CombatComponent,
+                                         hp=template.max_hp,
+                                         mp=0,
+                                         stats=template.stats,
+                                         xp_reward=template.xp_reward,
+                                         gold_reward=template.gold_reward)
+        self.movement = self.add_component(MovementComponent, speed=30)
+        self.ai = self.add_component(AIComponent)
 
-            if "tint" in data:
-                tint_color = data["tint"]
-                tinted_img = img.copy()
-                tint_surface = pygame.Surface(tinted_img.get_size(), pygame.SRCALPHA)
-                tint_surface.fill(tint_color)
-                tinted_img.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                img = tinted_img
-                
-            self.scale = scale_factor
+        self.anim_controller.add_animation("idle", Animation([template.image]))
+        self.anim_controller.add_animation("walk", Animation([template.image]))
+        self.image = template.image
+        self.image_rect = self.image.get_rect()
 
-            self.anim_controller.add_animation("idle", Animation([img]))
-            self.anim_controller.add_animation("walk", Animation([img]))
-            self.anim_controller.set_state("idle")
-            self.image = self.anim_controller.current_animation.get_current_frame()
-        else:
-            self.game.logger.warning(f"Enemy type '{enemy_type}' not found in data.")
-            self.name = "Unknown"
-            self.add_component(CombatComponent, hp=10, mp=0, stats=[1, 1, 1, 1])
-            self.add_component(MovementComponent, speed=30)
-            self.add_component(AIComponent)
-            img = game.resource_manager.load_image("Slime.png")
-            scaled_image_size = (TILESIZE * SPRITE_SCALE_FACTOR, TILESIZE * SPRITE_SCALE_FACTOR)
-            img = pygame.transform.scale(img, scaled_image_size)
-            self.anim_controller.add_animation("idle", Animation([img]))
-            self.anim_controller.add_animation("walk", Animation([img]))
-            self.anim_controller.set_state("idle")
-            self.image = self.anim_controller.current_animation.get_current_frame()
+        if template.hitbox:
+            self.hit_rect = pygame.Rect(0, 0, template.hitbox.get("width", TILESIZE), template.hitbox.get("height", TILESIZE))
+        self.reset(x, y)
 
-        self.rect = pygame.Rect(self.x, self.y, TILESIZE, TILESIZE)
-        self.image_rect = self.image.get_rect(center=self.rect.center)
-        
-        hitbox_data = None
-        if enemy_data and enemy_type in enemy_data:
-             hitbox_data = enemy_data[enemy_type].get("hitbox")
+    def reset(self, x, y):
+        """Put a new or pooled enemy back into its spawn state at tile (x, y)"""
+        self.pooled = False
+        self.x = x * TILESIZE
+        self.y = y * TILESIZE
+        self.rect.topleft = (self.x, self.y)
+        self.hit_rect.center = self.rect.center
+        self.image_rect.center = self.rect.center
 
-        if hitbox_data:
-            w = hitbox_data.get("width", self.rect.width)
-            h = hitbox_data.get("height", self.rect.height)
-            self.hit_rect = pygame.Rect(0, 0, w, h)
-            self.hit_rect.center = self.rect.center
-        else:
-            self.hit_rect = self.rect.copy()
+        template = self.template
+        self.combat.reset(template.max_hp, 0, template.stats)
+        self.movement.vx = self.movement.vy = 0
+        self.ai.reset()
+        self.anim_controller.flip_x = False
+        self.anim_controller.set_state("idle")
+        self.image = template.image
+        self.loot = LOOT_TABLES.roll_drops(template.loot_table) if template.loot_table else []
 
 class Pickup(pygame.sprite.Sprite):
     def __init__(self, game, x, y, type="potion"):
@@ -283,15 +265,12 @@ class Pickup(pygame.sprite.Sprite):
         else:
             color = (255, 255, 255)
 
-        # Try loading an image first (assuming standard naming convention)
-        image_name = f"{type}.png"
+        # Use prebuilt art ("pickup/<type>") when there is some
         self.image = None
         if hasattr(self.game, 'resource_manager'):
-             self.image = self.game.resource_manager.load_image(image_name)
+             self.image = self.game.resource_manager.get_sprite("pickup/" + type)
         
         if self.image:
-             scaled_size = (int(TILESIZE * 0.8), int(TILESIZE * 0.8))
-             self.image = pygame.transform.scale(self.image, scaled_size)
              self.rect = self.image.get_rect()
              self.rect.center = (self.x + TILESIZE // 2, self.y + TILESIZE // 2)
         else:
@@ -301,6 +280,7 @@ class Pickup(pygame.sprite.Sprite):
             self.rect = self.image.get_rect()
             self.rect.center = (self.x + TILESIZE // 2, self.y + TILESIZE // 2)
 
+        self.image_rect = self.rect # Drawn where it bobs
         self.bob_offset = 0
         self.bob_speed = 5
         self.base_y = self.rect.centery
@@ -0,0 +1,24 @@
+# DragonQuest/src/event_bus.py
+
+# Gameplay events, emitted with the id of what they happened to
+KILL = "kill" # enemy_type
+TALK = "talk" # NPC dialogue_id
+ITEM_ACQUIRED = "item_acquired" # item_id
+FLAG_SET = "flag_set" # flag name, delivered by FlagRegistry subscriptions
+
+class EventBus:
+    """Fans gameplay events out to the handlers subscribed to their type"""
+    def __init__(self):
+        self.subscribers = {} # event type -> [handler(event_type, target, amount)]
+
+    def subscribe(self, event_type, handler):
+        self.subscribers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        handlers = self.subscribers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event_type, target, amount=1):
+        for handler in self.subscribers.get(event_type, ()):
+            handler(event_type, target, amount)
@@ -0,0 +1,96 @@
+# DragonQuest/src/flags.py
+
+class FlagRegistry:
+    """Story flags interned to small integer ids and stored as the bits of one int.
+
+    Names listed in data/flags.json get stable ids, so saves only need the bitset;
+    flags first seen at runtime are interned after them and saved by name.
+    Callbacks subscribed to a flag run when its value changes."""
+    def __init__(self, names=()):
+        self.ids = {} # name -> bit index
+        self.names = []
+        self.bits = 0
+        self.subscribers = {} # bit index, or None for every flag -> [callback(name, value)]
+        for name in names:
+            self.intern(name)
+        self.declared = len(self.names)
+
+    def intern(self, name):
+        flag_id = self.ids.get(name)
+        if flag_id is None:
+            flag_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return flag_id
+
+    def mask(self, names):
+        mask = 0
+        for name in names:
+            mask |= 1 << self.intern(name)
+        return mask
+
+    def test(self, mask):
+        """True when every flag in mask is set"""
+        return self.bits & mask == mask
+
+    def get(self, name, default=False):
+        flag_id = self.ids.get(name)
+        if flag_id is None:
+            return default
+        return bool(self.bits >> flag_id & 1)
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __setitem__(self, name, value):
+        self.set(name, value)
+
+    def set(self, name, value=True):
+        self.replace(self.bits | (1 << self.intern(name)) if value else self.bits & ~(1 << self.intern(name)))
+
+    def clear(self, name):
+        self.set(name, False)
+
+    def replace(self, bits):
+        """Swap in a whole bitset, notifying subscribers of every flag that changed"""
+        changed = self.bits ^ bits
+        self.bits = bits
+        while changed:
+            low = changed & -changed
+            flag_id = low.bit_length() - 1
+            changed ^= low
+            self._notify(flag_id, bool(bits & low))
+
+    def _notify(self, flag_id, value):
+        name = self.names[flag_id]
+        for key in (flag_id, None):
+            for callback in list(self.subscribers.get(key, ())):
+                callback(name, value)
+
+    def subscribe(self, name, callback):
+        """Call callback(name, value) when the flag changes; name None watches every flag"""
+        key = None if name is None else self.intern(name)
+        self.subscribers.setdefault(key, []).append(callback)
+        return callback
+
+    def unsubscribe(self, name, callback):
+        key = None if name is None else self.ids.get(name)
+        callbacks = self.subscribers.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def to_dict(self):
+        """Declared flags as a hex bitset, runtime-only flags by name"""
+        declared = self.bits & ((1 << self.declared) - 1)
+        extra = [self.names[flag_id] for flag_id in range(self.declared, len(self.names)) if self.bits >> flag_id & 1]
+        return {"bits": format(declared, "x"), "extra": extra}
+
+    def from_dict(self, data):
+        if "bits" in data and isinstance(data["bits"], str):
+            bits = int(data["bits"], 16) & ((1 << self.declared) - 1)
+            names = data.get("extra", [])
+        else:
+            bits = 0 # Older saves stored a {name: bool} dict
+            names = [name for name, value in data.items() if value]
+        for name in names:
+            bits |= 1 << self.intern(name)
+        self.replace(bits)
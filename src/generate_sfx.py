@@ -1,61 +1,184 @@
+# DragonQuest/src/generate_sfx.py
+"""Procedural sound effects rendered as whole NumPy buffers.
+
+Recipes build on a few primitives (oscillators, noise, sweeps, ADSR envelopes).
+SoundManager synthesizes them straight into pygame Sounds at startup, with
+pitch-randomized variants; running this file writes them out as WAVs instead.
+"""
 import wave
-import math
-import random
-import struct
 import os
+import numpy as np
+
+SAMPLE_RATE = 44100
+SFX_FOLDER = os.path.join(os.path.dirname(__file__), "assets", "sfx")
+
+# --- Primitives ---
+
+def sample_count(duration, rate=SAMPLE_RATE):
+    return int(duration * rate)
+
+def sweep(start, end, n, curve="linear"):
+    """Per-sample frequency moving from start to end"""
+    if curve == "exp":
+        return np.geomspace(start, end, n, dtype=np.float32)
+    return np.linspace(start, end, n, dtype=np.float32)
+
+def _phase(freq, n, rate):
+    freq = np.broadcast_to(np.asarray(freq, dtype=np.float64), (n,))
+    # Integrating the frequency keeps sweeps click-free
+    return 2 * np.pi * np.cumsum(freq) / rate
+
+def sine(freq, n, rate=SAMPLE_RATE):
+    return np.sin(_phase(freq, n, rate)).astype(np.float32)
+
+def square(freq, n, rate=SAMPLE_RATE, duty=0.5):
+    cycle = (_phase(freq, n, rate) / (2 * np.pi)) % 1.0
+    return np.where(cycle < duty, 1.0, -1.0).astype(np.float32)
+
+def saw(freq, n, rate=SAMPLE_RATE):
+    cycle = (_phase(freq, n, rate) / (2 * np.pi)) % 1.0
+    return (2 * cycle - 1).astype(np.float32)
+
+def triangle(freq, n, rate=SAMPLE_RATE):
+    return (2 * np.abs(saw(freq, n, rate)) - 1).astype(np.float32)
+
+def noise(n, rng):
+    return rng.uniform(-1, 1, n).astype(np.float32)
+
+def adsr(n, attack=0.01, decay=0.05, sustain=0.7, release=0.1, rate=SAMPLE_RATE):
+    """Attack/decay/release in seconds, squeezed to fit short sounds"""
+    a, d, r = (sample_count(t, rate) for t in (attack, decay, release))
+    total = a + d + r
+    if total > n:
+        scale = n / total
+        a, d, r = int(a * scale), int(d * scale), int(r * scale)
+    s = n - a - d - r
+    return np.concatenate((
+        np.linspace(0, 1, a, endpoint=False),
+        np.linspace(1, sustain, d, endpoint=False),
+        np.full(s, sustain),
+        np.linspace(sustain, 0, r),
+    )).astype(np.float32)
+
+def decay(n):
+    return np.linspace(1, 0, n, dtype=np.float32)
+
+# --- Recipes: (rng, pitch, rate) -> float32 samples in [-1, 1] ---
+
+RECIPES = {}
 
-def generate_wav(filename, duration, freq_func, volume=0.5):
-    sample_rate = 44100
-    num_samples = int(duration * sample_rate)
-    
-    path = os.path.join("src", "assets", "sfx", filename)
+def recipe(name, volume):
+    def register(func):
+        RECIPES[name] = (func, volume)
+        return func
+    return register
+
+@recipe("attack", 0.4)
+def attack(rng, pitch, rate):
+    # White noise burst
+    n = sample_count(0.2, rate)
+    return noise(n, rng) * decay(n)
+
+@recipe("magic", 0.3)
+def magic(rng, pitch, rate):
+    # High pitch sweep down
+    n = sample_count(0.5, rate)
+    return sine(sweep(880 * pitch, 440 * pitch, n), n, rate) * adsr(n, 0.02, 0.1, 0.8, 0.2, rate)
+
+@recipe("text_blip", 0.2)
+def text_blip(rng, pitch, rate):
+    n = sample_count(0.05, rate)
+    return square(440 * pitch, n, rate) * adsr(n, 0.002, 0.01, 0.8, 0.02, rate)
+
+@recipe("menu", 0.3)
+def menu(rng, pitch, rate):
+    n = sample_count(0.1, rate)
+    return sine(660 * pitch, n, rate) * adsr(n, 0.005, 0.02, 0.7, 0.05, rate)
+
+@recipe("hit", 0.45)
+def hit(rng, pitch, rate):
+    # Noise crack over a falling thump
+    n = sample_count(0.18, rate)
+    thump = square(sweep(180 * pitch, 60 * pitch, n, "exp"), n, rate) * decay(n) ** 2
+    crack = noise(n, rng) * decay(n) ** 6
+    return 0.6 * thump + 0.6 * crack
+
+@recipe("drink", 0.3)
+def drink(rng, pitch, rate):
+    # Glugs: a sine wobbling upwards
+    n = sample_count(0.35, rate)
+    wobble = 1 + 0.15 * sine(14, n, rate)
+    return sine(sweep(220 * pitch, 440 * pitch, n) * wobble, n, rate) * adsr(n, 0.01, 0.05, 0.6, 0.1, rate)
+
+@recipe("step", 0.15)
+def step(rng, pitch, rate):
+    n = sample_count(0.06, rate)
+    return (0.5 * noise(n, rng) + 0.5 * triangle(90 * pitch, n, rate)) * decay(n) ** 3
+
+@recipe("door", 0.3)
+def door(rng, pitch, rate):
+    # Creak rising into a thud
+    n = sample_count(0.4, rate)
+    creak = saw(sweep(110 * pitch, 160 * pitch, n), n, rate) * adsr(n, 0.05, 0.1, 0.4, 0.1, rate)
+    thud = sine(sweep(90 * pitch, 40 * pitch, n, "exp"), n, rate) * np.linspace(0, 1, n) ** 8
+    return 0.5 * creak + 0.8 * thud
+
+@recipe("locked", 0.3)
+def locked(rng, pitch, rate):
+    # Two dull clunks
+    n = sample_count(0.08, rate)
+    clunk = square(sweep(150 * pitch, 80 * pitch, n, "exp"), n, rate) * decay(n) ** 2
+    return np.concatenate((clunk, np.zeros(n // 2, dtype=np.float32), clunk))
+
+# --- Output ---
+
+def render(name, rng=None, pitch=1.0, rate=SAMPLE_RATE):
+    """Samples for a recipe at its volume, as float32 in [-1, 1]"""
+    func, volume = RECIPES[name]
+    rng = rng if rng is not None else np.random.default_rng()
+    return np.clip(func(rng, pitch, rate) * volume, -1, 1)
+
+def to_pcm16(samples):
+    return (samples * 32767).astype(np.int16)
+
+def write_wav(path, samples, rate=SAMPLE_RATE):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    
     with wave.open(path, 'w') as wav_file:
         wav_file.setnchannels(1) # Mono
         wav_file.setsampwidth(2) # 2 bytes per sample (16-bit)
-        wav_file.setframerate(sample_rate)
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            freq = freq_func(t, duration)
-            
-            # Generate waveform
-            if filename == "attack.wav":
-                # White noise burst
-                value = random.uniform(-1, 1) * (1 - t/duration) # Decay
-            elif filename == "magic.wav":
-                # Sine sweep
-                value = math.sin(2 * math.pi * freq * t)
-            elif filename == "text_blip.wav":
-                # Square wave
-                value = 1.0 if math.sin(2 * math.pi * freq * t) > 0 else -1.0
-            elif filename == "menu.wav":
-                # Sine blip
-                value = math.sin(2 * math.pi * freq * t)
-            else:
-                value = 0
-                
-            # Scale and clamp
-            sample = int(value * volume * 32767)
-            sample = max(-32768, min(32767, sample))
-            
-            wav_file.writeframes(struct.pack('<h', sample))
-            
-    print(f"Generated {filename}")
+        wav_file.setframerate(rate)
+        wav_file.writeframes(to_pcm16(samples).tobytes())
+
+def make_sound(samples):
+    """A pygame Sound in the mixer's own format, without touching disk (None if no mixer)"""
+    import pygame
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    frequency, size, channels = init
+    if size != -16:
+        return None # Only signed 16-bit mixers are handled
+    pcm = to_pcm16(samples)
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1)
+    return pygame.mixer.Sound(buffer=np.ascontiguousarray(pcm).tobytes())
+
+def synthesize(name, variants=1, spread=0.0, rng=None):
+    """Sounds for a recipe; extra variants are pitch-shifted by up to +/- spread"""
+    import pygame
+    init = pygame.mixer.get_init()
+    if not init:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
+    pitches = [1.0] + list(1 + rng.uniform(-spread, spread, variants - 1))
+    sounds = [make_sound(render(name, rng, pitch, rate=init[0])) for pitch in pitches]
+    return [sound for sound in sounds if sound is not None]
 
 def main():
-    # Attack: Noise burst
-    generate_wav("attack.wav", 0.2, lambda t, d: 0, volume=0.4)
-    
-    # Magic: High pitch sweep down
-    generate_wav("magic.wav", 0.5, lambda t, d: 880 - (t/d)*440, volume=0.3)
-    
-    # Text Blip: High pitch short square wave
-    generate_wav("text_blip.wav", 0.05, lambda t, d: 440, volume=0.2)
-    
-    # Menu: Short high blip
-    generate_wav("menu.wav", 0.1, lambda t, d: 660, volume=0.3)
+    rng = np.random.default_rng(0)
+    for name in RECIPES:
+        write_wav(os.path.join(SFX_FOLDER, f"{name}.wav"), render(name, rng))
+        print(f"Generated {name}.wav")
 
 if __name__ == "__main__":
     main()
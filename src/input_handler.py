@@ -1,5 +1,6 @@
 # DragonQuest/src/input_handler.py
 import pygame
+from audio import MUSIC_END_EVENT
 
 class InputHandler:
     def __init__(self, game):
@@ -9,6 +10,10 @@ class InputHandler:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game.quit()
+
+            if event.type == MUSIC_END_EVENT:
+                self.game.music_player.handle_event(event)
+                continue
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F11:
@@ -13,6 +13,7 @@ class InteractiveObject(pygame.sprite.Sprite):
         self.image.fill((150, 150, 150)) # Default grey
         self.interactable = True
         self.solid = True
+        self.entity_uid = None # Index into the map's entity list, set by populate_map
 
     def interact(self):
         print(f"Interacted with {self.name}")
@@ -59,6 +60,7 @@ class PushBlock(InteractiveObject):
                 self.y = target_y
                 self.rect.x = self.x
                 self.rect.y = self.y
+                self.game.world_state.record_object(self.game.current_map_id, self.entity_uid, x=grid_x, y=grid_y)
                 self.game.sound_manager.play('step') # Placeholder sound
                 return True
         
@@ -97,8 +99,15 @@ class Switch(InteractiveObject):
                 self.on_trigger(False)
 
 class Door(InteractiveObject):
-    def __init__(self, game, x, y, groups, locked=True):
+    def __init__(self, game, x, y, groups, locked=True, flag=None):
         super().__init__(game, x, y, groups, "Door")
+        # A door tied to a story flag unlocks the moment the flag is set
+        self.flag = flag
+        if flag and hasattr(game, 'flags'):
+            if game.flags.get(flag):
+                locked = False
+            else:
+                game.flags.subscribe(flag, self.flag_changed)
         self.locked = locked
         self.solid = locked
         self.image.fill((100, 100, 100))  # Grey door
@@ -108,12 +117,29 @@ class Door(InteractiveObject):
     def open(self):
         self.locked = False
         self.solid = False
+        self.game.world_state.record_object(self.game.current_map_id, self.entity_uid, locked=False)
         self.image.fill((150, 200, 150))  # Light green open door
         self.interactable = True
         # Optionally play sound
         self.game.sound_manager.play('door')
         return True
 
+    def unlock(self):
+        """Open a locked door in play, with a rumble"""
+        if self.locked:
+            self.open()
+            if hasattr(self.game, 'camera'):
+                self.game.camera.shake(4, 0.25)
+
+    def flag_changed(self, name, value):
+        if value and self.alive():
+            self.unlock()
+
+    def kill(self):
+        if self.flag and hasattr(self.game, 'flags'):
+            self.game.flags.unsubscribe(self.flag, self.flag_changed)
+        super().kill()
+
     def interact(self):
         if self.locked:
             # Door is locked; maybe play a sound
@@ -149,7 +175,7 @@ class Switch(InteractiveObject):
             self.game.sound_manager.play('menu')
             # Open associated doors
             for door in self.doors:
-                door.open()
+                door.unlock()
             if self.on_trigger:
                 self.on_trigger(True)
         elif not hit and self.activated:
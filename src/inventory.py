@@ -2,7 +2,7 @@
 import json
 import os
 import random
-import copy
+from types import MappingProxyType
 
 def load_items():
     data_path = os.path.join(os.path.dirname(__file__), 'data', 'items.json')
@@ -24,38 +24,79 @@ AFFIXES = {
     "Legendary": {"stats": {"strength": 5, "agility": 5, "intelligence": 5}, "cost_mult": 3.0}
 }
 
+class ItemTemplate:
+    """Read-only fields of one items.json entry, shared by every Item of that id"""
+    __slots__ = ("item_id", "name", "type", "stats", "power", "element", "effect", "description", "icon")
+
+    def __init__(self, item_id, data):
+        self.item_id = item_id
+        self.name = data.get("name", "Unknown Item")
+        self.type = data.get("type", "misc")
+        self.stats = MappingProxyType(dict(data.get("stats", {})))
+        self.power = data.get("power", 0)
+        self.element = data.get("element", None)
+        self.effect = data.get("effect", None)
+        self.description = data.get("description", "")
+        self.icon = data.get("icon", None)
+
+_TEMPLATES = {} # item_id -> ItemTemplate, built on first use
+_AFFIXED_STATS = {} # (item_id, affix) -> merged stats, shared by every such item
+
+def get_template(item_id):
+    template = _TEMPLATES.get(item_id)
+    if template is None:
+        template = _TEMPLATES[item_id] = ItemTemplate(item_id, ITEM_TEMPLATES.get(item_id, {}))
+    return template
+
+def _affixed_stats(template, affix):
+    key = (template.item_id, affix)
+    stats = _AFFIXED_STATS.get(key)
+    if stats is None:
+        merged = dict(template.stats)
+        for stat, val in AFFIXES[affix]["stats"].items():
+            merged[stat] = merged.get(stat, 0) + val
+        stats = _AFFIXED_STATS[key] = MappingProxyType(merged)
+    return stats
+
 class Item:
+    """A template plus an optional affix; everything else is derived on read"""
+    __slots__ = ("template", "affix")
+
     def __init__(self, item_id, template=None):
-        self.item_id = item_id
-        if template is None:
-            template = ITEM_TEMPLATES.get(item_id, {})
-        
-        self.name = template.get("name", "Unknown Item")
-        self.type = template.get("type", "misc")
-        self.slot = self.type # Map type to slot for equipment logic
-        self.stats = copy.deepcopy(template.get("stats", {}))
-        self.power = template.get("power", 0)
-        self.element = template.get("element", None)
-        self.effect = template.get("effect", None)
-        self.description = template.get("description", "")
-        self.icon = template.get("icon", None)
+        self.template = template or get_template(item_id)
         self.affix = None
-        
+
+    item_id = property(lambda self: self.template.item_id)
+    type = property(lambda self: self.template.type)
+    slot = type # Map type to slot for equipment logic
+    power = property(lambda self: self.template.power)
+    element = property(lambda self: self.template.element)
+    effect = property(lambda self: self.template.effect)
+    icon = property(lambda self: self.template.icon)
+
+    @property
+    def name(self):
+        if self.affix:
+            return f"{self.affix} {self.template.name}"
+        return self.template.name
+
+    @property
+    def stats(self):
+        """Read-only; affixed stats are merged once per (item, affix) and cached"""
+        if self.affix:
+            return _affixed_stats(self.template, self.affix)
+        return self.template.stats
+
+    @property
+    def description(self):
+        if not self.affix:
+            return self.template.description
+        stat_str = ", ".join([f"{k} {'+' if v>0 else ''}{v}" for k,v in AFFIXES[self.affix]["stats"].items()])
+        return f"{self.template.description} ({stat_str})"
+
     def add_affix(self, affix_name):
         if affix_name in AFFIXES:
             self.affix = affix_name
-            data = AFFIXES[affix_name]
-            
-            # Update Name
-            self.name = f"{affix_name} {self.name}"
-            
-            # Update Stats
-            for stat, val in data["stats"].items():
-                self.stats[stat] = self.stats.get(stat, 0) + val
-                
-            # Update Description
-            stat_str = ", ".join([f"{k} {'+' if v>0 else ''}{v}" for k,v in data["stats"].items()])
-            self.description += f" ({stat_str})"
 
 def create_item(item_id):
     """Factory method to create a basic item."""
@@ -63,11 +104,14 @@ def create_item(item_id):
         return Item(item_id)
     return None
 
+# Weapon ids and affix names, fixed once the templates are loaded
+WEAPON_IDS = [k for k, v in ITEM_TEMPLATES.items() if v.get("type") == "weapon"]
+AFFIX_NAMES = list(AFFIXES)
+
 def create_random_weapon(base_types=None):
     """Creates a weapon with a random affix."""
     if base_types is None:
-        # Filter for weapons in templates
-        base_types = [k for k, v in ITEM_TEMPLATES.items() if v.get("type") == "weapon"]
+        base_types = WEAPON_IDS
     
     if not base_types:
         return None
@@ -77,8 +121,7 @@ def create_random_weapon(base_types=None):
     
     # 50% chance for an affix
     if random.random() < 0.5:
-        affix = random.choice(list(AFFIXES.keys()))
-        item.add_affix(affix)
+        item.add_affix(random.choice(AFFIX_NAMES))
         
     return item
 
@@ -0,0 +1,85 @@
+# DragonQuest/src/loot_tables.py
+import json
+import os
+import random
+import numpy as np
+
+# Entry name for "nothing" in a table (a drop that doesn't happen)
+NOTHING = "none"
+
+class AliasTable:
+    """Weighted choice compiled with Walker's alias method: O(1) per draw,
+    and whole batches at once through NumPy."""
+    def __init__(self, entries, weights):
+        n = len(entries)
+        if n == 0:
+            raise ValueError("A weighted table needs at least one entry")
+        self.entries = list(entries)
+        self.values = np.array([None if e == NOTHING else e for e in entries], dtype=object)
+        scaled = np.asarray(weights, dtype=np.float64)
+        if (scaled < 0).any() or scaled.sum() <= 0:
+            raise ValueError("Weights must be non-negative with a positive total")
+        scaled = scaled * n / scaled.sum()
+
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1]
+        large = [i for i in range(n) if scaled[i] >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        # Whatever is left is 1 up to rounding
+        self._prob_list = self.prob.tolist()
+        self._alias_list = self.alias.tolist()
+
+    def draw(self, rng=random):
+        """One entry (None for NOTHING) from a random.Random-like rng"""
+        i = rng.randrange(len(self.entries))
+        if rng.random() >= self._prob_list[i]:
+            i = self._alias_list[i]
+        return self.values[i]
+
+    def draw_many(self, count, rng):
+        """count entries at once from a numpy Generator, as an object array"""
+        i = rng.integers(0, len(self.entries), count)
+        picks = np.where(rng.random(count) < self.prob[i], i, self.alias[i])
+        return self.values[picks]
+
+class LootTables:
+    """Named weighted tables from data/loot_tables.json: {"table": {"entry": weight}}"""
+    def __init__(self, data):
+        self.tables = {name: AliasTable(list(entries), list(entries.values())) for name, entries in data.items()}
+
+    def get(self, name):
+        return self.tables.get(name)
+
+    def draw(self, name, rng=random, default=None):
+        table = self.tables.get(name)
+        return table.draw(rng) if table else default
+
+    def draw_many(self, name, count, rng):
+        table = self.tables.get(name)
+        if table is None:
+            return np.full(count, None, dtype=object)
+        return table.draw_many(count, rng)
+
+    def roll_drops(self, name, rolls=1, rng=random):
+        """Item ids dropped from rolls draws of a table, skipping NOTHING"""
+        table = self.tables.get(name)
+        if table is None:
+            return []
+        drops = (table.draw(rng) for _ in range(rolls))
+        return [drop for drop in drops if drop is not None]
+
+def load_tables():
+    data_path = os.path.join(os.path.dirname(__file__), 'data', 'loot_tables.json')
+    if os.path.exists(data_path):
+        with open(data_path, 'r') as f:
+            return LootTables(json.load(f))
+    return LootTables({})
+
+# Global Tables
+LOOT_TABLES = load_tables()
@@ -1,15 +1,27 @@
 import pygame
 import sys
 import os
+import asyncio
 from settings import *
-from entities import Player, Enemy, NPC
+from entities import Player, Enemy, NPC, Pickup
+from interaction import Switch, PushBlock, Door
 from tilemap import Map
 from battle import Battle
+from spell import SpellDatabase
+from combat_item import ItemDatabase
+from combat_log import CombatLog
+from enemy_behaviour import BehaviourTable
+from enemy_pool import EnemyPool
 from camera import Camera
+from simulation_lod import SimulationLOD
 from quest import QuestManager
+from event_bus import EventBus, TALK
+from flags import FlagRegistry
 from world_generator import WorldGenerator
 from logger import Logger
 from save_manager import SaveManager
+from world_state import WorldState
+from minimap import Minimap, ascii_rows
 from dialogue import DialogueManager
 from scene import TitleScene, WorldScene, CombatScene
 from ui import MessageLog, CommandConsole, HUD, DialogueBox, BattleUI, JobMenu
@@ -58,6 +70,9 @@ class Game:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT)) 
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
+        self.headless = os.environ.get("SDL_VIDEODRIVER") == "dummy"
+        self.accumulator = 0.0
+        self.alpha = 1.0 # Draw interpolation between the last two fixed steps
         self.logger = Logger()
         print("Game Initialized - Window Created")
         
@@ -65,6 +80,15 @@ class Game:
         self.resource_manager = ResourceManager(self)
         self.data_manager = DataManager(self)
         self.data_manager.load_data()
+        # Shared by every battle
+        self.spell_db = SpellDatabase(self.data_manager.get_data('spells'))
+        self.item_db = ItemDatabase(self.data_manager.get_data('items'))
+        self.combat_log = CombatLog()
+        self.enemy_behaviours = BehaviourTable(self.data_manager.get_data('enemies'))
+        self.job_data = self.data_manager.get_data('jobs') or {}
+        self.enemy_pool = EnemyPool(self, Enemy)
+        self.sim_lod = SimulationLOD()
+        self.camera = Camera() # Re-bounded by load_map
         
         self.game_state_manager = GameStateManager(self)
         self.input_handler = InputHandler(self)
@@ -83,6 +107,7 @@ class Game:
         
         self.in_battle = False
         self.battle = None
+        self.battle_system = None
         self.in_dialogue = False
         self.job_menu_active = False
         self.dialogue_text = ""
@@ -102,21 +127,25 @@ class Game:
                 self.new()
             world_scene = WorldScene(self.game_state_manager)
             self.game_state_manager.change_state(scene_name, state_instance=world_scene, **kwargs)
+            self.music_player.play_exploration_music()
         else:
             self.game_state_manager.change_state(scene_name, **kwargs)
 
         if scene_name == "combat":
+            self.music_player.play_battle_music()
             self.in_battle = True
             self.battle = self.game_state_manager.current_state.battle_system
         else:
             self.in_battle = False
             self.battle = None
 
-    def new(self):
+    def new(self, generate_maps=True):
         self.all_sprites = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.pickups = pygame.sprite.Group()
         self.npcs = pygame.sprite.Group()
+        self.event_bus = EventBus() # Fresh per game so old subscribers don't linger
+        self.flags = FlagRegistry(self.data_manager.get_data("flags") or [])
         self.quest_manager = QuestManager(self)
         self.dialogue_manager = DialogueManager(self)
         self.map = Map(self)
@@ -125,22 +154,35 @@ class Game:
         self.dungeon_gen = DungeonGenerator()
         
         self.interactables = pygame.sprite.Group()
+        self.world_state = WorldState(self)
+        self.minimap = Minimap(self) # Visited tiles are per game
         
-        self.maps = {
+        self.playtime = 0
+        
+        # Loading a save rebuilds maps from its recipes instead
+        self.maps = {}
+        if generate_maps:
+            self.maps = self.generate_maps()
+            self.start("world_map")
+
+    def generate_maps(self):
+        return {
             "world_map": self.world_gen.generate_world_map(),
             "town_01": self.world_gen.generate_town_map(),
             "dungeon_01": self.dungeon_gen.generate_dungeon()
         }
-        self.load_map("world_map")
+
+    def start(self, map_id, spawn_x=None, spawn_y=None):
+        """Enter the first map of a session and create the player"""
+        self.load_map(map_id)
         
         self.in_dialogue = False
         self.dialogue_text = ""
         self.current_npc = None
         self.debug = False
         
-        self.camera = Camera(self.map.world_width * TILESIZE, self.map.world_height * TILESIZE)
-        
-        spawn_x, spawn_y = self.map.spawn_location
+        if spawn_x is None or spawn_y is None:
+            spawn_x, spawn_y = self.map.spawn_location
         self.player = Player(self, spawn_x, spawn_y)
         
         self.logger.debug(f"Game.new - Spawn Location: ({spawn_x}, {spawn_y})")
@@ -153,9 +195,10 @@ class Game:
         map_data = self.maps[map_id]
         self.logger.debug(f"Loading map '{map_id}'")
         self.map.load_map(map_data)
+        if hasattr(self, 'minimap'):
+            self.minimap.load(map_id, self.map.layers["ground"])
         
-        if hasattr(self, 'camera'):
-            self.camera = Camera(self.map.world_width * TILESIZE, self.map.world_height * TILESIZE)
+        self.camera.set_map(self.map.world_width * TILESIZE, self.map.world_height * TILESIZE)
         
         if spawn_x is not None and spawn_y is not None and hasattr(self, 'player'):
             self.logger.debug(f"Spawning player at grid ({spawn_x}, {spawn_y}) -> pixel ({spawn_x * TILESIZE}, {spawn_y * TILESIZE})")
@@ -176,29 +219,16 @@ class Game:
         start_y = max(0, py - radius)
         end_y = min(self.map.world_height, py + radius + 1)
         
-        for y in range(start_y, end_y):
-            line = ""
-            for x in range(start_x, end_x):
-                if x == px and y == py:
-                    line += "P" # Player
-                elif self.map.layers["ground"][y, x] == 2: # WATER
-                    line += "~"
-                elif self.map.layers["ground"][y, x] == 0: # GRASS
-                    line += "."
-                elif self.map.layers["ground"][y, x] == 1: # DIRT
-                    line += ":"
-                elif self.map.layers["ground"][y, x] == 3: # FOREST
-                    line += "T"
-                elif self.map.layers["ground"][y, x] == 4: # MOUNTAIN
-                    line += "^"
-                elif self.map.layers["ground"][y, x] == 5: # WALL
-                    line += "#"
-                else:
-                    line += "?"
+        rows = ascii_rows(self.map.layers["ground"], start_x, start_y, end_x, end_y, marker=(px, py))
+        for y, line in enumerate(rows, start_y):
             self.logger.debug(f"{y:3d} | {line}")
         self.logger.debug("-----------------------------------\n")
 
     def populate_map(self, map_id):
+        # Enemies go back to the pool before everything else is killed
+        if hasattr(self, 'enemies'):
+            for sprite in list(self.enemies):
+                self.enemy_pool.release(sprite)
         if hasattr(self, 'all_sprites'):
             for sprite in self.all_sprites:
                 if hasattr(self, 'player') and sprite == self.player:
@@ -208,10 +238,6 @@ class Game:
                 sprite.kill()
             # self.all_sprites.empty() # Do not empty, as we kept the player
             
-        if hasattr(self, 'enemies'):
-            for sprite in self.enemies:
-                sprite.kill()
-            self.enemies.empty()
         if hasattr(self, 'npcs'):
             for sprite in self.npcs:
                 sprite.kill()
@@ -221,41 +247,63 @@ class Game:
                 sprite.kill()
             self.interactables.empty()
 
-        if map_id in self.maps and "entities" in self.maps[map_id]:
-            entity_data = self.maps[map_id]["entities"]
-        else:
-            entity_data = self.world_gen.get_map_entities(map_id, self.map.world_width, self.map.world_height, self.map.is_blocked)
+        map_data = self.maps[map_id]
+        if "entities" not in map_data:
+            # Seeded by the map so the same entities (and uids) come back after a reload
+            map_data["entities"] = self.world_gen.get_map_entities(map_id, self.map.world_width, self.map.world_height, self.map.is_blocked, seed=map_data.get("seed"), collision=self.map.layers.get("collision"), spawn=map_data.get("spawn"))
+        entity_data = map_data["entities"]
 
-        for entity in entity_data:
+        for uid, entity in enumerate(entity_data):
+            if self.world_state.is_removed(map_id, uid):
+                continue
+            sprite = None
             if entity["type"] == "enemy":
-                Enemy(self, entity["x"], entity["y"], entity["name"])
+                sprite = self.enemy_pool.acquire(entity["name"], entity["x"], entity["y"])
             elif entity["type"] == "npc":
-                NPC(self, entity["x"], entity["y"], entity["name"], entity["dialogue_id"], entity.get("quest_id"))
+                sprite = NPC(self, entity["x"], entity["y"], entity["name"], entity["dialogue_id"], entity.get("quest_id"))
             elif entity["type"] == "pickup":
-                Pickup(self, entity["x"], entity["y"], entity["pickup_type"])
+                sprite = Pickup(self, entity["x"], entity["y"], entity["pickup_type"])
             elif entity["type"] == "object":
-                from interaction import Chest, Switch, PushBlock, Door
                 cls_name = entity.get("class")
-                if cls_name == "Chest":
-                    Chest(self, entity["x"], entity["y"], (self.all_sprites, self.interactables), entity.get("content"))
-                elif cls_name == "Switch":
-                    Switch(self, entity["x"], entity["y"], (self.all_sprites, self.interactables), doors=None)
+                if cls_name == "Switch":
+                    sprite = Switch(self, entity["x"], entity["y"], (self.all_sprites, self.interactables), doors=None)
                 elif cls_name == "PushBlock":
-                    PushBlock(self, entity["x"], entity["y"], (self.all_sprites, self.interactables))
+                    sprite = PushBlock(self, entity["x"], entity["y"], (self.all_sprites, self.interactables))
                 elif cls_name == "Door":
-                    Door(self, entity["x"], entity["y"], (self.all_sprites, self.interactables), locked=entity.get("locked", True))
+                    sprite = Door(self, entity["x"], entity["y"], (self.all_sprites, self.interactables), locked=entity.get("locked", True), flag=entity.get("flag"))
+            if sprite:
+                sprite.entity_uid = uid
+                if entity["type"] == "object":
+                    self.world_state.apply_objects(map_id, sprite)
         
         switches = [s for s in self.interactables if isinstance(s, Switch)]
         doors = [d for d in self.interactables if isinstance(d, Door)]
         for sw in switches:
             sw.doors = doors
+        self.sim_lod.configure(self.map.world_width, self.map.world_height, map_data.get("sim_lod"))
+
+    def advance(self, frame_time):
+        """Run the fixed steps covered by frame_time; leftover time sets the draw interpolation"""
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+        steps = 0
+        while self.accumulator >= FIXED_DT and steps < MAX_STEPS_PER_FRAME:
+            self.dt = FIXED_DT
+            self.update()
+            self.accumulator -= FIXED_DT
+            steps += 1
+        # Drop a backlog we couldn't catch up on instead of spiralling
+        self.accumulator = min(self.accumulator, FIXED_DT)
+        self.alpha = self.accumulator / FIXED_DT
+        return steps
 
     async def run(self):
         self.playing = True
         while self.playing:
-            self.dt = self.clock.tick(FPS) / 1000
+            frame_time = self.clock.tick(FPS) / 1000
+            if self.headless:
+                frame_time = FIXED_DT # One step per frame, so headless runs replay exactly
             self.events()
-            self.update()
+            self.advance(frame_time)
             self.draw()
             
             # Simple heartbeat for web debugging
@@ -270,6 +318,7 @@ class Game:
             await asyncio.sleep(0)
 
     def quit(self):
+        self.save_manager.wait() # Let a pending autosave finish its write
         pygame.quit()
         sys.exit()
 
@@ -277,12 +326,13 @@ class Game:
         self.input_handler.process_events()
 
     def update(self):
-        self.music_player.update()
         self.message_log.update()
         self.game_state_manager.update(self.dt)
 
         if hasattr(self, 'player') and isinstance(self.game_state_manager.current_state, WorldScene):
             self.player.jp += 1 * self.dt
+        if self.map is not None and not isinstance(self.game_state_manager.current_state, TitleScene):
+            self.playtime += self.dt
 
     def draw(self):
         self.renderer.draw()
@@ -302,7 +352,7 @@ class Game:
         elif command == "/spawn":
             if args:
                 enemy_type = args[0]
-                Enemy(self, int(self.player.x / TILESIZE) + 2, int(self.player.y / TILESIZE), enemy_type)
+                self.enemy_pool.acquire(enemy_type, int(self.player.x / TILESIZE) + 2, int(self.player.y / TILESIZE))
                 self.message_log.log_system(f"Spawned {enemy_type}")
             else:
                 self.message_log.log_system("Usage: /spawn <type>")
@@ -314,11 +364,18 @@ class Game:
             else:
                 self.message_log.log_system("Usage: /give <item_name>")
         
+        elif command == "/combatlog":
+            summary = self.combat_log.summarize()
+            self.message_log.log_system(f"{summary['battles']} battles, {summary['counts']}, crit rate {summary['crit_rate']:.0%}")
+            if args:
+                self.combat_log.export(args[0])
+                self.message_log.log_system(f"Combat log written to {args[0]}")
+        
         else:
             self.message_log.log_system(f"Unknown command: {command}")
 
     def create_enemy(self, enemy_type):
-        return Enemy(self, 0, 0, enemy_type)
+        return self.enemy_pool.acquire(enemy_type)
 
     def check_npc_interaction(self):
         hits = pygame.sprite.spritecollide(self.player, self.npcs, False)
@@ -336,6 +393,7 @@ class Game:
             if npc.quest_id:
                 if self.quest_manager.accept_quest(npc.quest_id):
                     self.dialogue_text += " (Quest Accepted!)"
+            self.event_bus.emit(TALK, npc.dialogue_id)
             return True
         return False
 
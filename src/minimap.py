@@ -0,0 +1,133 @@
+# DragonQuest/src/minimap.py
+import base64
+import numpy as np
+import pygame
+from settings import *
+
+def _lookup(entries, default):
+    """A 256-entry table indexed by tile id"""
+    table = [default] * 256
+    for tile, value in entries.items():
+        table[tile] = value
+    return np.array(table)
+
+# Minimap colour per ground tile id (see WorldGenerator / DungeonGenerator)
+TILE_COLOURS = _lookup({
+    0: GRASS_COLOR,
+    1: DIRT_COLOR,
+    2: WATER_COLOR,
+    3: (0, 100, 0),      # Forest
+    4: (120, 120, 120),  # Mountain
+    5: (90, 90, 90),     # Wall
+    6: (170, 150, 120),  # Floor
+    7: (160, 110, 60),   # Door
+}, DEBUG_COLOR).astype(np.uint8)
+
+# Map dump glyph per ground tile id
+TILE_GLYPHS = _lookup({0: ".", 1: ":", 2: "~", 3: "T", 4: "^", 5: "#"}, "?")
+
+def ascii_rows(ground, x0, y0, x1, y1, marker=None):
+    """Rows of glyphs for ground[y0:y1, x0:x1], with (x, y) marker drawn as P"""
+    glyphs = TILE_GLYPHS[ground[y0:y1, x0:x1].astype(np.uint8)]
+    if marker is not None:
+        mx, my = marker
+        if x0 <= mx < x1 and y0 <= my < y1:
+            glyphs[my - y0, mx - x0] = "P"
+    return ["".join(row) for row in glyphs]
+
+class Minimap:
+    """Overview of the current map in the corner of the screen. The ground layer
+    goes through TILE_COLOURS into a Surface with surfarray; tiles the hero has
+    not been near stay fogged. Each map keeps a visited mask, and moving only
+    re-colours the minimap pixels around the newly revealed tiles."""
+    def __init__(self, game):
+        self.game = game
+        self.visited = {} # map_id -> bool array (height, width)
+        self.map_id = None
+        self.ground = None
+        self.surface = None
+        self.tile = None
+        self.visible = True
+        radius = MINIMAP_REVEAL_RADIUS
+        offsets = np.arange(-radius, radius + 1)
+        self.reveal_disc = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+
+    def load(self, map_id, ground):
+        """Switch to a map, rendering its minimap in full once"""
+        self.map_id = map_id
+        self.ground = ground
+        height, width = ground.shape
+        if map_id not in self.visited or self.visited[map_id].shape != ground.shape:
+            self.visited[map_id] = np.zeros((height, width), dtype=bool)
+        # Minimap pixel -> tile, nearest neighbour in both directions
+        scale = min(MINIMAP_SIZE / width, MINIMAP_SIZE / height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self.cols = np.arange(size[0]) * width // size[0]
+        self.rows = np.arange(size[1]) * height // size[1]
+        self.scale = scale
+        self.surface = pygame.Surface(size)
+        self.tile = None
+        self.paint(0, size[0], 0, size[1])
+
+    def paint(self, px0, px1, py0, py1):
+        """Re-colour the minimap pixels in [px0, px1) x [py0, py1)"""
+        rows, cols = self.rows[py0:py1, None], self.cols[None, px0:px1]
+        colours = TILE_COLOURS[self.ground[rows, cols].astype(np.uint8)]
+        colours[~self.visited[self.map_id][rows, cols]] = MINIMAP_FOG_COLOR
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[px0:px1, py0:py1] = colours.transpose(1, 0, 2)
+        del pixels # Unlocks the surface
+
+    def reveal(self, x, y):
+        """Mark the tiles around (x, y) as visited"""
+        if self.surface is None or (x, y) == self.tile:
+            return
+        self.tile = (x, y)
+        visited = self.visited[self.map_id]
+        height, width = visited.shape
+        r = MINIMAP_REVEAL_RADIUS
+        x0, x1 = max(0, x - r), min(width, x + r + 1)
+        y0, y1 = max(0, y - r), min(height, y + r + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        disc = self.reveal_disc[y0 - y + r:y1 - y + r, x0 - x + r:x1 - x + r]
+        window = visited[y0:y1, x0:x1]
+        if not (disc & ~window).any():
+            return # Nothing new around here
+        window |= disc
+        self.paint(np.searchsorted(self.cols, x0), np.searchsorted(self.cols, x1),
+                   np.searchsorted(self.rows, y0), np.searchsorted(self.rows, y1))
+
+    def refresh_tile(self, x, y):
+        """A ground tile changed at runtime"""
+        if self.surface is None:
+            return
+        self.paint(np.searchsorted(self.cols, x), np.searchsorted(self.cols, x + 1),
+                   np.searchsorted(self.rows, y), np.searchsorted(self.rows, y + 1))
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, screen):
+        if not self.visible or self.surface is None:
+            return
+        x = WIDTH - self.surface.get_width() - 10
+        y = MINIMAP_TOP
+        screen.blit(self.surface, (x, y))
+        pygame.draw.rect(screen, WHITE, (x - 1, y - 1, self.surface.get_width() + 2, self.surface.get_height() + 2), 1)
+        if self.tile:
+            tx, ty = self.tile
+            pygame.draw.rect(screen, WHITE, (x + int(tx * self.scale) - 1, y + int(ty * self.scale) - 1, 3, 3))
+
+    def to_dict(self):
+        """Visited masks as packed bits, one entry per explored map"""
+        return {map_id: {"shape": list(visited.shape), "bits": base64.b64encode(np.packbits(visited)).decode("ascii")}
+                for map_id, visited in self.visited.items() if visited.any()}
+
+    def from_dict(self, data):
+        for map_id, entry in data.items():
+            height, width = entry["shape"]
+            bits = np.frombuffer(base64.b64decode(entry["bits"]), dtype=np.uint8)
+            self.visited[map_id] = np.unpackbits(bits, count=height * width).astype(bool).reshape(height, width)
+        if self.map_id in data:
+            self.load(self.map_id, self.ground) # Repaint with the restored fog
@@ -0,0 +1,70 @@
+# DragonQuest/src/placement.py
+import numpy as np
+
+def walkable_mask(width, height, is_blocked_func):
+    """Walkable tiles as a bool array, for maps that only offer is_blocked"""
+    return np.array([[not is_blocked_func(x, y) for x in range(width)] for y in range(height)], dtype=bool)
+
+class Placement:
+    """Spreads entities over the walkable tiles of a map. Candidates are one
+    jittered tile per spacing x spacing cell, thinned Poisson-disk style so no
+    two points are closer than spacing. Placed points stay taken, so later
+    scatter calls keep their distance from earlier ones."""
+    _discs = {}
+
+    def __init__(self, free):
+        self.free = np.array(free, dtype=bool) # Copied: points are stamped into it
+        self.height, self.width = self.free.shape
+
+    @classmethod
+    def from_collision(cls, collision):
+        return cls(np.asarray(collision) == 0)
+
+    @classmethod
+    def disc(cls, spacing):
+        """Tiles closer than spacing to the centre of a (2 * spacing - 1) square"""
+        disc = cls._discs.get(spacing)
+        if disc is None:
+            offsets = np.arange(1 - spacing, spacing)
+            disc = offsets[:, None] ** 2 + offsets[None, :] ** 2 < spacing * spacing
+            cls._discs[spacing] = disc
+        return disc
+
+    def stamp(self, x, y, spacing):
+        """Take every tile closer than spacing to (x, y)"""
+        r = spacing - 1
+        x0, x1 = max(0, x - r), min(self.width, x + r + 1)
+        y0, y1 = max(0, y - r), min(self.height, y + r + 1)
+        disc = self.disc(spacing)[y0 - y + r:y1 - y + r, x0 - x + r:x1 - x + r]
+        self.free[y0:y1, x0:x1] &= ~disc
+
+    def candidates(self, rng, spacing, margin):
+        """One random free tile per spacing x spacing cell, in random order"""
+        free = self.free
+        if margin:
+            free = free.copy()
+            free[:margin] = free[-margin:] = False
+            free[:, :margin] = free[:, -margin:] = False
+        ys, xs = np.nonzero(free)
+        if not len(ys):
+            return ys, xs
+        cells = (ys // spacing) * (self.width // spacing + 1) + xs // spacing
+        order = np.lexsort((rng.random(len(ys)), cells))
+        sorted_cells = cells[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+        picks = rng.permutation(order[first])
+        return ys[picks], xs[picks]
+
+    def scatter(self, rng, count, spacing=2, margin=0):
+        """Up to count (x, y) tiles from a numpy Generator, at least spacing apart"""
+        spacing = max(1, int(spacing))
+        ys, xs = self.candidates(rng, spacing, margin)
+        points = []
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            if len(points) == count:
+                break
+            if self.free[y, x]: # Not stamped by a neighbour accepted before it
+                points.append((x, y))
+                self.stamp(x, y, spacing)
+        return points
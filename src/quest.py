@@ -1,17 +1,45 @@
+import event_bus
+from flags import FlagRegistry
+
+# quest_type -> the event that advances it
+QUEST_EVENTS = {
+    "kill": event_bus.KILL,
+    "talk": event_bus.TALK,
+    "find": event_bus.ITEM_ACQUIRED,
+    "flag": event_bus.FLAG_SET,
+}
+
 class Quest:
-    def __init__(self, quest_id, name, description, quest_type, target, reward_xp, reward_gold, reward_spell=None):
+    def __init__(self, quest_id, name, description, quest_type, target, reward_xp, reward_gold, reward_spell=None, goal=1):
         self.quest_id = quest_id
         self.name = name
         self.description = description
-        self.quest_type = quest_type  # "kill", "talk", "find"
-        self.target = target  # e.g., "slime" for kill quests
+        self.quest_type = quest_type  # "kill", "talk", "find", "flag"
+        self.event = QUEST_EVENTS.get(quest_type, quest_type)
+        # One id or a list of them, e.g. every slime variant for a kill quest
+        self.targets = [target] if isinstance(target, str) else list(target)
+        self.target = self.targets[0]
         self.progress = 0
-        self.goal = 1
+        self.goal = goal
         self.completed = False
         self.reward_xp = reward_xp
         self.reward_gold = reward_gold
         self.reward_spell = reward_spell  # Spell name to learn
-    
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(
+            quest_id=data["quest_id"],
+            name=data.get("name", "Quest"),
+            description=data.get("description", ""),
+            quest_type=data.get("quest_type", "kill"),
+            target=data.get("target", ""),
+            reward_xp=data.get("reward_xp", 0),
+            reward_gold=data.get("reward_gold", 0),
+            reward_spell=data.get("reward_spell"),
+            goal=data.get("goal", 1),
+        )
+
     def update_progress(self, amount=1):
         """Increase quest progress"""
         if self.completed: return
@@ -20,95 +48,104 @@ class Quest:
             self.completed = True
 
     def check_condition(self, player):
-        """Check if quest condition is met (for 'find' quests)"""
+        """Recount a 'find' quest against the player's inventory"""
         if self.completed: return True
-        
+
         if self.quest_type == "find":
-            # Check player inventory for target item
-            # Assuming target is item_id
-            count = player.inventory_items.get(self.target, 0)
-            self.progress = count
+            self.progress = count_items(player, self.targets)
             if self.progress >= self.goal:
                 self.completed = True
                 return True
         return False
 
+def count_items(player, item_ids):
+    inventory = getattr(player, 'inventory', None)
+    if inventory is None:
+        return 0
+    return sum(inventory.count(item_id) for item_id in item_ids)
+
 class QuestManager:
+    """Quest definitions come from data/quests.json. Active objectives are indexed
+    by (event, target) and advanced by the game's event bus (flags by the flag
+    registry), so a kill or a conversation only touches the quests waiting on it."""
     def __init__(self, game):
         self.game = game
         self.active_quests = []
         self.completed_quests = []
-        self.flags = {}  # Story flags
-        # Load quests from JSON file if present
+        self.flags = game.flags if hasattr(game, 'flags') else FlagRegistry() # Story flags
+        self.objectives = {} # (event, target) -> active quests still waiting on it
         self.available_quests = self._load_quests_from_file()
+        if hasattr(game, 'event_bus'):
+            for event in (event_bus.KILL, event_bus.TALK, event_bus.ITEM_ACQUIRED):
+                game.event_bus.subscribe(event, self.on_event)
+        # Flag objectives hear straight from the registry
+        self.flags.subscribe(None, self.flag_changed)
 
     def _load_quests_from_file(self):
         """Load quest definitions from src/data/quests.json"""
-        import json, os
+        data = self.game.data_manager.get_data("quests") if hasattr(self.game, 'data_manager') else None
         quests = {}
-        # For now, hardcode extended quests to avoid file dependency issues during this step
-        # In a full implementation, this would load from JSON
-        return self._create_default_quests()
-
-    def _create_default_quests(self):
-        """Define default quests"""
-        quests = {
-            1: Quest(
-                quest_id=1,
-                name="Slime Slayer",
-                description="Defeat 5 slimes to prove your worth!",
-                quest_type="kill",
-                target="slime",
-                reward_xp=50,
-                reward_gold=25,
-                reward_spell="heal"
-            ),
-            2: Quest(
-                quest_id=2,
-                name="Meet the Wizard",
-                description="Find and talk to the Wizard in the northern town.",
-                quest_type="talk",
-                target="wizard",
-                reward_xp=30,
-                reward_gold=15,
-                reward_spell="fireball"
-            ),
-            3: Quest(
-                quest_id=3,
-                name="Potion Master",
-                description="Bring 3 Potions to the Merchant.",
-                quest_type="find",
-                target="potion",
-                reward_xp=100,
-                reward_gold=50
-            )
-        }
-        quests[1].goal = 5
-        quests[3].goal = 3
+        for entry in data or []:
+            quest = Quest.from_data(entry)
+            quests[quest.quest_id] = quest
         return quests
-    
+
+    def _index(self, quest):
+        for target in quest.targets:
+            self.objectives.setdefault((quest.event, target), []).append(quest)
+
+    def _unindex(self, quest):
+        for target in quest.targets:
+            waiting = self.objectives.get((quest.event, target))
+            if waiting and quest in waiting:
+                waiting.remove(quest)
+                if not waiting:
+                    del self.objectives[(quest.event, target)]
+
+    def _activate(self, quest):
+        self.active_quests.append(quest)
+        if not quest.completed:
+            self._index(quest)
+
     def accept_quest(self, quest_id):
         """Add a quest to active quests"""
         if quest_id in self.available_quests:
             quest = self.available_quests[quest_id]
             if quest not in self.active_quests and quest not in self.completed_quests:
-                self.active_quests.append(quest)
+                # Items already in the bag count towards a find quest
+                if hasattr(self.game, 'player'):
+                    quest.check_condition(self.game.player)
+                self._activate(quest)
                 print(f"Accepted quest: {quest.name}")
                 return True
         return False
-    
+
+    def on_event(self, event, target, amount=1):
+        waiting = self.objectives.get((event, target))
+        if not waiting:
+            return
+        for quest in list(waiting):
+            quest.update_progress(amount)
+            if quest.completed:
+                self._unindex(quest)
+                print(f"Quest Complete: {quest.name}")
+
     def update_kill_quest(self, enemy_type):
         """Update progress for kill quests"""
-        for quest in self.active_quests:
-            if quest.quest_type == "kill" and quest.target.lower() in enemy_type.lower():
-                quest.update_progress()
-                if quest.completed:
-                    print(f"Quest Complete: {quest.name}")
-    
+        self.on_event(event_bus.KILL, enemy_type)
+
+    def set_flag(self, flag, value=True):
+        self.flags.set(flag, value)
+
+    def flag_changed(self, name, value):
+        if value:
+            self.on_event(event_bus.FLAG_SET, name)
+
     def check_quests(self, player):
-        """Check all active quests for completion (mainly for 'find' type)"""
-        for quest in self.active_quests:
+        """Resync 'find' quests with the inventory, e.g. after loading or bulk changes"""
+        for quest in [q for q in self.active_quests if q.quest_type == "find" and not q.completed]:
             if quest.check_condition(player):
+                self._unindex(quest)
                 print(f"Quest Complete: {quest.name}")
 
     def complete_quest(self, quest_id, player):
@@ -118,22 +155,45 @@ class QuestManager:
             if q.quest_id == quest_id:
                 quest = q
                 break
-        
+
         if quest and quest.completed:
             # Give rewards
             player.xp += quest.reward_xp
             player.gold += quest.reward_gold
-            
+
             # Learn spell if reward
             if quest.reward_spell:
                 if quest.reward_spell not in player.known_spells:
                     player.known_spells.append(quest.reward_spell)
                     print(f"Learned spell: {quest.reward_spell}")
-            
+
             # Move to completed
             self.active_quests.remove(quest)
             self.completed_quests.append(quest)
-            self.flags[f"quest_{quest_id}_completed"] = True
-            
+            self.set_flag(f"quest_{quest_id}_completed")
+
             return True
         return False
+
+    def to_dict(self):
+        """Serialize quest progress (definitions come from data)"""
+        return {
+            "active": [{"id": q.quest_id, "progress": q.progress, "completed": q.completed} for q in self.active_quests],
+            "completed": [q.quest_id for q in self.completed_quests],
+        }
+
+    def from_dict(self, data):
+        self.active_quests = []
+        self.completed_quests = []
+        self.objectives = {}
+        for entry in data.get("active", []):
+            quest = self.available_quests.get(entry["id"])
+            if quest:
+                quest.progress = entry.get("progress", 0)
+                quest.completed = entry.get("completed", False)
+                self._activate(quest)
+        for quest_id in data.get("completed", []):
+            quest = self.available_quests.get(quest_id)
+            if quest:
+                quest.completed = True
+                self.completed_quests.append(quest)
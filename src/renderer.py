@@ -15,6 +15,8 @@ class Renderer:
             self.game.message_log.draw(self.game.screen)
             self.game.console.draw(self.game.screen)
             self.game.hud.draw()
+            if hasattr(self.game, 'minimap'):
+                self.game.minimap.draw(self.game.screen)
             
         if self.game.in_dialogue:
             self.game.dialogue_box.draw(self.game.dialogue_text)
@@ -1,6 +1,7 @@
 import pygame
 import os
 from settings import *
+import asset_pipeline
 
 class ResourceManager:
     _instance = None
@@ -18,26 +19,48 @@ class ResourceManager:
         return cls._instance
 
     def _load_assets(self):
-        # Load Core Assets
-        self.load_image('Hero.png', scale=(SPRITE_RENDER_SIZE, SPRITE_RENDER_SIZE))
-        self.load_image('Slime.png', scale=(SPRITE_RENDER_SIZE, SPRITE_RENDER_SIZE))
-        self.load_image('croc_boss.png', scale=(SPRITE_RENDER_SIZE * 2, SPRITE_RENDER_SIZE * 2))
-        self.load_image('Spiteful_Sprite.png', scale=(SPRITE_RENDER_SIZE, SPRITE_RENDER_SIZE))
+        # Sprites prebuilt by asset_pipeline.py at their draw size
+        self.manifest = asset_pipeline.load_manifest(self.assets_folder)
+        self.specs = None # Source specs, only read if something wasn't built
+        for asset_id in ("hero", "tile/grass", "tile/dirt", "tile/water"):
+            self.get_sprite(asset_id)
 
+    def get_sprite(self, asset_id):
+        """A draw-ready (premultiplied) sprite by asset id, e.g. "hero" or "enemy/slime".
+        Returns None when there is no art for it."""
+        if asset_id in self.images:
+            return self.images[asset_id]
+        img = None
+        entry = self.manifest.get(asset_id)
+        if entry:
+            path = os.path.join(self.assets_folder, asset_pipeline.BUILD_DIR, entry["file"])
+            try:
+                img = pygame.image.load(path).convert_alpha()
+            except (FileNotFoundError, pygame.error):
+                img = None
+        if img is None:
+            img = self._render_from_source(asset_id)
+        self.images[asset_id] = img
+        return img
 
+    def _render_from_source(self, asset_id):
+        """Fallback for an unbuilt tree: same output as the pipeline, paid at load time"""
+        if self.specs is None:
+            self.specs = asset_pipeline.collect_specs(os.path.join(self.game_folder, 'data'))
+        spec = self.specs.get(asset_id)
+        if not spec:
+            return None
+        path = os.path.join(self.assets_folder, spec["source"])
+        if not os.path.exists(path):
+            return None
+        if self.game:
+            self.game.logger.warning(f"Sprite {asset_id} is not built; run asset_pipeline.py")
+        return asset_pipeline.render(spec, pygame.image.load(path)).convert_alpha()
 
-        # Items
-        item_files = {
-            "Jamaican Dream": "Jamaican Dream.png",
-            "Lamb's Bread": "Lamb's Bread.png",
-            "SATIVA!": "SATIVA!.png"
-        }
-        for name, filename in item_files.items():
-            self.load_image(filename, scale=(SPRITE_RENDER_SIZE, SPRITE_RENDER_SIZE))
-        
-        self.load_image('Grass.png', scale=(TILESIZE, TILESIZE))
-        self.load_image('Dirt.png', scale=(TILESIZE, TILESIZE))
-        self.load_image('Water.png', scale=(TILESIZE, TILESIZE))
+    def placeholder(self, size):
+        surf = pygame.Surface(size)
+        surf.fill((255, 0, 255)) # Magenta placeholder
+        return surf
 
     def load_image(self, filename, scale=None, alpha=True):
         if filename in self.images:
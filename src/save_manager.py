@@ -1,54 +1,418 @@
+import asyncio
 import json
 import os
+import struct
+import sys
+import threading
+import time
+import zlib
+import numpy as np
+import pygame
+from settings import AUTOSAVE_INTERVAL, SAVE_SLOTS, SAVE_THUMBNAIL_SIZE, TILESIZE
+
+# Binary save layout (little endian):
+#   header  : magic (4s) | version (H) | section count (H)
+#   section : tag (8s)   | flags (B)   | payload length (I) | payload
+# Payloads are compact JSON, zlib-compressed when it pays off.
+SAVE_MAGIC = b"DQSV"
+SAVE_VERSION = 1
+HEADER_FORMAT = "<4sHH"
+SECTION_FORMAT = "<8sBI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SECTION_HEADER_SIZE = struct.calcsize(SECTION_FORMAT)
+
+SECTION_COMPRESSED = 0x01
+COMPRESS_THRESHOLD = 128 # Tiny payloads are stored raw
+
+# Slot summaries live in a small JSON index next to the saves so the
+# title screen can list them without opening every save file.
+SAVE_INDEX_NAME = "saves_index.json"
+
+def _json_default(value):
+    """Unwrap numpy values that json can't encode"""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+def encode_payload(data):
+    """Encode a section's data as compact JSON bytes"""
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+def pack_section(tag, payload, compress=True):
+    """Pack one section (header + payload) into bytes"""
+    if len(tag) > 8:
+        raise ValueError(f"Section tag '{tag}' is longer than 8 bytes")
+    flags = 0
+    if compress and len(payload) >= COMPRESS_THRESHOLD:
+        packed = zlib.compress(payload, 6)
+        if len(packed) < len(payload):
+            payload = packed
+            flags |= SECTION_COMPRESSED
+    return struct.pack(SECTION_FORMAT, tag.encode("ascii"), flags, len(payload)) + payload
+
+def pack_save(sections):
+    """Join already packed sections into a complete save blob"""
+    header = struct.pack(HEADER_FORMAT, SAVE_MAGIC, SAVE_VERSION, len(sections))
+    return header + b"".join(sections)
+
+def unpack_save(blob):
+    """Decode a save blob into a dict of section tag -> data"""
+    if len(blob) < HEADER_SIZE:
+        raise ValueError("Save file is truncated")
+    magic, version, count = struct.unpack_from(HEADER_FORMAT, blob, 0)
+    if magic != SAVE_MAGIC:
+        raise ValueError("Not a save file")
+    if version > SAVE_VERSION:
+        raise ValueError(f"Save version {version} is newer than supported ({SAVE_VERSION})")
+
+    sections = {}
+    offset = HEADER_SIZE
+    for _ in range(count):
+        if offset + SECTION_HEADER_SIZE > len(blob):
+            raise ValueError("Save file is truncated")
+        raw_tag, flags, length = struct.unpack_from(SECTION_FORMAT, blob, offset)
+        offset += SECTION_HEADER_SIZE
+        payload = blob[offset:offset + length]
+        if len(payload) != length:
+            raise ValueError("Save file is truncated")
+        offset += length
+        if flags & SECTION_COMPRESSED:
+            payload = zlib.decompress(payload)
+        sections[raw_tag.rstrip(b"\0").decode("ascii")] = json.loads(payload)
+    return sections
 
 class SaveManager:
-    def __init__(self, game, filename='savegame.json'):
+    def __init__(self, game, slot=1):
         self.game = game
-        self.filename = os.path.join(os.path.dirname(__file__), filename)
+        self.save_dir = os.path.dirname(__file__)
+        self.legacy_filename = os.path.join(self.save_dir, 'savegame.json')
+        self.autosave_interval = AUTOSAVE_INTERVAL
+        self.autosave_timer = 0
 
-    def save_game(self):
-        data = {
-            "hero": self.game.player.to_dict(),
+        # tag -> (crc of raw payload, packed section bytes) from the last write
+        self._section_cache = {}
+        self._io_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+        # Background writer. The browser build has no threads, so it writes inline.
+        self.threaded = sys.platform != 'emscripten'
+        self._pending = None
+        self._writing = False
+        self._wakeup = threading.Condition(self._lock)
+        self._worker = None
+
+        # Async load progress, polled by the title screen
+        self.loading = False
+        self.load_progress = 0.0
+
+        self.set_slot(slot)
+
+    def slot_filename(self, slot):
+        return os.path.join(self.save_dir, f"save_slot{slot}.dat")
+
+    def set_slot(self, slot):
+        """Point saves at another slot"""
+        self.wait() # Don't let a queued autosave land in the new slot
+        self.slot = slot
+        self.filename = self.slot_filename(slot)
+        self._section_cache.clear() # Cached sections belong to the old file
+
+    @property
+    def index_filename(self):
+        return os.path.join(os.path.dirname(self.filename), SAVE_INDEX_NAME)
+
+    @property
+    def thumbnail_filename(self):
+        return os.path.splitext(self.filename)[0] + ".png"
+
+    def collect_sections(self):
+        """Snapshot game state as encoded section payloads (main thread only)"""
+        player = self.game.player
+        quest_manager = self.game.quest_manager
+        sections = {
+            "hero": player.to_dict(),
             "world": {
                 "map_id": self.game.current_map_id,
-                "x": self.game.player.x / 32, # Save as grid coords for safety
-                "y": self.game.player.y / 32
+                "x": player.x / TILESIZE, # Save as grid coords for safety
+                "y": player.y / TILESIZE,
+                "playtime": round(self.game.playtime, 1)
             },
-            "flags": self.game.quest_manager.flags if hasattr(self.game.quest_manager, 'flags') else {}
+            "flags": quest_manager.flags.to_dict(),
+            "quests": quest_manager.to_dict(),
+            "items": player.inventory.to_dict(),
+            "maps": self.game.world_state.to_dict(),
+            "fog": self.game.minimap.to_dict(),
         }
-        
+        return {tag: encode_payload(data) for tag, data in sections.items()}
+
+    def collect_meta(self):
+        """Slot summary for the index plus a thumbnail of the screen (main thread only)"""
+        meta = {
+            "timestamp": int(time.time()),
+            "level": int(self.game.player.level),
+            "map_id": self.game.current_map_id,
+            "playtime": round(self.game.playtime, 1),
+        }
+        thumbnail = None
+        screen = getattr(self.game, 'screen', None)
+        if isinstance(screen, pygame.Surface):
+            thumbnail = pygame.transform.smoothscale(screen, SAVE_THUMBNAIL_SIZE)
+        return meta, thumbnail
+
+    def save_game(self):
+        """Write a full save immediately"""
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(data, f, indent=4)
-            self.game.logger.log("Game saved successfully.")
+            payloads = self.collect_sections()
+            meta, thumbnail = self.collect_meta()
+            with self._lock:
+                self._pending = None # Superseded by this snapshot
+            self.wait() # An autosave already being written must not land on top of this one
+            self._write_sections(payloads, meta, thumbnail)
+            self.game.logger.log(f"Game saved to slot {self.slot}.")
             return True
         except Exception as e:
             self.game.logger.error(f"Failed to save game: {e}")
             return False
 
-    def load_game(self):
-        if not os.path.exists(self.filename):
-            self.game.logger.warning("No save file found.")
+    def autosave(self):
+        """Queue an incremental save; the write happens off the main thread"""
+        try:
+            payloads = self.collect_sections()
+            meta, thumbnail = self.collect_meta()
+        except Exception as e:
+            self.game.logger.error(f"Autosave snapshot failed: {e}")
             return False
-            
+
+        if not self.threaded:
+            try:
+                self._write_sections(payloads, meta, thumbnail)
+            except Exception as e:
+                self.game.logger.error(f"Autosave failed: {e}")
+                return False
+            return True
+
+        with self._lock:
+            # Only the newest snapshot matters; an unwritten older one is dropped
+            self._pending = (payloads, meta, thumbnail)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._worker_loop, name="autosave", daemon=True)
+                self._worker.start()
+            self._wakeup.notify()
+        return True
+
+    def update(self, dt):
+        self.autosave_timer += dt
+        if self.autosave_timer >= self.autosave_interval:
+            self.autosave_timer = 0
+            self.autosave()
+
+    def wait(self):
+        """Block until any queued autosave is on disk"""
+        with self._lock:
+            while self._pending is not None or self._writing:
+                self._wakeup.wait(0.05)
+
+    def _worker_loop(self):
+        while True:
+            with self._lock:
+                while self._pending is None:
+                    if not self._wakeup.wait(5.0):
+                        self._worker = None
+                        return
+                snapshot = self._pending
+                self._pending = None
+                self._writing = True
+            try:
+                if self._write_sections(*snapshot):
+                    self.game.logger.debug("Autosave written.")
+            except Exception as e:
+                self.game.logger.error(f"Autosave failed: {e}")
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._wakeup.notify_all()
+
+    def _write_sections(self, payloads, meta=None, thumbnail=None):
+        """Pack changed sections, reuse cached bytes for the rest and swap the file in.
+        Returns False when nothing changed since the last write."""
+        with self._io_lock:
+            written = self._write_sections_locked(payloads)
+            if written and meta is not None:
+                if thumbnail is not None:
+                    pygame.image.save(thumbnail, self.thumbnail_filename)
+                    meta = dict(meta, thumbnail=os.path.basename(self.thumbnail_filename))
+                self._write_index_entry(self.slot, meta)
+            return written
+
+    def _write_sections_locked(self, payloads):
+        changed = False
+        packed = []
+        for tag, payload in payloads.items():
+            crc = zlib.crc32(payload)
+            cached = self._section_cache.get(tag)
+            if cached and cached[0] == crc:
+                packed.append(cached[1])
+                continue
+            section = pack_section(tag, payload)
+            self._section_cache[tag] = (crc, section)
+            packed.append(section)
+            changed = True
+
+        if not changed and os.path.exists(self.filename):
+            return False
+
+        tmp_path = self.filename + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(pack_save(packed))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filename)
+        return True
+
+    def read_index(self):
+        """Return slot number -> summary for every indexed save"""
+        try:
+            with open(self.index_filename, 'r') as f:
+                slots = json.load(f).get("slots", {})
+        except (OSError, ValueError):
+            return {}
+        return {int(slot): entry for slot, entry in slots.items()}
+
+    def _write_index_entry(self, slot, meta):
+        slots = self.read_index()
+        slots[slot] = meta
+        tmp_path = self.index_filename + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": SAVE_VERSION, "slots": {str(k): v for k, v in sorted(slots.items())}}, f)
+        os.replace(tmp_path, self.index_filename)
+
+    def list_slots(self):
+        """(slot, summary or None) for every slot, read from the index only"""
+        index = self.read_index()
+        if 1 not in index and os.path.exists(self.legacy_filename):
+            index[1] = {"legacy": True}
+        return [(slot, index.get(slot)) for slot in range(1, SAVE_SLOTS + 1)]
+
+    def load_thumbnail(self, slot):
+        entry = self.read_index().get(slot)
+        if not entry or "thumbnail" not in entry:
+            return None
+        path = os.path.join(os.path.dirname(self.index_filename), entry["thumbnail"])
+        try:
+            return pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            return None
+
+    def read_save(self, slot=None):
+        """Return the decoded sections of a slot's save on disk, or None"""
+        slot = self.slot if slot is None else slot
+        filename = self.filename if slot == self.slot else self.slot_filename(slot)
+        if os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                return unpack_save(f.read())
+        if slot == 1 and os.path.exists(self.legacy_filename):
+            # Old pretty-printed JSON saves share the section names
+            with open(self.legacy_filename, 'r') as f:
+                return json.load(f)
+        return None
+
+    def load_game(self, slot=None):
+        """Blocking load, for callers outside the event loop"""
         try:
-            with open(self.filename, 'r') as f:
-                data = json.load(f)
-                
-            # Restore World
-            if "world" in data:
-                self.game.load_map(data["world"]["map_id"], data["world"]["x"], data["world"]["y"])
-                
-            # Restore Hero
-            if "hero" in data:
-                self.game.player.from_dict(data["hero"])
-                
-            # Restore Flags
-            if "flags" in data and hasattr(self.game.quest_manager, 'flags'):
-                self.game.quest_manager.flags = data["flags"]
-                
-            self.game.logger.log("Game loaded successfully.")
+            data = self.read_save(slot)
+            if data is None:
+                self.game.logger.warning("No save file found.")
+                return False
+            for _ in self._restore(data, slot):
+                pass
             return True
         except Exception as e:
             self.game.logger.error(f"Failed to load game: {e}")
             return False
+
+    async def load_game_async(self, slot=None):
+        """Restore a save a step at a time, yielding to the event loop in between
+        so the screen keeps drawing. Progress is published in load_progress."""
+        self.loading = True
+        self.load_progress = 0.0
+        try:
+            if self.threaded:
+                data = await asyncio.to_thread(self.read_save, slot)
+            else:
+                data = self.read_save(slot)
+            if data is None:
+                self.game.logger.warning("No save file found.")
+                return False
+            for progress in self._restore(data, slot):
+                self.load_progress = progress
+                await asyncio.sleep(0)
+            return True
+        except Exception as e:
+            self.game.logger.error(f"Failed to load game: {e}")
+            return False
+        finally:
+            self.loading = False
+
+    def _restore(self, data, slot=None):
+        """Apply decoded save sections, yielding progress between the slow steps"""
+        game = self.game
+        try:
+            game.new(generate_maps=False)
+            yield from self._restore_sections(data, slot)
+        except Exception:
+            # Don't leave a half-restored game looking like a running one: with
+            # no map, starting a new game builds everything again from scratch
+            game.map = None
+            raise
+
+    def _restore_sections(self, data, slot):
+        game = self.game
+        if "maps" not in data:
+            game.maps = game.generate_maps()
+        yield 0.1
+
+        # Rebuild generated maps from their seeds before entering one
+        saved_maps = data.get("maps", {})
+        for i, (map_id, entry) in enumerate(saved_maps.items()):
+            game.world_state.restore_map(map_id, entry)
+            yield 0.1 + 0.7 * (i + 1) / len(saved_maps)
+
+        # Restore World
+        world = data.get("world", {})
+        map_id = world.get("map_id", "world_map")
+        x, y = world.get("x"), world.get("y")
+        if map_id not in game.maps:
+            # Old saves may point at a map that was never persisted
+            game.logger.warning(f"Saved map '{map_id}' is unavailable, returning to the world map.")
+            game.start("world_map")
+        elif x is None or y is None:
+            game.start(map_id) # No saved position: use the map's spawn
+        else:
+            game.start(map_id, int(x), int(y))
+        game.playtime = world.get("playtime", 0)
+        if "fog" in data:
+            game.minimap.from_dict(data["fog"])
+        yield 0.9
+
+        # Restore Hero
+        if "hero" in data:
+            game.player.from_dict(data["hero"])
+        if "items" in data:
+            game.player.inventory.from_dict(data["items"])
+
+        # Restore Flags
+        if "flags" in data:
+            game.quest_manager.flags.from_dict(data["flags"])
+        if "quests" in data:
+            game.quest_manager.from_dict(data["quests"])
+
+        if slot is not None:
+            self.set_slot(slot)
+        # Saved sections now match what is on disk
+        self._section_cache.clear()
+        game.logger.log(f"Game loaded from slot {self.slot}.")
+        yield 1.0
@@ -1,8 +1,11 @@
+import asyncio
 import pygame
 import numpy as np
 from settings import *
 from game_state import GameState
 from battle import Battle
+from loot_tables import LOOT_TABLES
+from connectivity import RegionMap
 
 class BaseScene(GameState):
     def __init__(self, manager, **kwargs):
@@ -23,16 +26,76 @@ class TitleScene(BaseScene):
         self.font_title = pygame.font.Font(None, 100)
         self.font_sub = pygame.font.Font(None, 40)
         self.font_inst = pygame.font.Font(None, 30)
+        self.font_slot = pygame.font.Font(None, 26)
+
+        # Slot summaries come from the save index, not the saves themselves
+        save_manager = manager.game.save_manager
+        self.slots = save_manager.list_slots()
+        self.thumbnails = {slot: save_manager.load_thumbnail(slot) for slot, entry in self.slots if entry}
+        self.selected = 0
+        self.load_task = None
+        self.status = ""
+        self.overwrite_slot = None # Occupied slot SPACE was pressed on once already
 
     def handle_input(self, event):
+        if self.load_task:
+            return # Ignore input while a save is being restored
+        game = self.manager.game
         if event.type == pygame.KEYUP:
+            if event.key == pygame.K_UP:
+                self.selected = (self.selected - 1) % len(self.slots)
+                self.overwrite_slot = None
+            if event.key == pygame.K_DOWN:
+                self.selected = (self.selected + 1) % len(self.slots)
+                self.overwrite_slot = None
             if event.key == pygame.K_SPACE:
-                self.manager.game.change_scene("world")
+                self.new_game()
+            if event.key == pygame.K_RETURN:
+                self.load_selected()
             if event.key == pygame.K_ESCAPE:
-                self.manager.game.quit()
+                game.quit()
+
+    def new_game(self):
+        """Start a new game in the selected slot, never silently over a save"""
+        game = self.manager.game
+        slot, entry = self.slots[self.selected]
+        if entry and self.overwrite_slot != slot:
+            free = [i for i, (_, other) in enumerate(self.slots) if not other]
+            if free:
+                self.selected = free[0]
+                self.status = f"Slot {slot} has a save. Press SPACE to start in Slot {self.slots[free[0]][0]}."
+            else:
+                self.overwrite_slot = slot
+                self.status = f"Slot {slot} has a save. Press SPACE again to overwrite it."
+            return
+        game.save_manager.set_slot(slot)
+        game.change_scene("world")
+
+    def load_selected(self):
+        game = self.manager.game
+        slot, entry = self.slots[self.selected]
+        if not entry:
+            self.status = "That slot is empty."
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to yield to (tools, tests): load in one go
+            if game.save_manager.load_game(slot):
+                game.change_scene("world")
+            else:
+                self.status = "Could not load that save."
+            return
+        self.load_task = asyncio.ensure_future(game.save_manager.load_game_async(slot))
 
     def update(self, dt):
-        pass
+        if self.load_task and self.load_task.done():
+            loaded = self.load_task.result()
+            self.load_task = None
+            if loaded:
+                self.manager.game.change_scene("world")
+            else:
+                self.status = "Could not load that save."
 
     def draw(self, surface):
         surface.fill(BLACK)
@@ -44,10 +107,48 @@ class TitleScene(BaseScene):
         sub_text = self.font_sub.render("The Lumina Shard", True, WHITE)
         sub_rect = sub_text.get_rect(center=(WIDTH/2, HEIGHT/4 + 60))
         surface.blit(sub_text, sub_rect)
-        
-        inst_text = self.font_inst.render("Press SPACE to Start", True, WHITE)
-        inst_rect = inst_text.get_rect(center=(WIDTH/2, HEIGHT * 3/4))
-        surface.blit(inst_text, inst_rect)
+
+        self.draw_slots(surface, HEIGHT/2 - 20)
+
+        if self.load_task:
+            self.draw_progress(surface, self.manager.game.save_manager.load_progress)
+        else:
+            inst_text = self.font_inst.render("SPACE: New Game   ENTER: Continue   UP/DOWN: Slot", True, WHITE)
+            inst_rect = inst_text.get_rect(center=(WIDTH/2, HEIGHT * 3/4 + 60))
+            surface.blit(inst_text, inst_rect)
+        if self.status:
+            status_text = self.font_slot.render(self.status, True, (255, 100, 100))
+            surface.blit(status_text, status_text.get_rect(center=(WIDTH/2, HEIGHT * 3/4 + 95)))
+
+    def draw_slots(self, surface, top):
+        x = WIDTH/2 - 230
+        for i, (slot, entry) in enumerate(self.slots):
+            y = top + i * 34
+            color = (255, 215, 0) if i == self.selected else WHITE
+            surface.blit(self.font_slot.render(f"Slot {slot}: {self.describe_slot(entry)}", True, color), (x, y))
+
+        slot, entry = self.slots[self.selected]
+        thumbnail = self.thumbnails.get(slot)
+        if thumbnail:
+            thumb_rect = thumbnail.get_rect(topleft=(WIDTH/2 + 110, top))
+            surface.blit(thumbnail, thumb_rect)
+            pygame.draw.rect(surface, WHITE, thumb_rect, 1)
+
+    def describe_slot(self, entry):
+        if not entry:
+            return "Empty"
+        if entry.get("legacy"):
+            return "Old save"
+        minutes, seconds = divmod(int(entry.get("playtime", 0)), 60)
+        hours, minutes = divmod(minutes, 60)
+        map_name = entry.get("map_id", "?").replace("_", " ").title()
+        return f"Lv {entry.get('level', 1)}  {map_name}  {hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def draw_progress(self, surface, progress):
+        bar = pygame.Rect(WIDTH/2 - 150, HEIGHT * 3/4 + 50, 300, 20)
+        pygame.draw.rect(surface, DARKGREY, bar)
+        pygame.draw.rect(surface, (255, 215, 0), (bar.x, bar.y, int(bar.width * progress), bar.height))
+        pygame.draw.rect(surface, WHITE, bar, 1)
 
 class WorldScene(BaseScene):
     def __init__(self, manager, **kwargs):
@@ -69,6 +170,8 @@ class WorldScene(BaseScene):
                                 hit.interact()
                                 break # Interact with one object at a time
                 
+                if event.key == pygame.K_m:
+                    game.minimap.toggle()
                 if event.key == pygame.K_F10:
                     game.debug = not game.debug
                 if game.debug:
@@ -81,7 +184,7 @@ class WorldScene(BaseScene):
                             game.save_manager.save_game()
                     if event.key == pygame.K_F4:
                         if hasattr(game, 'quest_manager'):
-                            game.quest_manager.flags['test_flag'] = True
+                            game.quest_manager.set_flag('test_flag')
                     if event.key == pygame.K_F6:
                         # Trigger Bud Light Boogie Duo
                         daryl = game.create_enemy("daryl_ledeay")
@@ -90,17 +193,20 @@ class WorldScene(BaseScene):
 
             elif game.in_dialogue:
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    game.in_dialogue = False
-                    game.current_npc = None
+                    if not game.dialogue_box.advance():
+                        game.in_dialogue = False
+                        game.current_npc = None
 
     def update(self, dt):
         game = self.manager.game
         if not game.in_battle:
-            game.all_sprites.update(dt)
-            game.camera.update(game.player)
+            game.sim_lod.update(game.all_sprites, game.camera, dt)
+            game.camera.update(game.player, dt)
+            game.save_manager.update(dt)
             
             grid_x = int(game.player.hit_rect.centerx / TILESIZE)
             grid_y = int(game.player.hit_rect.centery / TILESIZE)
+            game.minimap.reveal(grid_x, grid_y)
             
             # Check for exiting the map boundaries (Infinite World)
             if grid_x < 0 or grid_x >= game.map.world_width or grid_y < 0 or grid_y >= game.map.world_height:
@@ -112,7 +218,7 @@ class WorldScene(BaseScene):
                 elif grid_y >= game.map.world_height: direction = "south"
                 
                 # Generate new sector
-                biome = random.choice(["forest", "desert", "snow"])
+                biome = LOOT_TABLES.draw("sector_biomes", default="forest")
                 sector_data = game.world_gen.generate_sector(biome)
                 new_map_id = sector_data["id"]
                 game.maps[new_map_id] = sector_data
@@ -127,6 +233,9 @@ class WorldScene(BaseScene):
                 # Clamp spawn values
                 new_spawn_x = max(1, min(sector_data["width"]-2, new_spawn_x))
                 new_spawn_y = max(1, min(sector_data["height"]-2, new_spawn_y))
+                # Step onto the nearest tile reachable from the sector's spawn
+                regions = RegionMap(sector_data["layers"]["collision"])
+                new_spawn_x, new_spawn_y = regions.nearest(new_spawn_x, new_spawn_y, regions.region_at(*sector_data["spawn"]))
                 
                 game.load_map(new_map_id, new_spawn_x, new_spawn_y)
                 game.message_log.log_system(f"Entered {biome} sector")
@@ -143,6 +252,7 @@ class WorldScene(BaseScene):
             # Pickup Collision
             hits = pygame.sprite.spritecollide(game.player, game.pickups, True)
             for hit in hits:
+                game.world_state.record_removed(game.current_map_id, getattr(hit, 'entity_uid', None))
                 if hit.type == "potion":
                     game.player.combat.heal(20)
                     game.message_log.log_system("Picked up Potion! +20 HP")
@@ -157,10 +267,12 @@ class WorldScene(BaseScene):
                     game.sound_manager.play("menu") # Coin sound?
                 elif hit.type == "powerup_str":
                     game.player.combat.stats[0] += 1 # Strength
+                    game.player.combat.invalidate_stats()
                     game.message_log.log_system("Strength Up! +1 STR")
                     game.sound_manager.play("magic")
                 elif hit.type == "powerup_spd":
                     game.player.combat.stats[3] += 1 # Agility
+                    game.player.combat.invalidate_stats()
                     # Update speed if needed? MovementComponent might need refresh?
                     # game.player.movement.speed ... usually calculated from agility?
                     # Currently strict speed in MovementComponent.
@@ -171,9 +283,12 @@ class WorldScene(BaseScene):
     def draw(self, surface):
         game = self.manager.game
         surface.fill(BLACK)
+        game.camera.interpolate(game.alpha)
         game.map.draw(surface, game.camera)
+        camera = game.camera
         for sprite in game.all_sprites:
-            surface.blit(sprite.image, game.camera.apply(sprite))
+            if camera.is_visible(sprite):
+                surface.blit(sprite.image, camera.apply(sprite), special_flags=pygame.BLEND_PREMULTIPLIED)
             
         if game.debug:
             game.draw_debug()
@@ -181,12 +296,19 @@ class WorldScene(BaseScene):
 class CombatScene(BaseScene):
     def __init__(self, manager, **kwargs):
         super().__init__(manager)
+        game = self.manager.game
         enemies = kwargs.get("enemies", [])
-        self.battle_system = Battle(self.manager.game, self.manager.game.player, enemies)
+        # One Battle per game, restarted for each encounter
+        if getattr(game, 'battle_system', None) is None:
+            game.battle_system = Battle(game, game.player, enemies)
+        else:
+            game.battle_system.start(game.player, enemies)
+        self.battle_system = game.battle_system
 
     def handle_input(self, event):
         self.battle_system.handle_input(event)
         if not self.battle_system.active:
+            self.battle_system.finish()
             self.manager.game.change_scene("world")
             self.manager.game.in_battle = False
             self.manager.game.battle = None
@@ -220,7 +342,7 @@ class CombatScene(BaseScene):
             player_img = game.player.image
             # Position the player image
             player_pos = player_img.get_rect(center=(130 + 128/2, 150 + 128/2)) # Center at original blit position
-            surface.blit(player_img, player_pos)
+            surface.blit(player_img, player_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
             
         for i, enemy in enumerate(self.battle_system.enemies):
             if enemy.image:
@@ -234,10 +356,11 @@ class CombatScene(BaseScene):
                 original_blit_center_y = 150 + i * 20 + 128/2
                 
                 enemy_pos = enemy_img.get_rect(center=(original_blit_center_x, original_blit_center_y))
-                surface.blit(enemy_img, enemy_pos)
+                surface.blit(enemy_img, enemy_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
         
         if self.battle_system.state == "target_selection":
             if self.battle_system.enemies:
-                cursor_x = WIDTH - 270 - self.battle_system.selected_target * 80 + 64
-                cursor_y = 150 + self.battle_system.selected_target * 20 - 20
+                selected_target = self.battle_system.current_state.selected_target
+                cursor_x = WIDTH - 270 - selected_target * 80 + 64
+                cursor_y = 150 + selected_target * 20 - 20
                 pygame.draw.polygon(surface, (255, 255, 0), [(cursor_x, cursor_y), (cursor_x - 10, cursor_y - 15), (cursor_x + 10, cursor_y - 15)])
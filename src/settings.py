@@ -23,6 +23,41 @@ SPRITE_SCALE_FACTOR = 2
 GRIDWIDTH = WIDTH / TILESIZE
 GRIDHEIGHT = HEIGHT / TILESIZE
 
+# Save Settings
+AUTOSAVE_INTERVAL = 60 # Seconds between background autosaves
+SAVE_SLOTS = 3
+SAVE_THUMBNAIL_SIZE = (120, 90) # Title screen preview, 4:3 like the window
+
+# Combat Settings
+COMBAT_LOG_CAPACITY = 8192 # Events kept in the combat log ring buffer
+
+# Fixed Timestep (the simulation steps at SIM_HZ; drawing interpolates between steps)
+SIM_HZ = 60
+FIXED_DT = 1 / SIM_HZ
+MAX_FRAME_TIME = 0.25 # A longer hitch is dropped rather than simulated
+MAX_STEPS_PER_FRAME = 5
+
+# Simulation LOD (margins in tiles around the visible screen)
+SIM_ACTIVE_MARGIN = 4 # Updated every frame
+SIM_NEAR_MARGIN = 16 # Updated every SIM_NEAR_INTERVAL frames with the summed dt; frozen beyond
+SIM_NEAR_INTERVAL = 4
+SIM_MAX_NEAR_DT = 0.25 # Caps the catch-up step so slow frames don't tunnel through walls
+SIM_LOD_MIN_MAP_TILES = 48 * 48 # Smaller maps simulate everything
+
+# Camera Settings
+CAMERA_SMOOTHING = 10.0 # How fast the view catches up, per second (0 snaps to the target)
+CAMERA_DEADZONE = (64, 48) # Pixels the target can move around the centre before the view follows
+
+# Minimap Settings
+MINIMAP_SIZE = 160 # Longest side in pixels, whatever the map size
+MINIMAP_TOP = 70 # Just below the HUD, in the top right corner
+MINIMAP_REVEAL_RADIUS = 10 # Tiles around the hero that clear the fog
+MINIMAP_FOG_COLOR = (15, 15, 25)
+
+# Audio Settings
+SFX_CHANNEL_GROUPS = {"ui": 2, "combat": 6, "world": 3, "dialogue": 1} # Reserved mixer channels per category
+MUSIC_CROSSFADE_MS = 1200 # Fade out the old track, fade in the next
+
 # Debug Settings
 DEBUG_MODE = False # Toggled with F10
 DEBUG_COLOR = (255, 0, 255) # Magenta for debug visuals
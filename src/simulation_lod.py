@@ -0,0 +1,62 @@
+# DragonQuest/src/simulation_lod.py
+import numpy as np
+import pygame
+from settings import *
+
+class SimulationLOD:
+    """Updates world sprites by distance from the view: every frame inside the
+    screen plus an active margin, at a reduced rate in a wider ring, and not
+    at all beyond it. Tiers are re-sorted each time the ring updates."""
+    def __init__(self):
+        self.configure(0, 0)
+
+    def configure(self, world_width, world_height, overrides=None):
+        """Pick margins for a map (sizes in tiles). Maps can override them with a "sim_lod" entry."""
+        overrides = overrides or {}
+        self.enabled = world_width * world_height > SIM_LOD_MIN_MAP_TILES
+        active = overrides.get("active_margin", SIM_ACTIVE_MARGIN)
+        # The ring shrinks on maps that are only a few screens across
+        near = overrides.get("near_margin", min(SIM_NEAR_MARGIN, max(active + 1, max(world_width, world_height) // 6)))
+        self.active_margin = active * TILESIZE
+        self.near_margin = near * TILESIZE
+        self.interval = overrides.get("interval", SIM_NEAR_INTERVAL)
+        self.frame = 0
+        self.near_dt = 0
+        self.active = []
+        self.near = []
+        self.frozen_count = 0
+
+    def classify(self, sprites, view):
+        sprites = sprites.sprites()
+        if not sprites:
+            self.active, self.near, self.frozen_count = [], [], 0
+            return
+        centers = np.array([sprite.rect.center for sprite in sprites], dtype=np.int32)
+        # Distance from the view rect along the worse axis (0 when on screen)
+        dx = np.maximum(np.maximum(view.left - centers[:, 0], centers[:, 0] - view.right), 0)
+        dy = np.maximum(np.maximum(view.top - centers[:, 1], centers[:, 1] - view.bottom), 0)
+        distance = np.maximum(dx, dy)
+        active = distance <= self.active_margin
+        near = ~active & (distance <= self.near_margin)
+        self.active = [sprites[i] for i in np.flatnonzero(active)]
+        self.near = [sprites[i] for i in np.flatnonzero(near)]
+        self.frozen_count = len(sprites) - len(self.active) - len(self.near)
+
+    def update(self, sprites, camera, dt):
+        if not self.enabled:
+            sprites.update(dt)
+            return
+
+        self.near_dt += dt
+        if self.frame % self.interval == 0:
+            view = pygame.Rect(-camera.x, -camera.y, WIDTH, HEIGHT)
+            self.classify(sprites, view)
+            near_dt = min(self.near_dt, SIM_MAX_NEAR_DT)
+            for sprite in self.near:
+                sprite.update(near_dt)
+            self.near_dt = 0
+        self.frame += 1
+
+        for sprite in self.active:
+            if sprite.alive():
+                sprite.update(dt)
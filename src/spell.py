@@ -16,19 +16,25 @@ class Spell:
         self.chance = data.get("chance", 1.0)
 
 class SpellDatabase:
-    def __init__(self):
+    def __init__(self, data=None):
+        """data: already parsed spells.json (e.g. from DataManager); read from disk if None"""
         self.spells = {}
-        self.load_spells()
+        if data is None:
+            self.load_spells()
+        else:
+            self.build(data)
 
     def load_spells(self):
         path = os.path.join(os.path.dirname(__file__), 'data', 'spells.json')
         if os.path.exists(path):
             with open(path, 'r') as f:
-                data = json.load(f)
-                for spell_id, spell_data in data.items():
-                    self.spells[spell_id] = Spell(spell_id, spell_data)
+                self.build(json.load(f))
         else:
             print("Warning: spells.json not found.")
 
+    def build(self, data):
+        for spell_id, spell_data in data.items():
+            self.spells[spell_id] = Spell(spell_id, spell_data)
+
     def get_spell(self, spell_id):
         return self.spells.get(spell_id)
@@ -0,0 +1,28 @@
+# DragonQuest/src/status_effects.py
+import json
+import os
+
+class StatusDefinition:
+    """What a status does while active: stat modifiers and whether it costs turns"""
+    def __init__(self, status_id, data):
+        self.status_id = status_id
+        self.name = data.get("name", status_id.title())
+        self.modifiers = [(m["stat"], m["amount"], m.get("multiplier", False)) for m in data.get("modifiers", [])]
+        self.skip_turn = data.get("skip_turn", False)
+
+_definitions = None
+
+def get_status_definition(status_id):
+    """Definition from data/status_effects.json; unknown ids are plain timed flags"""
+    global _definitions
+    if _definitions is None:
+        _definitions = {}
+        path = os.path.join(os.path.dirname(__file__), 'data', 'status_effects.json')
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for key, data in json.load(f).items():
+                    _definitions[key] = StatusDefinition(key, data)
+    definition = _definitions.get(status_id)
+    if definition is None:
+        definition = _definitions[status_id] = StatusDefinition(status_id, {})
+    return definition
@@ -33,11 +33,8 @@ class Map:
         if not self.map_data:
             return
 
-        # Calculate visible tile range
-        start_x = max(0, -camera.camera.x // self.tile_size)
-        end_x = min(self.world_width, (-camera.camera.x + WIDTH) // self.tile_size + 1)
-        start_y = max(0, -camera.camera.y // self.tile_size)
-        end_y = min(self.world_height, (-camera.camera.y + HEIGHT) // self.tile_size + 1)
+        # Visible tile range
+        start_x, end_x, start_y, end_y = camera.tile_bounds
         
         # Draw Ground Layer
         for row in range(start_y, end_y):
@@ -55,30 +52,37 @@ class Map:
     def _draw_tile(self, surface, camera, tile, col, row):
         img = None
         if tile == 0:  # GRASS
-            img = self.game.resource_manager.get_image("Grass.png")
+            img = self.game.resource_manager.get_sprite("tile/grass")
         elif tile == 1:  # DIRT
-            img = self.game.resource_manager.get_image("Dirt.png")
+            img = self.game.resource_manager.get_sprite("tile/dirt")
         elif tile == 2:  # WATER
-            img = self.game.resource_manager.get_image("Water.png")
+            img = self.game.resource_manager.get_sprite("tile/water")
         elif tile == 3:  # FOREST
-            img = self.game.resource_manager.get_image("Grass.png") # Placeholder, maybe overlay?
+            img = self.game.resource_manager.get_sprite("tile/grass") # Placeholder, maybe overlay?
         elif tile == 4:  # MOUNTAIN
-            img = self.game.resource_manager.get_image("Dirt.png") # Placeholder
+            img = self.game.resource_manager.get_sprite("tile/dirt") # Placeholder
         elif tile == 5:  # WALL (Town)
             img = None 
         elif tile == 6:  # FLOOR (Town)
-            img = self.game.resource_manager.get_image("Grass.png") # Use grass for floor for now to distinguish from dirt walls
+            img = self.game.resource_manager.get_sprite("tile/grass") # Use grass for floor for now to distinguish from dirt walls
             
         if img:
-            screen_x = col * self.tile_size + camera.camera.x
-            screen_y = row * self.tile_size + camera.camera.y
-            surface.blit(img, (screen_x, screen_y))
+            screen_x = col * self.tile_size + camera.offset_x
+            screen_y = row * self.tile_size + camera.offset_y
+            surface.blit(img, (screen_x, screen_y), special_flags=pygame.BLEND_PREMULTIPLIED)
         elif tile == 5: # WALL fallback
-            screen_x = col * self.tile_size + camera.camera.x
-            screen_y = row * self.tile_size + camera.camera.y
+            screen_x = col * self.tile_size + camera.offset_x
+            screen_y = row * self.tile_size + camera.offset_y
             pygame.draw.rect(surface, (100, 100, 100), (screen_x, screen_y, self.tile_size, self.tile_size))
             pygame.draw.rect(surface, (50, 50, 50), (screen_x, screen_y, self.tile_size, self.tile_size), 2)
 
+    def set_tile(self, layer, x, y, value):
+        """Change a single cell at runtime; the change is kept as a save delta"""
+        self.layers[layer][y, x] = value
+        self.game.world_state.record_cell(self.game.current_map_id, layer, x, y, value)
+        if layer == "ground" and hasattr(self.game, 'minimap'):
+            self.game.minimap.refresh_tile(x, y)
+
     def check_exit(self, x, y):
         """Check if the given tile coordinate is an exit"""
         for exit_point in self.exits:
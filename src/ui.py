@@ -57,56 +57,78 @@ class HUD(UIElement):
         jp_text = self.font_small.render(f"{int(self.game.player.jp)}", True, WHITE)
         self.screen.blit(jp_text, (jp_x, 35))
 
+def wrap_text(font, text, max_width):
+    """Greedy word wrap measured with font.size; a word wider than the line gets its own"""
+    lines = []
+    current_line = ""
+    for word in text.split(' '):
+        test_line = current_line + word + " "
+        if font.size(test_line.rstrip())[0] > max_width:
+            if current_line:
+                lines.append(current_line.strip())
+                current_line = word + " "
+            else:
+                lines.append(word)
+                current_line = ""
+        else:
+            current_line = test_line
+    if current_line:
+        lines.append(current_line.strip())
+    return lines
+
 class DialogueBox(UIElement):
+    max_lines = 4 # Lines per page
+    line_height = 30
+
     def __init__(self, game):
         super().__init__(game)
         self.height = 150
         self.width = WIDTH - 40
         self.x = 20
         self.y = HEIGHT - self.height - 20
+        # Wrapped once per text and rendered once per page
+        self.text = None
+        self.pages = []
+        self.page_index = 0
+        self.page_surfaces = None
+        self.indicator = self.font_large.render("[SPACE to continue...]", True, (255, 255, 100))
+
+    def set_text(self, text):
+        # Ensure text is a string
+        text = text if isinstance(text, str) else str(text)
+        if text == self.text:
+            return
+        self.text = text
+        lines = wrap_text(self.font_large, text, self.width - 40)
+        self.pages = [lines[i:i + self.max_lines] for i in range(0, len(lines), self.max_lines)] or [[]]
+        self.page_index = 0
+        self.page_surfaces = None
+
+    def advance(self):
+        """Next page; False once the last page has been shown"""
+        if self.page_index + 1 < len(self.pages):
+            self.page_index += 1
+            self.page_surfaces = None
+            return True
+        self.text = None # Talking again starts from the first page
+        return False
 
     def draw(self, text):
+        if text is not self.text:
+            self.set_text(text)
+        if self.page_surfaces is None:
+            self.page_surfaces = [self.font_large.render(line, True, WHITE) for line in self.pages[self.page_index]]
+
         pygame.draw.rect(self.screen, BLACK, (self.x, self.y, self.width, self.height))
         pygame.draw.rect(self.screen, WHITE, (self.x, self.y, self.width, self.height), 4)
-        
-        # Ensure text is a string
-        text = text if isinstance(text, str) else str(text)
-        
-        # Word wrapping
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        max_width = self.width - 40
-        
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = self.font_large.render(test_line, True, WHITE)
-            if test_surface.get_width() > max_width:
-                if current_line:
-                    lines.append(current_line.strip())
-                    current_line = word + " "
-                else:
-                    lines.append(word)
-                    current_line = ""
-            else:
-                current_line = test_line
-                
-        if current_line:
-            lines.append(current_line.strip())
-        
-        # Draw lines (max 4 lines visible at once)
-        max_lines = 4
+
         y_offset = self.y + 15
-        line_height = 30
-        
-        for i, line in enumerate(lines[:max_lines]):
-            text_surface = self.font_large.render(line, True, WHITE)
-            self.screen.blit(text_surface, (self.x + 20, y_offset + i * line_height))
-            
+        for i, text_surface in enumerate(self.page_surfaces):
+            self.screen.blit(text_surface, (self.x + 20, y_offset + i * self.line_height))
+
         # Show indicator if there's more text
-        if len(lines) > max_lines:
-            indicator = self.font_large.render("[SPACE to continue...]", True, (255, 255, 100))
-            self.screen.blit(indicator, (self.x + 20, self.y + self.height - 30))
+        if self.page_index + 1 < len(self.pages):
+            self.screen.blit(self.indicator, (self.x + 20, self.y + self.height - 30))
 
 class BattleUI(UIElement):
     def __init__(self, game):
@@ -283,18 +305,17 @@ class BattleUI(UIElement):
     def draw_item_menu(self, surface, state, x, y):
         visible_count = 5
         start_idx = max(0, state.selected_item - 2)
-        end_idx = min(len(state.item_names) + 1, start_idx + visible_count)
+        end_idx = min(len(state.stacks) + 1, start_idx + visible_count)
         
         for i in range(start_idx, end_idx):
             display_idx = i - start_idx
-            if i == len(state.item_names):
+            if i == len(state.stacks):
                 text = "Back"
                 qty = ""
             else:
-                item_name = state.item_names[i]
-                count = len(state.grouped_items[item_name])
-                text = item_name
-                qty = f"x{count}"
+                stack = state.stacks[i]
+                text = stack.item.name
+                qty = f"x{stack.count}"
                 
             color = (255, 215, 0) if i == state.selected_item else WHITE
             prefix = "> " if i == state.selected_item else "  "
@@ -544,6 +565,6 @@ class JobMenu(UIElement):
     def change_job(self, job_id):
         player = self.game.player
         if player.job != job_id:
-            player.job = job_id
+            player.set_job(job_id)
             player.jp = 0 # Reset JP on job change
             self.game.message_log.log_system(f"Changed job to {job_id.capitalize()}.")
@@ -2,12 +2,16 @@ import random
 import math
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional, Callable
+from loot_tables import LOOT_TABLES
+from placement import Placement, walkable_mask
+from connectivity import RegionMap, connect_regions
 
 class WorldGenerator:
     def __init__(self, seed=None):
         self.seed = seed if seed else random.randint(0, 10000)
         random.seed(self.seed)
         np.random.seed(self.seed)
+        self.loot_tables = LOOT_TABLES # Spawn tables for get_map_entities
         
         # Tile types
         self.GRASS = 0
@@ -18,8 +22,10 @@ class WorldGenerator:
         self.WALL = 5
         self.FLOOR = 6
         
-    def generate_world_map(self, width: int = 100, height: int = 100) -> Dict[str, Any]:
+    def generate_world_map(self, width: int = 100, height: int = 100, seed: Optional[int] = None) -> Dict[str, Any]:
         """Generate the 'Inner Sea' World Map"""
+        seed = self.seed if seed is None else seed
+        rng = random.Random(seed)
         # Initialize layers using NumPy
         ground = np.full((height, width), self.WATER, dtype=np.int8)
         decoration = np.zeros((height, width), dtype=np.int8)
@@ -42,7 +48,7 @@ class WorldGenerator:
                 # Land Ring (The Donut)
                 elif dist < outer_radius:
                     # Noise for terrain variety
-                    noise = self._noise(x * 0.1, y * 0.1)
+                    noise = self._noise(x * 0.1, y * 0.1, seed)
                     if noise > 0.2:
                         ground[y][x] = self.FOREST
                     elif noise > 0:
@@ -85,8 +91,8 @@ class WorldGenerator:
         found_spawn = False
         
         for _ in range(100):
-            angle = random.uniform(0, 2 * math.pi)
-            dist = random.uniform(inner_radius + 2, outer_radius - 2)
+            angle = rng.uniform(0, 2 * math.pi)
+            dist = rng.uniform(inner_radius + 2, outer_radius - 2)
             tx = int(center_x + dist * math.cos(angle))
             ty = int(center_y + dist * math.sin(angle))
             
@@ -97,20 +103,20 @@ class WorldGenerator:
                     break
         
         if not found_spawn:
-            print("Warning: Could not find a suitable spawn tile. Forcing land at default.")
-            # Pick a spot in the ring and force it to be land
-            angle = 0
-            dist = (inner_radius + outer_radius) / 2
-            spawn_x = int(center_x + dist * math.cos(angle))
-            spawn_y = int(center_y + dist * math.sin(angle))
-            ground[spawn_y][spawn_x] = self.GRASS
-            collision[spawn_y][spawn_x] = 0
+            # Settle for the land tile nearest the middle of the ring
+            regions = RegionMap(collision)
+            spawn_x, spawn_y = regions.nearest(center_x + (inner_radius + outer_radius) // 2, center_y, regions.largest())
 
+        # The town and dungeon entrances must be reachable from the spawn
+        connect_regions(ground, collision, (spawn_x, spawn_y), self.GRASS, min_size=width * height,
+                        points=[(town_x, town_y), (dungeon_x, dungeon_y)])
 
         return {
             "id": "world_map",
             "width": width,
             "height": height,
+            "seed": seed,
+            "recipe": {"generator": "world", "seed": seed, "width": width, "height": height},
             "layers": {
                 "ground": ground,
                 "decoration": decoration,
@@ -157,6 +163,7 @@ class WorldGenerator:
             "id": "town_01",
             "width": width,
             "height": height,
+            "recipe": {"generator": "town"},
             "layers": {
                 "ground": ground,
                 "decoration": decoration,
@@ -172,8 +179,11 @@ class WorldGenerator:
             "spawn": (10, 15)
         }
 
-    def generate_sector(self, sector_type="forest", width=100, height=100) -> Dict[str, Any]:
+    def generate_sector(self, sector_type="forest", width=100, height=100, seed: Optional[int] = None) -> Dict[str, Any]:
         """Generate a procedural sector based on type"""
+        if seed is None:
+            seed = random.randint(0, 99999)
+        rng = random.Random(seed)
         ground = np.full((height, width), self.GRASS, dtype=np.int8)
         decoration = np.zeros((height, width), dtype=np.int8)
         collision = np.zeros((height, width), dtype=np.int8)
@@ -199,7 +209,7 @@ class WorldGenerator:
         for y in range(height):
             for x in range(width):
                 # Simple noise
-                noise = self._noise(x * 0.15 + random.random(), y * 0.15 + random.random())
+                noise = self._noise(x * 0.15 + rng.random(), y * 0.15 + rng.random(), seed)
                 if noise > 0.4:
                     ground[y][x] = obstacle_tile
                     if obstacle_tile == self.MOUNTAIN:
@@ -208,18 +218,27 @@ class WorldGenerator:
                         collision[y][x] = 0 # Can walk through forest but maybe slower? (handled in movement?)
                         
         # Edges should be open or gated? For now, open but safe zone at edges
+
+        # Spawn on the main landmass and join any sizeable pocket to it; smaller
+        # pockets stay sealed off and get no entities
+        regions = RegionMap(collision)
+        home = regions.region_at(width // 2, height // 2) or regions.largest()
+        spawn = regions.nearest(width // 2, height // 2, home)
+        connect_regions(ground, collision, spawn, base_tile, min_size=16)
         
         return {
-            "id": f"sector_{sector_type}_{random.randint(0,999)}",
+            "id": f"sector_{sector_type}_{seed}",
             "width": width,
             "height": height,
+            "seed": seed,
+            "recipe": {"generator": "sector", "seed": seed, "biome": sector_type, "width": width, "height": height},
             "layers": {
                 "ground": ground,
                 "decoration": decoration,
                 "collision": collision
             },
             "exits": [], # Exits generated dynamically?
-            "spawn": (width//2, height//2),
+            "spawn": spawn,
             "type": sector_type
         }
 
@@ -233,33 +252,37 @@ class WorldGenerator:
         ground[y+h-1][x+w//2] = self.DIRT
         collision[y+h-1][x+w//2] = 0
 
-    def _noise(self, x, y):
+    def _noise(self, x, y, seed=None):
         """Simple noise function using sine waves"""
-        n = math.sin(x * 12.9898 + y * 78.233 + self.seed) * 43758.5453
+        seed = self.seed if seed is None else seed
+        n = math.sin(x * 12.9898 + y * 78.233 + seed) * 43758.5453
         return (n - math.floor(n)) * 2 - 1
 
-    def get_map_entities(self, map_id: str, map_width: int, map_height: int, is_blocked_func: Callable[[int, int], bool]) -> List[Dict[str, Any]]:
-        """Return a list of entities to spawn on the map"""
+    def get_map_entities(self, map_id: str, map_width: int, map_height: int, is_blocked_func: Callable[[int, int], bool], seed: Optional[int] = None, collision: Optional[np.ndarray] = None, spawn: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+        """Return a list of entities to spawn on the map (deterministic for a given seed).
+        What spawns comes from the weighted tables in data/loot_tables.json; where
+        is spread over the walkable tiles of the collision layer by Placement, kept
+        to the region reachable from spawn and clear of the spawn tile itself."""
+        rng = np.random.default_rng(seed)
         entities = []
+        if collision is None:
+            collision = ~walkable_mask(map_width, map_height, is_blocked_func)
+        if spawn is not None:
+            regions = RegionMap(collision)
+            home = regions.region_at(*spawn) or regions.largest()
+            placement = Placement(regions.mask(home))
+            placement.stamp(spawn[0], spawn[1], 4)
+        else:
+            placement = Placement.from_collision(collision)
         
         if map_id == "world_map":
             # Removed guaranteed Croc at 8,8 as it was in the ocean
-            
-            for _ in range(30): # Increased number of enemies for more variety
-                ex = random.randint(5, map_width - 5)
-                ey = random.randint(5, map_height - 5)
-                if not is_blocked_func(ex, ey):
-                    roll = random.random()
-                    if roll < 0.1: # 10% chance for Croc
-                        entities.append({"type": "enemy", "name": "croc", "x": ex, "y": ey})
-                    elif roll < 0.25: # 15% chance for Spiteful Sprite
-                        entities.append({"type": "enemy", "name": "spiteful_sprite", "x": ex, "y": ey})
-                    elif roll < 0.40: # 15% chance for Vexing Sprite
-                        entities.append({"type": "enemy", "name": "vexing_sprite", "x": ex, "y": ey})
-                    elif roll < 0.50: # 10% chance for Malicious Sprite
-                        entities.append({"type": "enemy", "name": "malicious_sprite", "x": ex, "y": ey})
-                    else: # 50% chance for Slime
-                        entities.append({"type": "enemy", "name": "slime", "x": ex, "y": ey})
+            # NPCs first, well apart and away from the edges, then enemies around them
+            npc_points = placement.scatter(rng, 5, spacing=10, margin=8)
+            points = placement.scatter(rng, 20, spacing=4, margin=5)
+            names = self.loot_tables.draw_many("world_map_enemies", len(points), rng)
+            for (ex, ey), name in zip(points, names):
+                entities.append({"type": "enemy", "name": name, "x": ex, "y": ey})
             
             # Add wandering NPCs to world map
             npc_types = [
@@ -270,14 +293,8 @@ class WorldGenerator:
                 ("Hermit", "hermit")
             ]
             
-            for npc_name, dialogue_id in npc_types:
-                # Find a valid spawn point
-                for attempt in range(10):  # Try 10 times to find valid spot
-                    nx = random.randint(8, map_width - 8)
-                    ny = random.randint(8, map_height - 8)
-                    if not is_blocked_func(nx, ny):
-                        entities.append({"type": "npc", "name": npc_name, "dialogue_id": dialogue_id, "x": nx, "y": ny})
-                        break
+            for (npc_name, dialogue_id), (nx, ny) in zip(npc_types, npc_points):
+                entities.append({"type": "npc", "name": npc_name, "dialogue_id": dialogue_id, "x": nx, "y": ny})
                         
         elif map_id == "town_01":
              entities.append({"type": "npc", "name": "Elder Mira", "dialogue_id": "elder_mira", "x": 10, "y": 10, "quest_id": 1})
@@ -285,32 +302,21 @@ class WorldGenerator:
              entities.append({"type": "npc", "name": "King Valen", "dialogue_id": "king_valen", "x": 20, "y": 8})
              
         elif "sector" in map_id:
-             # Procedural enemies for sectors
-             for _ in range(40):
-                ex = random.randint(2, map_width - 2)
-                ey = random.randint(2, map_height - 2)
-                if not is_blocked_func(ex, ey):
-                    # Enemy types based on biome (can extrapolate from map_id string)
-                    enemy_type = "slime"
-                    if "desert" in map_id:
-                        enemy_type = random.choice(["orc_berserker", "bat", "slime"])
-                    elif "snow" in map_id:
-                        enemy_type = random.choice(["dark_wizard", "skeleton_archer"])
-                    elif "forest" in map_id:
-                         enemy_type = random.choice(["skeleton_archer", "slime", "bat"])
-                         
-                    entities.append({"type": "enemy", "name": enemy_type, "x": ex, "y": ey})
+             # Enemy table by biome (read from the map_id string), slimes otherwise
+             table = "sector_enemies"
+             for biome in ("desert", "snow", "forest"):
+                 if biome in map_id:
+                     table = f"sector_{biome}_enemies"
+                     break
+             points = placement.scatter(rng, 40, spacing=3, margin=2)
+             names = self.loot_tables.draw_many(table, len(points), rng)
+             for (ex, ey), name in zip(points, names):
+                 entities.append({"type": "enemy", "name": name, "x": ex, "y": ey})
              
-             # Random Pickups
-             for _ in range(10):
-                 px = random.randint(2, map_width - 2)
-                 py = random.randint(2, map_height - 2)
-                 if not is_blocked_func(px, py):
-                     ptype = random.choice(["potion", "ether", "gold", "powerup_str", "powerup_spd"])
-                     # Pickups are not entities in this list structure usually, they are sprites. 
-                     # But Main.populate_map needs to know about them?
-                     # Main.populate_map iterates this list.
-                     # We need to add pickup support to get_map_entities return or handle it in populate_map
-                     entities.append({"type": "pickup", "pickup_type": ptype, "x": px, "y": py})
+             # Random Pickups, made into sprites by Main.populate_map
+             points = placement.scatter(rng, 10, spacing=3, margin=2)
+             ptypes = self.loot_tables.draw_many("sector_pickups", len(points), rng)
+             for (px, py), ptype in zip(points, ptypes):
+                 entities.append({"type": "pickup", "pickup_type": ptype, "x": px, "y": py})
 
         return entities
@@ -0,0 +1,115 @@
+from settings import TILESIZE
+
+class MapDelta:
+    """Sparse record of what changed on a generated map since it was built"""
+    def __init__(self):
+        self.cells = {}      # (layer, x, y) -> tile value
+        self.removed = set() # Entity uids that are gone (picked-up items)
+        self.objects = {}    # Entity uid -> state dict (opened doors, pushed blocks)
+
+    def is_empty(self):
+        return not (self.cells or self.removed or self.objects)
+
+    def to_dict(self):
+        return {
+            "cells": [[layer, x, y, value] for (layer, x, y), value in self.cells.items()],
+            "removed": sorted(self.removed),
+            "objects": {str(uid): state for uid, state in self.objects.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        delta = cls()
+        for layer, x, y, value in data.get("cells", []):
+            delta.cells[(layer, x, y)] = value
+        delta.removed = set(data.get("removed", []))
+        delta.objects = {int(uid): state for uid, state in data.get("objects", {}).items()}
+        return delta
+
+    def apply_cells(self, map_data):
+        layers = map_data["layers"]
+        for (layer, x, y), value in self.cells.items():
+            if layer in layers:
+                layers[layer][y, x] = value
+
+class WorldState:
+    """Tracks how each map was generated and what the player changed on it.
+    Saves store a recipe (generator + seed) and a MapDelta per map instead of
+    the layer arrays themselves."""
+    def __init__(self, game):
+        self.game = game
+        self.deltas = {}
+
+    def delta(self, map_id):
+        if map_id not in self.deltas:
+            self.deltas[map_id] = MapDelta()
+        return self.deltas[map_id]
+
+    def record_cell(self, map_id, layer, x, y, value):
+        self.delta(map_id).cells[(layer, int(x), int(y))] = int(value)
+
+    def record_removed(self, map_id, uid):
+        if uid is not None:
+            self.delta(map_id).removed.add(uid)
+
+    def record_object(self, map_id, uid, **state):
+        if uid is not None:
+            self.delta(map_id).objects.setdefault(uid, {}).update(state)
+
+    def build_map(self, recipe):
+        """Regenerate a map from its recipe"""
+        kind = recipe["generator"]
+        world_gen = self.game.world_gen
+        if kind == "world":
+            return world_gen.generate_world_map(recipe["width"], recipe["height"], seed=recipe["seed"])
+        if kind == "town":
+            return world_gen.generate_town_map()
+        if kind == "sector":
+            return world_gen.generate_sector(recipe["biome"], recipe["width"], recipe["height"], seed=recipe["seed"])
+        if kind == "dungeon":
+            return self.game.dungeon_gen.generate_dungeon(recipe["width"], recipe["height"], recipe["num_rooms"], seed=recipe["seed"])
+        raise ValueError(f"Unknown map generator '{kind}'")
+
+    def to_dict(self):
+        maps = {}
+        for map_id, map_data in self.game.maps.items():
+            if "recipe" not in map_data:
+                continue
+            entry = {"recipe": map_data["recipe"]}
+            delta = self.deltas.get(map_id)
+            if delta and not delta.is_empty():
+                entry["delta"] = delta.to_dict()
+            maps[map_id] = entry
+        return maps
+
+    def from_dict(self, data):
+        """Rebuild every saved map and re-apply its cell changes"""
+        self.deltas = {}
+        for map_id, entry in data.items():
+            self.restore_map(map_id, entry)
+
+    def restore_map(self, map_id, entry):
+        """Rebuild one saved map into game.maps"""
+        map_data = self.build_map(entry["recipe"])
+        if "delta" in entry:
+            delta = MapDelta.from_dict(entry["delta"])
+            delta.apply_cells(map_data)
+            self.deltas[map_id] = delta
+        self.game.maps[map_id] = map_data
+
+    def apply_objects(self, map_id, sprite):
+        """Restore saved state onto a freshly spawned interactive object"""
+        delta = self.deltas.get(map_id)
+        state = delta.objects.get(sprite.entity_uid) if delta else None
+        if not state:
+            return
+        if state.get("locked") is False and hasattr(sprite, 'open'):
+            sprite.open()
+        if "x" in state and "y" in state:
+            sprite.x = state["x"] * TILESIZE
+            sprite.y = state["y"] * TILESIZE
+            sprite.rect.topleft = (sprite.x, sprite.y)
+
+    def is_removed(self, map_id, uid):
+        delta = self.deltas.get(map_id)
+        return bool(delta) and uid in delta.removed
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asset_pipeline
+from asset_pipeline import build, render, collect_specs, load_manifest
+
+class TestAssetPipeline(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        # Opaque 24-bit art on a white background, like the JPEG portraits
+        art = pygame.Surface((40, 40))
+        art.fill((255, 255, 255))
+        art.fill((200, 0, 0), pygame.Rect(10, 10, 20, 20))
+        pygame.image.save(art, os.path.join(self.folder, "guy.bmp"))
+        self.specs = {"npc/guy": {"source": "guy.bmp", "size": [8, 8], "colorkey": "auto", "tint": None}}
+        self.log = []
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_builds_keyed_sprites_at_draw_size(self):
+        built, skipped, missing = build(self.specs, self.folder, log=self.log.append)
+        self.assertEqual(built, ["npc/guy"])
+        entry = load_manifest(self.folder)["npc/guy"]
+        self.assertEqual(entry["size"], [8, 8])
+        self.assertTrue(entry["premultiplied"])
+
+        image = pygame.image.load(os.path.join(self.folder, "built", entry["file"]))
+        self.assertEqual(image.get_size(), (8, 8))
+        self.assertEqual(tuple(image.get_at((0, 0))), (0, 0, 0, 0)) # Background keyed out
+        self.assertEqual(tuple(image.get_at((4, 4))), (200, 0, 0, 255))
+
+    def test_incremental_rebuilds(self):
+        build(self.specs, self.folder, log=self.log.append)
+        built, skipped, _ = build(self.specs, self.folder, log=self.log.append)
+        self.assertEqual((built, skipped), ([], ["npc/guy"]))
+
+        self.specs["npc/guy"]["size"] = [16, 16]
+        built, _, _ = build(self.specs, self.folder, log=self.log.append)
+        self.assertEqual(built, ["npc/guy"])
+
+        self.specs["npc/ghost"] = {"source": "ghost.png", "size": [8, 8], "colorkey": None, "tint": None}
+        _, _, missing = build(self.specs, self.folder, log=self.log.append)
+        self.assertEqual(missing, ["npc/ghost"])
+
+    def test_edges_are_premultiplied(self):
+        art = pygame.Surface((4, 2), pygame.SRCALPHA)
+        art.fill((255, 255, 255, 255), pygame.Rect(0, 0, 2, 2))
+        image = render({"size": [2, 1], "colorkey": None, "tint": None}, art)
+        self.assertEqual(tuple(image.get_at((0, 0))), (255, 255, 255, 255))
+        self.assertEqual(tuple(image.get_at((1, 0))), (0, 0, 0, 0))
+
+    def test_specs_cover_game_data(self):
+        specs = collect_specs()
+        self.assertIn("hero", specs)
+        self.assertEqual(specs["enemy/bat"]["size"], [51, 51]) # 32 * 0.8 * 2
+        self.assertEqual(specs["enemy/skeleton_archer"]["tint"], [200, 200, 200])
+        self.assertIn("npc/elder_mira", specs)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+import audio
+from audio import ChannelGroup, MusicPlayer, MUSIC_END_EVENT
+
+class FakeChannel:
+    """Stays busy until stopped, so tests don't depend on sound lengths"""
+    def __init__(self):
+        self.sound = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def play(self, sound):
+        self.sound = sound
+
+class TestChannelGroup(unittest.TestCase):
+    def setUp(self):
+        self.group = ChannelGroup([FakeChannel() for _ in range(3)])
+
+    def test_voice_cap_restarts_oldest_copy(self):
+        first = self.group.play("hit", "a", 2, 1, 1)
+        self.group.play("hit", "b", 2, 1, 2)
+        self.assertIs(self.group.play("hit", "c", 2, 1, 3), first)
+        self.assertEqual(first.sound, "c")
+        self.assertFalse(self.group.channels[2].get_busy())
+
+    def test_full_group_steals_lowest_priority(self):
+        self.group.play("step", "s", 3, 0, 1)
+        low = self.group.play("menu", "m", 3, 1, 2)
+        self.group.play("magic", "x", 3, 3, 3)
+        stolen = self.group.play("step", "t", 3, 0, 4) # Only steals an equal or lower priority
+        self.assertEqual(stolen.sound, "t")
+        self.assertIs(self.group.play("door", "d", 3, 2, 5), stolen) # The lowest priority voice
+        self.assertIs(self.group.play("door", "e", 3, 2, 6), low)
+        self.assertIsNone(self.group.play("step", "u", 3, 0, 7))
+
+class TestMusicCrossfade(unittest.TestCase):
+    def test_mode_change_fades_then_plays_on_end_event(self):
+        with patch.object(audio.pygame.mixer, "music") as music:
+            music.get_busy.return_value = True
+            player = MusicPlayer(MagicMock())
+            player.set_mode("battle")
+            music.fadeout.assert_called_once()
+            music.play.assert_not_called()
+            player.set_mode("battle") # Already heading there
+            music.fadeout.assert_called_once()
+
+            player.handle_event(pygame.event.Event(MUSIC_END_EVENT))
+            self.assertFalse(player.fading)
+            self.assertIn(player.current_song, player.playlists["battle"])
+            music.play.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from settings import FIXED_DT, TILESIZE, WIDTH, HEIGHT
+from camera import Camera
+
+def make_target(x, y):
+    target = MagicMock()
+    target.rect = pygame.Rect(0, 0, TILESIZE, TILESIZE)
+    target.rect.center = (x, y)
+    return target
+
+class TestCamera(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera(4000, 4000)
+        self.camera.deadzone = (64, 48)
+        self.camera.update(make_target(1000, 1000)) # Snaps on the first update
+
+    def test_deadzone_holds_then_follows_smoothly(self):
+        start = self.camera.x
+        self.camera.update(make_target(1020, 1000))
+        self.assertEqual(self.camera.x, start) # Inside the deadzone
+
+        self.camera.update(make_target(1100, 1000))
+        moved = start - self.camera.x
+        self.assertTrue(0 < moved < 100 - 32) # Eases, doesn't jump
+        for _ in range(120):
+            self.camera.update(make_target(1100, 1000))
+        self.assertEqual(self.camera.x, -(1100 - 32 - WIDTH // 2)) # Target rests on the deadzone edge
+        self.assertIsInstance(self.camera.offset_x, int)
+
+    def test_clamped_to_map_and_bounds_exposed(self):
+        self.camera.set_map(40 * TILESIZE, 30 * TILESIZE)
+        self.camera.update(make_target(5, 5))
+        self.assertEqual((self.camera.x, self.camera.y), (0, 0))
+        self.assertEqual(self.camera.view.topleft, (0, 0))
+        self.assertEqual(self.camera.tile_bounds, (0, WIDTH // TILESIZE + 1, 0, HEIGHT // TILESIZE + 1))
+
+        self.camera.update(make_target(10000, 10000)) # Past the far corner
+        start_x, end_x, start_y, end_y = self.camera.tile_bounds
+        self.assertEqual((end_x, end_y), (40, 30))
+
+    def test_shake_moves_only_the_drawn_view(self):
+        self.camera.shake(6, 0.1)
+        offsets = set()
+        for _ in range(5):
+            self.camera.update(make_target(1000, 1000))
+            offsets.add(self.camera.offset_x - self.camera.x)
+            self.assertTrue(all(abs(o) <= 6 for o in offsets))
+        self.assertGreater(len(offsets), 1)
+        for _ in range(int(0.1 / FIXED_DT) + 1):
+            self.camera.update(make_target(1000, 1000))
+        self.assertEqual(self.camera.offset_x, self.camera.x) # Settles once the shake ends
+
+    def test_apply_reuses_one_rect(self):
+        sprite = MagicMock()
+        sprite.rect = sprite.image_rect = pygame.Rect(1000, 1000, TILESIZE, TILESIZE)
+        sprite.prev_center = sprite.rect.center
+        first = self.camera.apply(sprite)
+        self.assertEqual(first.topleft, (1000 + self.camera.offset_x, 1000 + self.camera.offset_y))
+        self.assertIs(self.camera.apply(sprite), first)
+        self.assertTrue(self.camera.is_visible(sprite))
+        sprite.image_rect = pygame.Rect(0, 0, TILESIZE, TILESIZE)
+        self.assertFalse(self.camera.is_visible(sprite))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from battle import PlayerAttackState, Battle
 from components.combat import CombatComponent
+from combat_effects import FlashEffect
 
 class MockEntity:
     def __init__(self, name, hp, max_hp, strength, defense, level=1):
@@ -63,5 +64,32 @@ class TestCombatLogic(unittest.TestCase):
                 self.assertEqual(args[0], 42)
                 self.assertIn("Critical Hit!", self.battle.message)
 
+class TestBattleReuse(unittest.TestCase):
+    def setUp(self):
+        self.game = MagicMock()
+        self.player = MockEntity("Hero", 100, 100, strength=10, defense=5)
+        self.slime = MockEntity("Slime", 30, 30, strength=5, defense=2)
+        self.slime.enemy_type = "slime"
+
+    def test_restart_reuses_states(self):
+        battle = Battle(self.game, self.player, [self.slime])
+        states = dict(battle.states)
+        battle.change_state("main_menu")
+        battle.start(self.player, [self.slime])
+        self.assertEqual(battle.state, "tactical_pause")
+        self.assertIs(battle.current_state, states["tactical_pause"])
+        for name, state in battle.states.items():
+            self.assertIs(state, states[name])
+
+    def test_finished_effects_are_recycled(self):
+        battle = Battle(self.game, self.player, [self.slime])
+        first = battle.spawn_effect(FlashEffect, color=(255, 0, 0), duration=0.1)
+        battle.update(0.2)
+        self.assertEqual(battle.active_effects, [])
+        second = battle.spawn_effect(FlashEffect, color=(0, 0, 255), duration=0.5)
+        self.assertIs(first, second)
+        self.assertFalse(second.finished)
+        self.assertEqual(second.color, (0, 0, 255))
+
 if __name__ == '__main__':
     unittest.main()
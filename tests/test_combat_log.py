@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import combat_log
+from combat_log import CombatLog
+
+class TestCombatLog(unittest.TestCase):
+    def record_battle(self, log):
+        log.begin_battle()
+        log.append(combat_log.JOIN, 0, 0, hp=50, label="Hero")
+        log.append(combat_log.JOIN, 1, 1, hp=20, label="Slime")
+        log.append(combat_log.ATTACK, 0, 1, turn=1, roll=1, damage=12, hp=8, crit=True)
+        log.append(combat_log.STATUS, 1, 0, turn=1, hp=50, status="dazed")
+        log.append(combat_log.ATTACK, 0, 1, turn=2, damage=9, hp=0)
+
+    def test_replay_rebuilds_hp(self):
+        log = CombatLog()
+        self.record_battle(log)
+        frames = [hp for _, hp in log.replay(1)]
+        self.assertEqual(frames[0], {0: 50})
+        self.assertEqual(frames[2], {0: 50, 1: 8})
+        self.assertEqual(frames[-1], {0: 50, 1: 0})
+        self.assertEqual(log.names(1), {0: "Hero", 1: "Slime"})
+
+    def test_ring_buffer_keeps_newest(self):
+        log = CombatLog(capacity=4)
+        for i in range(6):
+            log.append(combat_log.ATTACK, damage=i)
+        self.assertEqual(list(log.view()["damage"]), [2, 3, 4, 5])
+
+    def test_binary_round_trip_and_summary(self):
+        log = CombatLog()
+        self.record_battle(log)
+        self.record_battle(log)
+        again = CombatLog.from_bytes(log.to_bytes())
+        self.assertTrue((again.view() == log.view()).all())
+        self.assertEqual(again.strings, log.strings)
+
+        summary = again.summarize()
+        self.assertEqual(summary["battles"], 2)
+        self.assertEqual(summary["counts"]["attack"], 4)
+        self.assertEqual(summary["damage"]["attack"], 42)
+        self.assertEqual(summary["crit_rate"], 0.5)
+
+        with self.assertRaises(ValueError):
+            CombatLog.from_bytes(b"JUNK" + log.to_bytes()[4:])
+
+if __name__ == '__main__':
+    unittest.main()
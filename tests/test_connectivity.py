@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from connectivity import RegionMap, label_regions, connect_regions
+from world_generator import WorldGenerator
+
+ROOMS = [
+    "..#.#.",
+    "..#.#.",
+    "###.#.",
+    "....#.",
+]
+
+def collision_from(rows):
+    return np.array([[1 if c == "#" else 0 for c in row] for row in rows], dtype=np.int8)
+
+class TestRegions(unittest.TestCase):
+    def test_labels_four_connected_regions(self):
+        labels, count = label_regions(collision_from(ROOMS))
+        self.assertEqual(count, 3)
+        self.assertEqual(labels[0, 2], 0) # Walls aren't a region
+        self.assertEqual(labels[0, 0], labels[1, 1])
+        self.assertEqual(labels[0, 3], labels[3, 0]) # Around the corner
+        self.assertNotEqual(labels[0, 3], labels[0, 5])
+
+    def test_diagonals_do_not_connect(self):
+        regions = RegionMap(collision_from([".#", "#."]))
+        self.assertEqual(regions.count, 2)
+        self.assertFalse(regions.connected((0, 0), (1, 1)))
+
+    def test_queries(self):
+        regions = RegionMap(collision_from(ROOMS))
+        self.assertTrue(regions.connected((3, 0), (0, 3)))
+        self.assertFalse(regions.connected((0, 0), (5, 3)))
+        self.assertFalse(regions.connected((2, 0), (2, 0))) # A wall reaches nothing
+        self.assertEqual(regions.sizes[regions.largest()], 7)
+        self.assertEqual(regions.nearest(2, 0, regions.region_at(5, 0)), (5, 0))
+
+    def test_connect_regions_carves_to_target(self):
+        collision = collision_from(ROOMS)
+        ground = np.where(collision == 1, 4, 0).astype(np.int8)
+        regions = connect_regions(ground, collision, (0, 0), 0)
+        self.assertEqual(regions.count, 1)
+        self.assertTrue(regions.connected((0, 0), (5, 3)))
+        self.assertTrue(np.array_equal(ground == 0, collision == 0)) # Carved tiles became floor
+
+    def test_small_regions_left_alone_unless_named(self):
+        collision = collision_from(ROOMS)
+        ground = np.zeros_like(collision)
+        regions = connect_regions(ground, collision, (0, 0), 0, min_size=100)
+        self.assertEqual(regions.count, 3)
+        regions = connect_regions(ground, collision, (0, 0), 0, min_size=100, points=[(5, 0)])
+        self.assertTrue(regions.connected((0, 0), (5, 0)))
+
+class TestGeneratedMaps(unittest.TestCase):
+    def test_sector_entities_reachable_from_spawn(self):
+        generator = WorldGenerator(seed=3)
+        sector = generator.generate_sector("desert", seed=11)
+        collision = sector["layers"]["collision"]
+        regions = RegionMap(collision)
+        spawn = sector["spawn"]
+        self.assertNotEqual(regions.region_at(*spawn), 0)
+        self.assertFalse(any(size >= 16 for r, size in enumerate(regions.sizes) if r != regions.region_at(*spawn)))
+
+        entities = generator.get_map_entities(sector["id"], 100, 100, None, seed=1, collision=collision, spawn=spawn)
+        self.assertTrue(entities)
+        self.assertTrue(all(regions.connected(spawn, (e["x"], e["y"])) for e in entities))
+        self.assertFalse(any((e["x"], e["y"]) == tuple(spawn) for e in entities))
+
+    def test_world_exits_reachable(self):
+        world = WorldGenerator(seed=3).generate_world_map()
+        regions = RegionMap(world["layers"]["collision"])
+        for exit_point in world["exits"]:
+            self.assertTrue(regions.connected(world["spawn"], (exit_point["x"], exit_point["y"])))
+
+if __name__ == '__main__':
+    unittest.main()
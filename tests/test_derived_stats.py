@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.combat import CombatComponent
+from components.inventory import InventoryComponent
+from entities import job_stat_bonus
+from inventory import create_item
+
+JOB_DATA = {
+    "warrior": {"base_stats": {"strength": 10, "intelligence": 2}},
+    "mage": {"base_stats": {"strength": 2, "intelligence": 10}},
+}
+
+class Owner:
+    def __init__(self):
+        self.components = []
+        self.combat = self.add_component(CombatComponent, hp=50, mp=20, stats=[5, 3, 4, 3])
+        self.inventory = self.add_component(InventoryComponent)
+
+    def add_component(self, component_class, *args, **kwargs):
+        component = component_class(self, *args, **kwargs)
+        self.components.append(component)
+        return component
+
+    def get_component(self, component_class):
+        for component in self.components:
+            if isinstance(component, component_class):
+                return component
+        return None
+
+class TestDerivedStats(unittest.TestCase):
+    def setUp(self):
+        self.owner = Owner()
+        self.combat = self.owner.combat
+
+    def test_equip_and_unequip_refresh(self):
+        sword = create_item("iron_axe")
+        sword.add_affix("Sharp")
+        self.owner.inventory.add_item(sword)
+        self.owner.inventory.equip(sword)
+        self.assertEqual(self.combat.get_attribute("strength"), 12) # 5 + 5 axe + 2 Sharp
+        self.assertEqual(self.combat.get_attribute("agility"), 3)
+        self.assertTrue(self.owner.inventory.is_equipped("iron_axe"))
+
+        self.owner.inventory.unequip("weapon")
+        self.assertEqual(self.combat.get_attribute("strength"), 5)
+        self.assertFalse(self.owner.inventory.is_equipped("iron_axe"))
+
+    def test_job_bonus_is_relative_to_average(self):
+        self.assertEqual(job_stat_bonus(JOB_DATA, "warrior"), {"strength": 4, "intelligence": -4})
+        self.combat.set_modifiers("job", job_stat_bonus(JOB_DATA, "mage"))
+        self.assertEqual(self.combat.get_attribute("strength"), 1)
+        self.assertEqual(self.combat.get_attribute("intelligence"), 4)
+        self.combat.set_modifiers("job", job_stat_bonus(JOB_DATA, "warrior"))
+        self.assertEqual(self.combat.get_attribute("strength"), 9)
+        self.assertEqual(self.combat.get_attribute("intelligence"), 0) # Clamped
+
+    def test_cache_holds_until_invalidated(self):
+        self.assertEqual(self.combat.get_attribute("luck"), 3)
+        self.combat.stats[3] += 2
+        self.assertEqual(self.combat.get_attribute("luck"), 3)
+        self.combat.invalidate_stats()
+        self.assertEqual(self.combat.get_attribute("luck"), 5)
+
+if __name__ == '__main__':
+    unittest.main()
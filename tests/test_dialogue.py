@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from dialogue import CompiledDialogue
+from flags import FlagRegistry
+from ui import DialogueBox, wrap_text
+
+class TestCompiledDialogue(unittest.TestCase):
+    def setUp(self):
+        self.flags = FlagRegistry()
+        self.dialogue = CompiledDialogue({
+            "default": {"text": "Hello."},
+            "met_mira": {"text": "Again?"},
+            "both": {"text": "Everything.", "requires": ["met_mira", "has_seed"]},
+            "urgent": {"text": "Run!", "priority": 1},
+        }, self.flags)
+
+    def select(self, flags):
+        self.flags.from_dict(flags)
+        return self.dialogue.select()
+
+    def test_default_when_no_flags(self):
+        self.assertEqual(self.select({})["text"], "Hello.")
+
+    def test_more_specific_rule_wins(self):
+        self.assertEqual(self.select({"met_mira": True})["text"], "Again?")
+        self.assertEqual(self.select({"met_mira": True, "has_seed": True})["text"], "Everything.")
+        self.assertEqual(self.select({"has_seed": True})["text"], "Hello.")
+
+    def test_priority_beats_specificity(self):
+        flags = {"met_mira": True, "has_seed": True, "urgent": True}
+        self.assertEqual(self.select(flags)["text"], "Run!")
+
+class TestDialogueBox(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        game = MagicMock()
+        game.screen = pygame.Surface((800, 600))
+        self.box = DialogueBox(game)
+
+    def test_wrap_fits_width(self):
+        font = self.box.font_large
+        lines = wrap_text(font, "the mist parts for you " * 20, 300)
+        self.assertGreater(len(lines), 1)
+        self.assertTrue(all(font.size(line)[0] <= 300 for line in lines))
+
+    def test_pages_advance_and_cache(self):
+        text = "word " * 200
+        self.box.draw(text)
+        pages = self.box.pages
+        self.assertGreater(len(pages), 1)
+        self.assertTrue(all(len(page) <= DialogueBox.max_lines for page in pages))
+
+        surfaces = self.box.page_surfaces
+        self.box.draw(text)
+        self.assertIs(self.box.page_surfaces, surfaces) # Not re-rendered while the text is unchanged
+
+        for _ in range(len(pages) - 1):
+            self.assertTrue(self.box.advance())
+        self.assertFalse(self.box.advance())
+
+if __name__ == '__main__':
+    unittest.main()
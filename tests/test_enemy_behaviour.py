@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import json
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from enemy_behaviour import BehaviourTable, ATTACK_HANDLERS, SPECIAL_HANDLERS, daze_on_attack
+from components.combat import CombatComponent
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'enemies.json')
+
+class TestBehaviourTable(unittest.TestCase):
+    def setUp(self):
+        with open(DATA_PATH) as f:
+            self.table = BehaviourTable(json.load(f))
+
+    def test_compiles_attack_types_and_specials(self):
+        self.assertIs(self.table.get("skeleton_archer").attack, ATTACK_HANDLERS["ranged"])
+        self.assertIs(self.table.get("dark_wizard").attack, ATTACK_HANDLERS["magic"])
+        self.assertEqual(self.table.get("dark_wizard").spells, ["fireball", "ice_bolt"])
+        self.assertIs(self.table.get("daryl_ledeay").special, SPECIAL_HANDLERS["daryl_ledeay"])
+        self.assertIs(self.table.get("chicken_george").special, SPECIAL_HANDLERS["chicken_george"])
+        self.assertIsNone(self.table.get("slime").special)
+
+    def test_unknown_types_fall_back_to_name(self):
+        self.assertEqual(self.table.get("goblin_mage").attack_type, "magic")
+        self.assertEqual(self.table.get("elf_ranger").attack_type, "ranged")
+        self.assertEqual(self.table.get("rat").attack_type, "melee")
+        self.assertIs(self.table.get("rat"), self.table.get("rat"))
+
+    def test_ability_hooks(self):
+        table = BehaviourTable({"wasp": {"special_abilities": {"daze_on_attack": {"chance": 1.0, "duration": 2}, "unknown": {}}}})
+        behaviour = table.get("wasp")
+        self.assertEqual(len(behaviour.hooks), 1)
+
+        turn = MagicMock()
+        enemy = MagicMock()
+        enemy.name = "Wasp"
+        with patch('random.random', return_value=0.0):
+            message = daze_on_attack(turn, enemy, {"chance": 1.0, "duration": 2}, "")
+        turn.battle.player.combat.apply_status_effect.assert_called_once_with("dazed", 2)
+        self.assertIn("dazed", message)
+
+class TestBatchedAttacks(unittest.TestCase):
+    def make_group(self, strengths):
+        enemies, combats = [], []
+        for i, strength in enumerate(strengths):
+            enemy = MagicMock()
+            enemy.name = f"Enemy {i}"
+            enemies.append(enemy)
+            combats.append(CombatComponent(enemy, hp=10, mp=0, stats=[strength, 1, 1, 1]))
+        return enemies, combats
+
+    def test_melee_group_in_one_call(self):
+        enemies, combats = self.make_group([3, 6, 10])
+        rng = MagicMock()
+        rng.integers.return_value = np.array([0, 1, -1])
+        mult = np.array([1.0, 1.0, 2.5], dtype=np.float32)
+        damage, messages, spells, rolls = ATTACK_HANDLERS["melee"](MagicMock(), enemies, combats, [None] * 3, mult, 8, rng)
+        # max(1, str * 2 * mult - 8 // 2) + variance
+        self.assertEqual(list(damage), [2, 9, 45])
+        self.assertEqual(list(rolls), [0, 1, -1])
+        self.assertIn("Enemy 1 attacks for 9 damage", messages[1])
+        self.assertEqual(spells, [None, None, None])
+
+    def test_ranged_misses_deal_nothing(self):
+        enemies, combats = self.make_group([5, 5])
+        rng = MagicMock()
+        rng.random.return_value = np.array([0.5, 0.95])
+        rng.integers.return_value = np.array([2, 2])
+        damage, messages, _, rolls = ATTACK_HANDLERS["ranged"](MagicMock(), enemies, combats, [None] * 2, np.ones(2), 8, rng)
+        self.assertEqual(list(damage), [8, 0])
+        self.assertEqual(list(rolls), [2, 0]) # A miss rolls nothing
+        self.assertIn("misses", messages[1])
+
+    def test_magic_roll_picks_the_spell(self):
+        enemies, combats = self.make_group([1, 1])
+        behaviour = MagicMock()
+        behaviour.spells = ["fireball", "ice_bolt"]
+        rng = MagicMock()
+        rng.integers.return_value = np.array([4, 7])
+        _, _, spells, rolls = ATTACK_HANDLERS["magic"](MagicMock(), enemies, combats, [behaviour] * 2, np.ones(2), 8, rng)
+        self.assertEqual(list(rolls), [0, 1])
+        self.assertEqual(spells, ["fireball", "ice_bolt"])
+
+if __name__ == '__main__':
+    unittest.main()
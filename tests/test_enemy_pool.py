@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from entities import Enemy
+from enemy_pool import EnemyPool
+
+ENEMY_DATA = {
+    "slime": {"name": "Slime", "max_hp": 20, "stats": [3, 2, 1, 1], "image": "Slime.png", "tint": [0, 255, 0, 255]},
+    "bat": {"name": "Bat", "max_hp": 8, "stats": [2, 1, 5, 1], "image": "Bat.png", "hitbox": {"width": 12, "height": 10}},
+}
+
+class TestEnemyPool(unittest.TestCase):
+    def setUp(self):
+        self.game = MagicMock()
+        self.game.data_manager.get_data.return_value = ENEMY_DATA
+        self.game.resource_manager.get_sprite.side_effect = lambda asset_id: pygame.Surface((16, 16))
+        self.game.all_sprites = pygame.sprite.Group()
+        self.game.enemies = pygame.sprite.Group()
+        self.pool = EnemyPool(self.game, Enemy)
+        self.game.enemy_pool = self.pool
+
+    def test_template_built_once_per_type(self):
+        first = self.pool.acquire("slime", 1, 1)
+        second = self.pool.acquire("slime", 2, 2)
+        self.assertIs(first.template, second.template)
+        self.assertIs(first.image, second.image)
+        self.assertEqual(self.game.resource_manager.get_sprite.call_count, 1)
+        self.assertEqual(len(self.game.enemies), 2)
+
+    def test_released_enemy_is_reset_on_reuse(self):
+        bat = self.pool.acquire("bat", 1, 1)
+        bat.combat.take_damage(5)
+        bat.combat.apply_status_effect("dazed", 2)
+        self.pool.release(bat)
+        self.pool.release(bat) # Releasing twice doesn't duplicate it
+        self.assertEqual(self.pool.free_count(), 1)
+        self.assertNotIn(bat, self.game.enemies)
+
+        again = self.pool.acquire("bat", 4, 5)
+        self.assertIs(again, bat)
+        self.assertEqual(again.combat.hp, 8)
+        self.assertEqual(again.combat.status_effects, {})
+        self.assertEqual(again.combat.get_attribute("agility"), 5)
+        self.assertEqual(again.hit_rect.size, (12, 10))
+        self.assertEqual(again.rect.center, again.hit_rect.center)
+        self.assertEqual((again.x, again.y), (4 * 32, 5 * 32))
+        self.assertIn(again, self.game.enemies)
+        self.assertEqual(self.pool.free_count(), 0)
+
+    def test_pool_is_keyed_by_type(self):
+        self.pool.release(self.pool.acquire("bat"))
+        slime = self.pool.acquire("slime")
+        self.assertEqual(slime.enemy_type, "slime")
+        self.assertEqual(self.pool.free_count(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from settings import FIXED_DT, MAX_STEPS_PER_FRAME, TILESIZE
+from main import Game
+from camera import Camera
+
+class TestFixedTimestep(unittest.TestCase):
+    def setUp(self):
+        self.game = MagicMock()
+        self.game.accumulator = 0.0
+
+    def test_steps_are_fixed_and_remainder_interpolates(self):
+        steps = Game.advance(self.game, FIXED_DT * 2.5)
+        self.assertEqual(steps, 2)
+        self.assertEqual(self.game.update.call_count, 2)
+        self.assertEqual(self.game.dt, FIXED_DT)
+        self.assertAlmostEqual(self.game.alpha, 0.5)
+
+        Game.advance(self.game, FIXED_DT * 0.6) # Carries over into a full step
+        self.assertEqual(self.game.update.call_count, 3)
+
+    def test_hitches_are_capped(self):
+        steps = Game.advance(self.game, 5.0)
+        self.assertEqual(steps, MAX_STEPS_PER_FRAME)
+        self.assertLessEqual(self.game.alpha, 1.0)
+
+class TestCameraInterpolation(unittest.TestCase):
+    def make_target(self, x, y):
+        target = MagicMock()
+        target.rect = pygame.Rect(0, 0, TILESIZE, TILESIZE)
+        target.rect.center = (x, y)
+        return target
+
+    def test_view_lerps_between_steps(self):
+        camera = Camera(4000, 4000)
+        camera.smoothing = 0 # Follow exactly
+        camera.deadzone = (0, 0)
+        camera.update(self.make_target(1000, 1000))
+        camera.update(self.make_target(1010, 1000))
+        camera.interpolate(0.5)
+        self.assertEqual(camera.offset_x, -(1005 - 400))
+
+        camera.update(self.make_target(3000, 1000)) # Teleport snaps
+        camera.interpolate(0.0)
+        self.assertEqual(camera.offset_x, camera.x)
+
+    def test_sprites_draw_between_steps(self):
+        camera = Camera(4000, 4000)
+        sprite = MagicMock()
+        sprite.rect = pygame.Rect(100, 100, TILESIZE, TILESIZE)
+        sprite.image_rect = sprite.rect.copy()
+        sprite.prev_center = (sprite.rect.centerx - 8, sprite.rect.centery)
+        camera.interpolate(0.25)
+        self.assertEqual(camera.apply(sprite).x, 100 - 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from flags import FlagRegistry
+
+class TestFlagRegistry(unittest.TestCase):
+    def setUp(self):
+        self.flags = FlagRegistry(["met_mira", "quest_1_completed"])
+
+    def test_set_get_and_masks(self):
+        self.assertFalse(self.flags.get("met_mira"))
+        self.flags.set("met_mira")
+        self.flags["found_seed"] = True # Runtime flags are interned on first use
+        mask = self.flags.mask(["met_mira", "found_seed"])
+        self.assertTrue(self.flags.test(mask))
+        self.flags.clear("found_seed")
+        self.assertFalse(self.flags.test(mask))
+        self.assertTrue(self.flags["met_mira"])
+
+    def test_subscribers_only_hear_changes(self):
+        heard = []
+        self.flags.subscribe("met_mira", lambda name, value: heard.append((name, value)))
+        everything = []
+        self.flags.subscribe(None, lambda name, value: everything.append(name))
+        self.flags.set("met_mira")
+        self.flags.set("met_mira") # Already set: no callback
+        self.flags.set("quest_1_completed")
+        self.flags.clear("met_mira")
+        self.assertEqual(heard, [("met_mira", True), ("met_mira", False)])
+        self.assertEqual(everything, ["met_mira", "quest_1_completed", "met_mira"])
+
+    def test_round_trip_is_compact(self):
+        self.flags.set("quest_1_completed")
+        self.flags.set("test_flag")
+        data = self.flags.to_dict()
+        self.assertEqual(data, {"bits": "2", "extra": ["test_flag"]})
+
+        loaded = FlagRegistry(["met_mira", "quest_1_completed"])
+        heard = []
+        loaded.subscribe("test_flag", lambda name, value: heard.append(value))
+        loaded.from_dict(data)
+        self.assertTrue(loaded.get("quest_1_completed"))
+        self.assertTrue(loaded.get("test_flag"))
+        self.assertFalse(loaded.get("met_mira"))
+        self.assertEqual(heard, [True]) # Loading notifies like any other change
+
+    def test_reads_old_dict_saves(self):
+        self.flags.from_dict({"met_mira": True, "old_flag": False})
+        self.assertTrue(self.flags.get("met_mira"))
+        self.assertFalse(self.flags.get("old_flag"))
+
+if __name__ == '__main__':
+    unittest.main()
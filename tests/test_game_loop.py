@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from settings import FIXED_DT
+from main import Game
+from save_manager import encode_payload
+
+class TestGameLoop(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name) # Keep the debug log out of the tree
+        self.game = Game()
+
+    def tearDown(self):
+        self.game.save_manager.wait()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_new_game_runs_a_loop_iteration(self):
+        game = self.game
+        game.new()
+        game.change_scene("world")
+        game.dt = FIXED_DT
+        # One pass of the run loop: nothing set up by new() may hide these
+        game.events()
+        game.update()
+        game.draw()
+        self.assertGreater(game.playtime, 0)
+
+    def test_new_game_after_a_failed_load(self):
+        game = self.game
+        save_manager = game.save_manager
+        save_manager.save_dir = self.tmp.name
+        save_manager.set_slot(1)
+        broken = {"world_map": {"recipe": {"generator": "missing"}}} # build_map raises
+        save_manager._write_sections({"maps": encode_payload(broken)})
+        self.assertFalse(save_manager.load_game(1))
+        self.assertIsNone(game.map)
+
+        game.change_scene("world")
+        game.advance(FIXED_DT)
+        self.assertEqual(game.current_map_id, "world_map")
+        self.assertIsNotNone(game.player)
+
+if __name__ == '__main__':
+    unittest.main()
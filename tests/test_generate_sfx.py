@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import wave
+import tempfile
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import generate_sfx
+
+class TestSynthesis(unittest.TestCase):
+    def test_adsr_fits_and_ends_silent(self):
+        env = generate_sfx.adsr(1000, attack=0.01, decay=0.01, sustain=0.5, release=0.01, rate=10000)
+        self.assertEqual(len(env), 1000)
+        self.assertAlmostEqual(float(env.max()), 1.0, places=2)
+        self.assertEqual(env[-1], 0)
+        # Envelope longer than the sound gets squeezed rather than overflowing
+        self.assertEqual(len(generate_sfx.adsr(100, 1, 1, 0.5, 1, rate=1000)), 100)
+
+    def test_sweep_changes_zero_crossings(self):
+        n = generate_sfx.SAMPLE_RATE
+        tone = generate_sfx.sine(generate_sfx.sweep(100, 400, n), n)
+        first, last = tone[:n // 4], tone[-n // 4:]
+        crossings = lambda x: int(np.count_nonzero(np.diff(np.sign(x))))
+        self.assertGreater(crossings(last), crossings(first) * 2)
+
+    def test_recipes_render_in_range(self):
+        rng = np.random.default_rng(1)
+        for name in generate_sfx.RECIPES:
+            samples = generate_sfx.render(name, rng, pitch=1.1, rate=22050)
+            self.assertGreater(len(samples), 0, name)
+            self.assertLessEqual(float(np.abs(samples).max()), 1.0, name)
+
+    def test_write_wav(self):
+        samples = generate_sfx.render("menu", np.random.default_rng(0))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "menu.wav")
+            generate_sfx.write_wav(path, samples)
+            with wave.open(path) as wav_file:
+                self.assertEqual(wav_file.getnframes(), len(samples))
+                self.assertEqual(wav_file.getsampwidth(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.inventory import InventoryComponent
+from inventory import create_item, create_random_weapon, WEAPON_IDS
+
+class Owner:
+    def get_component(self, component_class):
+        return None
+
+def affixed(item_id, affix):
+    item = create_item(item_id)
+    item.add_affix(affix)
+    return item
+
+class TestInventoryStacks(unittest.TestCase):
+    def setUp(self):
+        self.inventory = InventoryComponent(Owner())
+
+    def test_identical_items_stack(self):
+        for _ in range(3):
+            self.inventory.add_item(create_item("potion"))
+        self.inventory.add_item(create_item("iron_axe"))
+        self.inventory.add_item(affixed("iron_axe", "Sharp"))
+        self.assertEqual(len(self.inventory.stacks), 3)
+        self.assertEqual(self.inventory.count("potion"), 3)
+        self.assertEqual(self.inventory.count("iron_axe"), 2) # Over every affix
+        self.assertEqual(len(self.inventory.items), 5)
+
+    def test_remove_empties_stack_and_indexes(self):
+        potion = create_item("potion")
+        self.inventory.add_item(potion, 2)
+        self.assertTrue(self.inventory.remove_item(potion))
+        self.assertTrue(self.inventory.remove_item(create_item("potion"))) # Any potion will do
+        self.assertFalse(self.inventory.remove_item(potion))
+        self.assertEqual(self.inventory.count("potion"), 0)
+        self.assertEqual(self.inventory.stacks, {})
+        self.assertEqual(self.inventory.stacks_of_type("healing"), [])
+
+    def test_type_index(self):
+        self.inventory.add_item(create_item("potion"))
+        self.inventory.add_item(create_item("bomb"))
+        self.inventory.add_item(create_item("iron_sword"))
+        names = [stack.item.name for stack in self.inventory.stacks_of_type("healing", "damage")]
+        self.assertEqual(names, ["Potion", "Bomb"])
+        self.assertEqual(len(self.inventory.stacks_of_type("weapon")), 1)
+
+    def test_round_trip_keeps_counts(self):
+        self.inventory.add_item(create_item("ether"), 4)
+        self.inventory.add_item(affixed("iron_axe", "Heavy"))
+        data = self.inventory.to_dict()
+        self.assertEqual(len(data["items"]), 2)
+
+        loaded = InventoryComponent(Owner())
+        loaded.from_dict(data)
+        self.assertEqual(loaded.count("ether"), 4)
+        self.assertEqual(loaded.stack_count(affixed("iron_axe", "Heavy")), 1)
+
+    def test_reads_one_record_per_item(self):
+        self.inventory.from_dict({"items": [{"id": "potion", "affix": None}] * 3})
+        self.assertEqual(self.inventory.count("potion"), 3)
+
+class TestItemTemplates(unittest.TestCase):
+    def test_items_share_their_template(self):
+        first, second = create_item("iron_sword"), create_item("iron_sword")
+        self.assertIs(first.template, second.template)
+        self.assertIs(first.stats, second.stats)
+        self.assertFalse(hasattr(first, "__dict__"))
+        with self.assertRaises(TypeError):
+            first.stats["strength"] = 99 # Templates are read-only
+
+    def test_affix_derives_name_and_stats(self):
+        plain = create_item("iron_axe")
+        sharp = affixed("iron_axe", "Sharp")
+        self.assertEqual(sharp.name, "Sharp " + plain.name)
+        self.assertEqual(sharp.stats["strength"], plain.stats["strength"] + 2)
+        self.assertIs(sharp.stats, affixed("iron_axe", "Sharp").stats) # Merged once, then cached
+        self.assertEqual(create_item("iron_axe").stats, plain.stats) # Template untouched
+        self.assertIn("strength +2", sharp.description)
+
+    def test_random_weapons_come_from_weapon_ids(self):
+        for _ in range(10):
+            self.assertIn(create_random_weapon().item_id, WEAPON_IDS)
+
+if __name__ == '__main__':
+    unittest.main()
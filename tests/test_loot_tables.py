@@ -0,0 +1,54 @@
+import unittest
+import random
+import sys
+import os
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from loot_tables import AliasTable, LootTables, LOOT_TABLES
+from world_generator import WorldGenerator
+
+class TestAliasTable(unittest.TestCase):
+    def setUp(self):
+        self.table = AliasTable(["slime", "bat", "none"], [6, 3, 1])
+
+    def test_batch_matches_weights(self):
+        draws = self.table.draw_many(60000, np.random.default_rng(1))
+        self.assertAlmostEqual(np.mean(draws == "slime"), 0.6, delta=0.01)
+        self.assertAlmostEqual(np.mean(draws == "bat"), 0.3, delta=0.01)
+        self.assertAlmostEqual(np.mean(draws == None), 0.1, delta=0.01) # "none" draws nothing
+
+    def test_single_draws_match_weights(self):
+        rng = random.Random(2)
+        draws = [self.table.draw(rng) for _ in range(30000)]
+        self.assertAlmostEqual(draws.count("slime") / len(draws), 0.6, delta=0.015)
+
+    def test_zero_weight_never_drawn(self):
+        table = AliasTable(["potion", "bomb"], [1, 0])
+        self.assertTrue(all(table.draw_many(1000, np.random.default_rng(3)) == "potion"))
+
+    def test_rejects_empty_weights(self):
+        with self.assertRaises(ValueError):
+            AliasTable(["potion"], [0])
+
+class TestLootTables(unittest.TestCase):
+    def test_drops_skip_nothing(self):
+        tables = LootTables({"drops": {"none": 1, "potion": 1}})
+        drops = tables.roll_drops("drops", rolls=200, rng=random.Random(4))
+        self.assertTrue(0 < len(drops) < 200)
+        self.assertEqual(set(drops), {"potion"})
+        self.assertEqual(tables.roll_drops("missing"), [])
+
+    def test_map_entities_come_from_tables(self):
+        generator = WorldGenerator(seed=5)
+        first = generator.get_map_entities("sector_snow_1", 40, 40, lambda x, y: False, seed=9)
+        again = generator.get_map_entities("sector_snow_1", 40, 40, lambda x, y: False, seed=9)
+        self.assertEqual(first, again) # Same seed, same map
+        enemies = {e["name"] for e in first if e["type"] == "enemy"}
+        self.assertTrue(enemies <= set(LOOT_TABLES.get("sector_snow_enemies").entries))
+        self.assertEqual(sum(e["type"] == "pickup" for e in first), 10)
+
+if __name__ == '__main__':
+    unittest.main()
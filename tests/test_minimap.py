@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+from minimap import Minimap, TILE_COLOURS, ascii_rows
+from settings import MINIMAP_FOG_COLOR, MINIMAP_SIZE, MINIMAP_REVEAL_RADIUS
+
+class TestMinimap(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.ground = rng.integers(0, 7, (300, 400)).astype(np.int8)
+        self.minimap = Minimap(MagicMock())
+        self.minimap.load("world_map", self.ground)
+
+    def pixels(self):
+        return pygame.surfarray.array3d(self.minimap.surface).transpose(1, 0, 2)
+
+    def test_starts_fogged_and_fits(self):
+        width, height = self.minimap.surface.get_size()
+        self.assertEqual(max(width, height), MINIMAP_SIZE)
+        self.assertTrue((self.pixels() == MINIMAP_FOG_COLOR).all())
+
+    def test_reveal_patches_like_a_full_repaint(self):
+        self.minimap.reveal(200, 150)
+        self.minimap.reveal(203, 150)
+        visited = self.minimap.visited["world_map"]
+        self.assertTrue(visited[150, 200 + MINIMAP_REVEAL_RADIUS])
+        self.assertFalse(visited[150, 203 + MINIMAP_REVEAL_RADIUS + 1])
+        patched = self.pixels()
+
+        self.minimap.load("world_map", self.ground)
+        self.assertTrue(np.array_equal(self.pixels(), patched))
+        self.assertTrue((patched != MINIMAP_FOG_COLOR).any(axis=2).any())
+
+    def test_visited_pixels_use_the_lookup_table(self):
+        small = np.array([[0, 2], [4, 6]], dtype=np.int8)
+        self.minimap.load("town_01", small)
+        self.minimap.reveal(0, 0)
+        pixels = self.pixels()
+        self.assertTrue(np.array_equal(pixels[0, 0], TILE_COLOURS[0]))
+        self.assertTrue(np.array_equal(pixels[-1, -1], TILE_COLOURS[6]))
+
+    def test_fog_round_trip(self):
+        self.minimap.reveal(10, 10)
+        data = self.minimap.to_dict()
+        self.assertEqual(list(data), ["world_map"])
+
+        loaded = Minimap(MagicMock())
+        loaded.load("world_map", self.ground)
+        loaded.from_dict(data)
+        self.assertTrue(np.array_equal(loaded.visited["world_map"], self.minimap.visited["world_map"]))
+        self.assertTrue(np.array_equal(pygame.surfarray.array3d(loaded.surface), pygame.surfarray.array3d(self.minimap.surface)))
+
+    def test_ascii_rows(self):
+        ground = np.array([[0, 2, 5], [4, 9, 3]], dtype=np.int8)
+        self.assertEqual(ascii_rows(ground, 0, 0, 3, 2, marker=(1, 1)), [".~#", "^PT"])
+
+if __name__ == '__main__':
+    unittest.main()
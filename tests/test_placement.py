@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from placement import Placement, walkable_mask
+
+def min_distance(points):
+    p = np.array(points, dtype=float)
+    d = np.sqrt(((p[:, None] - p[None, :]) ** 2).sum(-1))
+    d[np.diag_indices(len(p))] = np.inf
+    return d.min()
+
+class TestPlacement(unittest.TestCase):
+    def setUp(self):
+        self.collision = np.zeros((60, 80), dtype=np.int8)
+        self.collision[:, 30:35] = 1 # A wall down the middle
+        self.collision[40:, :] = 1
+
+    def test_points_are_free_and_spread(self):
+        points = Placement.from_collision(self.collision).scatter(np.random.default_rng(1), 40, spacing=4)
+        self.assertEqual(len(points), 40)
+        self.assertTrue(all(self.collision[y, x] == 0 for x, y in points))
+        self.assertGreaterEqual(min_distance(points), 4)
+
+    def test_fills_large_maps(self):
+        placement = Placement.from_collision(np.zeros((200, 200), dtype=np.int8))
+        points = placement.scatter(np.random.default_rng(2), 500, spacing=5)
+        self.assertEqual(len(points), 500)
+        self.assertGreaterEqual(min_distance(points), 5)
+
+    def test_margin_and_later_calls_keep_distance(self):
+        placement = Placement.from_collision(self.collision)
+        rng = np.random.default_rng(3)
+        first = placement.scatter(rng, 5, spacing=10, margin=8)
+        second = placement.scatter(rng, 30, spacing=3)
+        self.assertTrue(all(8 <= x < 72 and 8 <= y < 52 for x, y in first))
+        self.assertGreaterEqual(min_distance(first + second), 3)
+
+    def test_runs_out_instead_of_overlapping(self):
+        collision = np.ones((10, 10), dtype=np.int8)
+        collision[4:6, 4:6] = 0
+        points = Placement.from_collision(collision).scatter(np.random.default_rng(4), 10, spacing=2)
+        self.assertEqual(len(points), 1) # No two tiles of a 2x2 room are 2 apart
+
+    def test_deterministic_and_matches_is_blocked(self):
+        mask = walkable_mask(80, 60, lambda x, y: self.collision[y, x] == 1)
+        self.assertTrue(np.array_equal(mask, self.collision == 0))
+        a = Placement(mask).scatter(np.random.default_rng(5), 20)
+        b = Placement.from_collision(self.collision).scatter(np.random.default_rng(5), 20)
+        self.assertEqual(a, b)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import event_bus
+from event_bus import EventBus
+from quest import QuestManager
+
+QUESTS = [
+    {"quest_id": 1, "name": "Slime Slayer", "quest_type": "kill", "target": "slime", "goal": 2},
+    {"quest_id": 2, "name": "Bat Hunt", "quest_type": "kill", "target": ["bat", "vampire_bat"], "goal": 2},
+    {"quest_id": 3, "name": "Meet Mira", "quest_type": "talk", "target": "elder_mira"},
+    {"quest_id": 4, "name": "Omen", "quest_type": "flag", "target": "met_mira"},
+]
+
+class TestQuestEvents(unittest.TestCase):
+    def setUp(self):
+        self.game = MagicMock(spec=["data_manager", "event_bus"])
+        self.game.data_manager.get_data.return_value = QUESTS
+        self.game.event_bus = EventBus()
+        self.quests = QuestManager(self.game)
+
+    def test_quests_load_from_data(self):
+        self.assertEqual(sorted(self.quests.available_quests), [1, 2, 3, 4])
+        self.assertEqual(self.quests.available_quests[1].goal, 2)
+
+    def test_events_only_reach_indexed_quests(self):
+        self.quests.accept_quest(1)
+        self.quests.accept_quest(2)
+        self.game.event_bus.emit(event_bus.KILL, "king_slime") # Exact ids, no substring matching
+        self.game.event_bus.emit(event_bus.KILL, "slime")
+        self.game.event_bus.emit(event_bus.KILL, "vampire_bat")
+        self.assertEqual(self.quests.available_quests[1].progress, 1)
+        self.assertEqual(self.quests.available_quests[2].progress, 1)
+
+        self.game.event_bus.emit(event_bus.KILL, "slime")
+        self.assertTrue(self.quests.available_quests[1].completed)
+        self.assertNotIn((event_bus.KILL, "slime"), self.quests.objectives)
+
+    def test_talk_and_flag_quests(self):
+        self.quests.accept_quest(3)
+        self.quests.accept_quest(4)
+        self.game.event_bus.emit(event_bus.TALK, "elder_mira")
+        self.quests.set_flag("met_mira")
+        self.assertTrue(self.quests.available_quests[3].completed)
+        self.assertTrue(self.quests.available_quests[4].completed)
+
+    def test_loading_rebuilds_index(self):
+        self.quests.from_dict({"active": [{"id": 1, "progress": 1, "completed": False}], "completed": [3]})
+        self.game.event_bus.emit(event_bus.KILL, "slime")
+        self.assertTrue(self.quests.available_quests[1].completed)
+        self.assertEqual(self.quests.objectives, {})
+
+if __name__ == '__main__':
+    unittest.main()
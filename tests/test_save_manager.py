@@ -0,0 +1,185 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import tempfile
+import threading
+import time
+import numpy as np
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from save_manager import SaveManager, encode_payload, pack_section, pack_save, unpack_save
+from scene import TitleScene
+
+class TestSaveFormat(unittest.TestCase):
+    def test_round_trip(self):
+        hero = {"level": 3, "stats": {"strength": np.int16(7)}}
+        flags = {"flag_" + str(i): True for i in range(50)}
+        blob = pack_save([pack_section("hero", encode_payload(hero)), pack_section("flags", encode_payload(flags))])
+
+        sections = unpack_save(blob)
+        self.assertEqual(sections["hero"], {"level": 3, "stats": {"strength": 7}})
+        self.assertEqual(sections["flags"], flags)
+
+    def test_rejects_bad_data(self):
+        with self.assertRaises(ValueError):
+            unpack_save(b"JUNKJUNKJUNK")
+        blob = pack_save([pack_section("hero", encode_payload({"level": 1}))])
+        with self.assertRaises(ValueError):
+            unpack_save(blob[:-3])
+
+class TestIncrementalSave(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        game = MagicMock()
+        game.player.level = 4
+        game.current_map_id = "town_01"
+        game.playtime = 125.0
+        self.manager = SaveManager(game)
+        self.manager.save_dir = self.tmp.name
+        self.manager.filename = os.path.join(self.tmp.name, "save.dat")
+        self.manager.legacy_filename = os.path.join(self.tmp.name, "missing.json")
+        self.sections = {"hero": {"gold": 10}, "flags": {}}
+        self.manager.collect_sections = lambda: {tag: encode_payload(data) for tag, data in self.sections.items()}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_skips_unchanged_writes(self):
+        self.assertTrue(self.manager._write_sections(self.manager.collect_sections()))
+        self.assertFalse(self.manager._write_sections(self.manager.collect_sections()))
+        self.sections["hero"]["gold"] = 20
+        self.assertTrue(self.manager._write_sections(self.manager.collect_sections()))
+        self.assertEqual(self.manager.read_save()["hero"]["gold"], 20)
+
+    def test_background_autosave(self):
+        self.manager.autosave()
+        self.manager.wait()
+        self.assertEqual(self.manager.read_save(), {"hero": {"gold": 10}, "flags": {}})
+        self.assertFalse(os.path.exists(self.manager.filename + ".tmp"))
+
+    def test_manual_save_outlasts_inflight_autosave(self):
+        write = self.manager._write_sections
+        def slow_worker_write(*args):
+            if threading.current_thread().name == "autosave":
+                time.sleep(0.2) # The worker has taken the snapshot but not written it yet
+            return write(*args)
+        self.manager._write_sections = slow_worker_write
+        self.manager.autosave()
+        time.sleep(0.05)
+        self.sections["hero"]["gold"] = 99
+        self.assertTrue(self.manager.save_game())
+        self.manager.wait()
+        self.assertEqual(self.manager.read_save()["hero"]["gold"], 99)
+
+    def test_index_lists_slots(self):
+        self.manager.set_slot(2)
+        self.assertEqual(self.manager.filename, os.path.join(self.tmp.name, "save_slot2.dat"))
+        self.manager.autosave()
+        self.manager.wait()
+
+        slots = dict(self.manager.list_slots())
+        self.assertIsNone(slots[1])
+        self.assertEqual(slots[2]["level"], 4)
+        self.assertEqual(slots[2]["map_id"], "town_01")
+        self.assertEqual(slots[2]["playtime"], 125.0)
+        self.assertIsNone(self.manager.read_save(1))
+        self.assertEqual(self.manager.read_save(2)["hero"], {"gold": 10})
+
+    def test_async_load_reports_progress(self):
+        self.sections["world"] = {"map_id": "town_01", "x": 3.0, "y": 4.0, "playtime": 9}
+        self.sections["maps"] = {"town_01": {"recipe": {"generator": "town"}}}
+        self.manager._write_sections(self.manager.collect_sections())
+        game = self.manager.game
+        game.maps = {"town_01": {}}
+
+        self.assertTrue(asyncio.run(self.manager.load_game_async()))
+        self.assertEqual(self.manager.load_progress, 1.0)
+        self.assertFalse(self.manager.loading)
+        game.new.assert_called_once_with(generate_maps=False)
+        game.world_state.restore_map.assert_called_once_with("town_01", {"recipe": {"generator": "town"}})
+        game.start.assert_called_once_with("town_01", 3, 4)
+        game.player.from_dict.assert_called_once_with({"gold": 10})
+        self.assertEqual(game.playtime, 9)
+
+class TestTitleNewGame(unittest.TestCase):
+    def make_title(self, slots):
+        pygame.font.init()
+        manager = MagicMock()
+        manager.game.save_manager.list_slots.return_value = slots
+        manager.game.save_manager.load_thumbnail.return_value = None
+        return TitleScene(manager)
+
+    def press_space(self, title):
+        title.handle_input(pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE))
+
+    def test_occupied_slot_moves_to_a_free_one(self):
+        title = self.make_title([(1, {"level": 5}), (2, None), (3, None)])
+        game = title.manager.game
+        self.press_space(title)
+        game.change_scene.assert_not_called()
+        self.assertEqual(title.selected, 1)
+        self.assertIn("Slot 1 has a save", title.status)
+
+        self.press_space(title)
+        game.save_manager.set_slot.assert_called_once_with(2)
+        game.change_scene.assert_called_once_with("world")
+
+    def test_overwrite_needs_a_second_press(self):
+        title = self.make_title([(1, {"level": 5}), (2, {"level": 2})])
+        game = title.manager.game
+        self.press_space(title)
+        game.change_scene.assert_not_called()
+        self.assertIn("again to overwrite", title.status)
+
+        self.press_space(title)
+        game.save_manager.set_slot.assert_called_once_with(1)
+        game.change_scene.assert_called_once_with("world")
+
+class TestSectionTags(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        game = MagicMock()
+        game.player.x, game.player.y = 64, 96
+        game.player.level = 2
+        game.current_map_id = "world_map"
+        game.playtime = 10.0
+        game.maps = {"world_map": {"spawn": (2, 3)}}
+        game.player.to_dict.return_value = {"gold": 5}
+        game.quest_manager.to_dict.return_value = {}
+        game.quest_manager.flags.to_dict.return_value = {}
+        game.world_state.to_dict.return_value = {}
+        game.minimap.to_dict.return_value = {}
+        self.inventory = {"items": [{"id": "potion", "count": 3}]}
+        game.player.inventory.to_dict.return_value = self.inventory
+        self.manager = SaveManager(game)
+        self.manager.save_dir = self.tmp.name
+        self.manager.filename = os.path.join(self.tmp.name, "save.dat")
+        self.manager.legacy_filename = os.path.join(self.tmp.name, "missing.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tags_fit_the_header(self):
+        with self.assertRaises(ValueError):
+            pack_section("inventory", encode_payload({}))
+        for tag in self.manager.collect_sections():
+            self.assertLessEqual(len(tag.encode("utf-8")), 8)
+
+    def test_inventory_round_trip(self):
+        self.manager._write_sections(self.manager.collect_sections())
+        self.assertEqual(self.manager.read_save()["items"], self.inventory)
+        self.assertTrue(self.manager.load_game())
+        self.manager.game.player.inventory.from_dict.assert_called_with(self.inventory)
+
+    def test_missing_position_uses_spawn(self):
+        self.manager._write_sections({"hero": encode_payload({"gold": 5}), "maps": encode_payload({})})
+        self.assertTrue(self.manager.load_game())
+        self.manager.game.start.assert_called_with("world_map")
+
+if __name__ == '__main__':
+    unittest.main()
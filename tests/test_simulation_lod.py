@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from settings import TILESIZE, SIM_NEAR_INTERVAL
+from simulation_lod import SimulationLOD
+
+class Actor(pygame.sprite.Sprite):
+    def __init__(self, group, tile_x, tile_y):
+        super().__init__(group)
+        self.rect = pygame.Rect(tile_x * TILESIZE, tile_y * TILESIZE, TILESIZE, TILESIZE)
+        self.steps = []
+
+    def update(self, dt):
+        self.steps.append(dt)
+
+class TestSimulationLOD(unittest.TestCase):
+    def setUp(self):
+        self.sprites = pygame.sprite.Group()
+        self.camera = MagicMock()
+        self.camera.x = self.camera.y = 0 # View at the map's top-left
+        self.on_screen = Actor(self.sprites, 5, 5)
+        self.ring = Actor(self.sprites, 35, 5) # 800px screen is 25 tiles wide
+        self.far = Actor(self.sprites, 90, 90)
+
+    def run_frames(self, lod, frames):
+        for _ in range(frames):
+            lod.update(self.sprites, self.camera, 0.01)
+
+    def test_tiers_update_at_their_rate(self):
+        lod = SimulationLOD()
+        lod.configure(100, 100)
+        self.run_frames(lod, SIM_NEAR_INTERVAL * 3)
+        self.assertEqual(len(self.on_screen.steps), SIM_NEAR_INTERVAL * 3)
+        self.assertEqual(len(self.ring.steps), 3)
+        self.assertAlmostEqual(self.ring.steps[-1], 0.01 * SIM_NEAR_INTERVAL)
+        self.assertEqual(self.far.steps, [])
+        self.assertEqual(lod.frozen_count, 1)
+
+    def test_small_maps_simulate_everything(self):
+        lod = SimulationLOD()
+        lod.configure(30, 20)
+        self.run_frames(lod, 2)
+        self.assertEqual(len(self.far.steps), 2)
+
+    def test_map_overrides(self):
+        lod = SimulationLOD()
+        lod.configure(100, 100, {"near_margin": 100})
+        self.run_frames(lod, 1)
+        self.assertEqual(len(self.far.steps), 1)
+
+if __name__ == '__main__':
+    unittest.main()
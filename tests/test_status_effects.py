@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from components.combat import CombatComponent
+
+class TestModifiers(unittest.TestCase):
+    def setUp(self):
+        self.combat = CombatComponent(MagicMock(), hp=50, mp=10, stats=[5, 3, 4, 3])
+
+    def test_modifiers_stack_and_remove_by_source(self):
+        self.combat.add_modifier("ring", "strength", 2)
+        self.combat.add_modifier("ring", "strength", 3)
+        self.combat.add_modifier("rage", "strength", 0.5, multiplier=True)
+        self.assertEqual(self.combat.get_attribute("strength"), 15) # (5 + 5) * 1.5
+        self.combat.remove_modifiers("ring")
+        self.assertEqual(self.combat.get_attribute("strength"), 7)
+
+    def test_base_stat_changes_show_through(self):
+        self.combat.add_modifier("ring", "defense", 1)
+        self.assertEqual(self.combat.get_attribute("defense"), 4)
+        self.combat.stats[1] += 2 # Level up / power-up
+        self.combat.invalidate_stats()
+        self.assertEqual(self.combat.get_attribute("defense"), 6)
+
+class TestStatusEffects(unittest.TestCase):
+    def setUp(self):
+        self.combat = CombatComponent(MagicMock(), hp=50, mp=10, stats=[5, 3, 4, 3])
+
+    def test_status_ticks_per_turn_not_per_frame(self):
+        self.combat.apply_status_effect("dazed", 2)
+        for _ in range(120):
+            self.combat.update(1 / 60)
+        self.assertTrue(self.combat.has_status_effect("dazed"))
+        self.assertEqual(self.combat.get_attribute("agility"), 2)
+
+        self.assertEqual(self.combat.tick_status_effects(), [])
+        self.assertEqual(self.combat.tick_status_effects(), ["dazed"])
+        self.assertFalse(self.combat.has_status_effect("dazed"))
+        self.assertEqual(self.combat.get_attribute("agility"), 4)
+
+    def test_reapplying_refreshes(self):
+        self.combat.apply_status_effect("dazed", 1)
+        self.combat.apply_status_effect("dazed", 3)
+        self.assertEqual(self.combat.get_attribute("luck"), 1)
+        self.assertEqual(self.combat.status_effects["dazed"], 3)
+
+    def test_sleep_skips_turns(self):
+        self.assertTrue(self.combat.can_act())
+        self.combat.set_status_effects({"sleep": 2})
+        self.assertFalse(self.combat.can_act())
+        self.combat.set_status_effects({})
+        self.assertTrue(self.combat.can_act())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from world_generator import WorldGenerator
+from dungeon_generator import DungeonGenerator
+from world_state import WorldState, MapDelta
+
+class TestWorldState(unittest.TestCase):
+    def setUp(self):
+        self.game = MagicMock()
+        self.game.world_gen = WorldGenerator(seed=1)
+        self.game.dungeon_gen = DungeonGenerator()
+        self.game.maps = {}
+        self.state = WorldState(self.game)
+
+    def test_seeded_maps_rebuild_identically(self):
+        sector = self.game.world_gen.generate_sector("desert", 40, 40, seed=5)
+        dungeon = self.game.dungeon_gen.generate_dungeon(30, 30, 5, seed=9)
+        for original in (sector, dungeon):
+            rebuilt = WorldState(self.game).build_map(original["recipe"])
+            for layer in ("ground", "collision"):
+                self.assertTrue(np.array_equal(original["layers"][layer], rebuilt["layers"][layer]))
+
+    def test_delta_round_trip(self):
+        sector = self.game.world_gen.generate_sector("forest", 30, 30, seed=3)
+        self.game.maps[sector["id"]] = sector
+        self.state.record_cell(sector["id"], "ground", 4, 5, 6)
+        self.state.record_removed(sector["id"], 2)
+        self.state.record_object(sector["id"], 7, locked=False)
+
+        saved = self.state.to_dict()
+        self.assertNotIn("layers", saved[sector["id"]])
+
+        self.game.maps = {}
+        restored = WorldState(self.game)
+        restored.from_dict(saved)
+        self.assertEqual(self.game.maps[sector["id"]]["layers"]["ground"][5, 4], 6)
+        self.assertTrue(restored.is_removed(sector["id"], 2))
+        self.assertEqual(restored.delta(sector["id"]).objects[7], {"locked": False})
+
+    def test_empty_delta_is_not_saved(self):
+        sector = self.game.world_gen.generate_sector("snow", 20, 20, seed=4)
+        self.game.maps[sector["id"]] = sector
+        self.state.delta(sector["id"])
+        self.assertNotIn("delta", self.state.to_dict()[sector["id"]])
+        self.assertTrue(MapDelta().is_empty())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@ from data_manager import DataManager
 
 class MockSpell:
     def __init__(self, name, type, hits, power):
+        self.spell_id = name.lower().replace(" ", "_")
         self.name = name
         self.type = type
         self.hits = hits
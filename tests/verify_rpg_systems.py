@@ -1,5 +1,6 @@
 import sys
 import os
+import json
 import pygame
 
 # Add src to path
@@ -26,13 +27,20 @@ class MockResourceManager:
     def load_image(self, name):
         return pygame.Surface((32, 32))
 
+    def get_sprite(self, asset_id):
+        return pygame.Surface((32, 32))
+
 class MockLogger:
     def debug(self, msg): pass
     def error(self, msg): print(f"ERROR: {msg}")
     def warning(self, msg): print(f"WARNING: {msg}")
 
 class MockDataManager:
-    def get_data(self, key): return {}
+    def get_data(self, key):
+        if key == "quests":
+            with open(os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'quests.json')) as f:
+                return json.load(f)
+        return {}
 
 def test_spells():
     print("Testing Spells...")
@@ -59,7 +67,7 @@ def test_quest_logic():
     
     # Test Find Quest
     player = Player(game, 0, 0)
-    player.inventory_items = {"potion": 0}
+    player.inventory.items = []
     
     quest = qm.available_quests[3] # Potion Master
     qm.accept_quest(3)
@@ -67,7 +75,8 @@ def test_quest_logic():
     assert not quest.completed
     
     # Give items
-    player.inventory_items["potion"] = 3
+    from inventory import create_item
+    player.inventory.items = [create_item("potion") for _ in range(3)]
     qm.check_quests(player)
     
     assert quest.completed